@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+"""Load generation helpers for benchmarking a MASH server."""
+
+# Copyright (c) 2026 SUSE LLC. All rights reserved.
+#
+# This file is part of mash_client. mash_client provides a command line
+# utility for interfacing with a MASH server.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import math
+import time
+
+from collections import Counter
+
+from mash_client.cli_utils import map_concurrently
+
+
+def percentile(values, pct):
+    """
+    Return the nearest-rank percentile of a sorted list of values.
+    """
+    if not values:
+        return 0.0
+
+    rank = max(int(math.ceil(pct / 100.0 * len(values))), 1)
+    return values[rank - 1]
+
+
+def run_scenario(request, count, concurrency=1, rate=None):
+    """
+    Call request(index) count times and time each call.
+
+    Requests are run with map_concurrently on a pool of concurrency
+    threads. If rate is provided requests are started at that many
+    requests per second instead of as fast as the pool allows.
+
+    Returns a list of (latency, error) tuples and the total elapsed time.
+    """
+    start = time.perf_counter()
+
+    def timed_request(index):
+        request_start = time.perf_counter()
+        error = None
+
+        try:
+            request(index)
+        except Exception as exc:
+            error = type(exc).__name__
+        except SystemExit:
+            error = 'SystemExit'
+
+        return time.perf_counter() - request_start, error
+
+    results = map_concurrently(timed_request, range(count), concurrency, rate)
+    return [result for result, error in results], \
+        time.perf_counter() - start
+
+
+def summarize_results(scenario, results, elapsed, concurrency, rate=None):
+    """
+    Build a summary dictionary for benchmark results.
+
+    Latencies are reported in milliseconds.
+    """
+    latencies = sorted(latency for latency, error in results)
+    errors = Counter(error for latency, error in results if error)
+    total = len(results)
+    error_count = sum(errors.values())
+
+    def ms(value):
+        return round(value * 1000, 3)
+
+    return {
+        'scenario': scenario,
+        'requests': total,
+        'concurrency': concurrency,
+        'target_rate': rate,
+        'elapsed': round(elapsed, 3),
+        'throughput': round(total / elapsed, 3) if elapsed else 0.0,
+        'errors': error_count,
+        'error_rate': round(error_count / total, 4) if total else 0.0,
+        'error_types': dict(errors),
+        'latency_ms': {
+            'min': ms(latencies[0]) if latencies else 0.0,
+            'mean': ms(sum(latencies) / total) if total else 0.0,
+            'p50': ms(percentile(latencies, 50)),
+            'p90': ms(percentile(latencies, 90)),
+            'p99': ms(percentile(latencies, 99)),
+            'max': ms(latencies[-1]) if latencies else 0.0
+        }
+    }
+
+
+def format_summary(summary):
+    """
+    Format a benchmark summary as human readable text.
+    """
+    latency = summary['latency_ms']
+    lines = [
+        'Scenario:    {scenario}'.format(**summary),
+        'Requests:    {requests} (concurrency {concurrency})'.format(
+            **summary
+        ),
+        'Elapsed:     {elapsed:.3f} s'.format(**summary),
+        'Throughput:  {throughput:.2f} req/s'.format(**summary),
+        'Errors:      {errors} ({percent:.2f}%)'.format(
+            percent=summary['error_rate'] * 100,
+            **summary
+        )
+    ]
+
+    if summary['target_rate']:
+        lines.insert(2, 'Target rate: {target_rate} req/s'.format(**summary))
+
+    for error_type, count in sorted(summary['error_types'].items()):
+        lines.append('  {0}: {1}'.format(error_type, count))
+
+    lines.append(
+        'Latency ms:  p50={p50} p90={p90} p99={p99} max={max}'.format(
+            **latency
+        )
+    )
+    return '\n'.join(lines)
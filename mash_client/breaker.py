@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+"""Circuit breaker to fail fast while a MASH server is unavailable."""
+
+# Copyright (c) 2026 SUSE LLC. All rights reserved.
+#
+# This file is part of mash_client. mash_client provides a command line
+# utility for interfacing with a MASH server.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import glob
+import os
+import time
+
+from contextlib import suppress
+
+from mash_client.mash_client_exceptions import MashCircuitOpenException
+from mash_client.ratelimit import get_state_file, locked_state
+
+default_threshold = 5
+default_cooldown = 30.0
+
+
+class CircuitBreaker(object):
+    """
+    Per server circuit breaker.
+
+    After threshold consecutive failures the circuit opens and
+    requests fail immediately for cooldown seconds. After the cooldown
+    a single request is let through as a probe (half-open). If it
+    succeeds the circuit closes, otherwise it opens again.
+
+    The state is kept in a state file so consecutive invocations of
+    the client share it. Failures older than the cooldown are not
+    counted as consecutive, state files which have not changed for the
+    cooldown are removed.
+    """
+
+    def __init__(
+        self, state_file, url, threshold=default_threshold,
+        cooldown=default_cooldown
+    ):
+        self.state_file = state_file
+        self.url = url
+        self.threshold = threshold
+        self.cooldown = cooldown
+
+    def before_request(self):
+        """
+        Raise an exception if the circuit is open.
+        """
+        if not self.threshold or not os.path.exists(self.state_file):
+            return
+
+        with locked_state(self.state_file) as state:
+            if state.get('failures', 0) < self.threshold:
+                return
+
+            now = time.time()
+            wait = state.get('open_until', 0) - now
+
+            if wait > 0:
+                raise MashCircuitOpenException(
+                    'MASH server at {url} is unavailable after {failures} '
+                    'consecutive failures. Requests are blocked for '
+                    '{wait:.0f} more seconds.'.format(
+                        url=self.url,
+                        failures=state['failures'],
+                        wait=wait
+                    )
+                )
+
+            # Half-open, keep other requests blocked while probing
+            state['open_until'] = now + self.cooldown
+
+    def record_success(self):
+        """
+        Close the circuit.
+        """
+        try:
+            os.remove(self.state_file)
+        except FileNotFoundError:
+            pass
+
+    def remove_stale(self):
+        """
+        Remove the breaker state files not changed for the cooldown.
+
+        Their failures are no longer consecutive and their circuit is
+        no longer open. Such files are left behind by servers which are
+        not used anymore.
+        """
+        now = time.time()
+        pattern = os.path.join(
+            os.path.dirname(self.state_file),
+            'breaker_*.json'
+        )
+
+        for state_file in glob.glob(pattern):
+            with suppress(OSError):
+                if now - os.path.getmtime(state_file) > self.cooldown:
+                    os.remove(state_file)
+
+    def record_failure(self):
+        """
+        Count a failure and open the circuit at the threshold.
+        """
+        if not self.threshold:
+            return
+
+        self.remove_stale()
+
+        with locked_state(self.state_file) as state:
+            now = time.time()
+
+            if now - state.get('updated', now) > self.cooldown and \
+                    state.get('failures', 0) < self.threshold:
+                state['failures'] = 0
+
+            state['failures'] = state.get('failures', 0) + 1
+            state['updated'] = now
+
+            if state['failures'] >= self.threshold:
+                state['open_until'] = now + self.cooldown
+
+
+def get_circuit_breaker(config_data):
+    """
+    Return the circuit breaker for the server in config.
+
+    The profile sets the number of consecutive failures with
+    breaker_threshold (0 disables the breaker) and the seconds the
+    circuit stays open with breaker_cooldown.
+    """
+    return CircuitBreaker(
+        get_state_file(config_data, 'breaker'),
+        config_data['url'],
+        int(config_data.get('breaker_threshold', default_threshold)),
+        float(config_data.get('breaker_cooldown', default_cooldown))
+    )
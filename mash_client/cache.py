@@ -0,0 +1,328 @@
+# -*- coding: utf-8 -*-
+
+"""On-disk cache for GET responses of the MASH server."""
+
+# Copyright (c) 2026 SUSE LLC. All rights reserved.
+#
+# This file is part of mash_client. mash_client provides a command line
+# utility for interfacing with a MASH server.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import glob
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+import jwt
+
+from mash_client.paths import default_config_dir
+
+default_cache_size = 0  # megabytes, disabled unless set in the profile
+
+
+def get_header(response, name):
+    """
+    Return the value of a response header or None.
+    """
+    value = response.headers.get(name)
+    return value if isinstance(value, str) else None
+
+
+def parse_cache_control(value):
+    """
+    Return the directives of a Cache-Control header as a dictionary.
+    """
+    directives = {}
+
+    for directive in (value or '').split(','):
+        name, _, argument = directive.strip().partition('=')
+
+        if name:
+            directives[name.lower()] = argument.strip('"') or None
+
+    return directives
+
+
+def get_expiry(response, now):
+    """
+    Return the time until which response is fresh.
+
+    Returns None if the response must not be stored and 0 if it has
+    to be revalidated before it is used.
+    """
+    directives = parse_cache_control(get_header(response, 'Cache-Control'))
+
+    if 'no-store' in directives:
+        return None
+
+    if 'no-cache' in directives:
+        return 0
+
+    if 'max-age' in directives:
+        try:
+            max_age = int(directives['max-age'])
+            age = int(get_header(response, 'Age') or 0)
+        except (TypeError, ValueError):
+            return 0
+
+        return now + max_age - age
+
+    expires = get_header(response, 'Expires')
+
+    if expires:
+        try:
+            return parsedate_to_datetime(expires).timestamp()
+        except (TypeError, ValueError):
+            return 0
+
+    return 0
+
+
+def get_identity(token):
+    """
+    Return the user identity a request is authenticated as.
+
+    The identity claim is used so entries stay valid when the access
+    token is refreshed.
+    """
+    if not token:
+        return ''
+
+    try:
+        claims = jwt.decode(token, options={'verify_signature': False})
+    except jwt.PyJWTError:
+        claims = {}
+
+    identity = claims.get('identity') or claims.get('sub')
+
+    if identity:
+        return str(identity)
+
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def get_body_hash(body):
+    """
+    Return the hash of the serialized body of a GET request.
+
+    Requests with different query data, such as the page of a job list,
+    are cached separately.
+    """
+    if not body:
+        return ''
+
+    return hashlib.sha256(
+        json.dumps(body, sort_keys=True).encode()
+    ).hexdigest()
+
+
+def get_path_hash(endpoint):
+    """
+    Return the hash of the endpoint path used to find its entries.
+    """
+    path = urlparse(endpoint).path.rstrip('/')
+    return hashlib.sha256(path.encode()).hexdigest()[:16]
+
+
+class ResponseCache(object):
+    """
+    Cache of JSON responses to GET requests.
+
+    Entries are stored in one file per URL, request body and identity.
+    A response is stored if the server allows it with Cache-Control or
+    Expires, or if it has an ETag to revalidate it with. Fresh entries
+    are used without a request, stale entries are revalidated with
+    If-None-Match.
+
+    The cache is limited to max_size bytes, the least recently used
+    entries are removed first. Entries of an endpoint and of its
+    parent collection are removed when a request changes it.
+    """
+
+    def __init__(self, cache_dir, url, max_size):
+        self.cache_dir = cache_dir
+        self.url = url
+        self.max_size = max_size
+
+    def get_entry_file(self, endpoint, token, body=None):
+        key = hashlib.sha256(
+            '{0}\n{1}{2}\n{3}'.format(
+                get_identity(token),
+                self.url,
+                endpoint,
+                get_body_hash(body)
+            ).encode()
+        ).hexdigest()[:32]
+
+        return os.path.join(
+            self.cache_dir,
+            '{0}_{1}.json'.format(get_path_hash(endpoint), key)
+        )
+
+    def lookup(self, endpoint, token, body=None):
+        """
+        Return the cached entry for the endpoint or None.
+        """
+        entry_file = self.get_entry_file(endpoint, token, body)
+
+        try:
+            with open(entry_file) as cache_file:
+                entry = json.load(cache_file)
+
+            # Keep track of the last use for the LRU eviction
+            os.utime(entry_file)
+        except (OSError, ValueError):
+            return None
+
+        return entry
+
+    def is_fresh(self, entry):
+        return entry['expires'] > time.time()
+
+    def store(self, endpoint, token, response, result, body=None):
+        """
+        Store the result of a successful response if it is cacheable.
+        """
+        now = time.time()
+        expires = get_expiry(response, now)
+        etag = get_header(response, 'ETag')
+
+        if expires is None or (expires <= now and not etag):
+            self.remove(endpoint, token, body)
+            return
+
+        self.write(
+            self.get_entry_file(endpoint, token, body),
+            {
+                'endpoint': endpoint,
+                'etag': etag,
+                'expires': expires,
+                'result': result
+            }
+        )
+        self.evict()
+
+    def revalidated(self, endpoint, token, entry, response, body=None):
+        """
+        Update the expiry of an entry after a 304 response.
+        """
+        expires = get_expiry(response, time.time())
+
+        if expires is None:
+            self.remove(endpoint, token, body)
+            return
+
+        entry['expires'] = expires
+        self.write(self.get_entry_file(endpoint, token, body), entry)
+
+    def write(self, entry_file, entry):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp_file = tempfile.NamedTemporaryFile(
+            'w',
+            dir=self.cache_dir,
+            suffix='.tmp',
+            delete=False
+        )
+
+        with temp_file:
+            json.dump(entry, temp_file)
+
+        os.replace(temp_file.name, entry_file)
+
+    def remove(self, endpoint, token, body=None):
+        try:
+            os.remove(self.get_entry_file(endpoint, token, body))
+        except FileNotFoundError:
+            pass
+
+    def invalidate(self, endpoint):
+        """
+        Remove the entries of endpoint and its parent collection.
+
+        Entries of every identity are removed.
+        """
+        path = urlparse(endpoint).path.rstrip('/')
+
+        for invalid_path in {path, path.rsplit('/', 1)[0]}:
+            pattern = os.path.join(
+                self.cache_dir,
+                '{0}_*.json'.format(get_path_hash(invalid_path))
+            )
+
+            for entry_file in glob.glob(pattern):
+                try:
+                    os.remove(entry_file)
+                except FileNotFoundError:
+                    pass
+
+    def evict(self):
+        """
+        Remove the least recently used entries above the size limit.
+        """
+        entries = []
+
+        for entry_file in glob.glob(os.path.join(self.cache_dir, '*.json')):
+            try:
+                stat = os.stat(entry_file)
+            except FileNotFoundError:
+                continue
+
+            entries.append((stat.st_mtime, stat.st_size, entry_file))
+
+        size = sum(entry[1] for entry in entries)
+
+        for mtime, entry_size, entry_file in sorted(entries):
+            if size <= self.max_size:
+                break
+
+            try:
+                os.remove(entry_file)
+            except FileNotFoundError:
+                pass
+
+            size -= entry_size
+
+
+def get_response_cache(config_data):
+    """
+    Return the response cache for the config profile or None.
+
+    The profile sets the cache directory with cache_dir and the size
+    limit in megabytes with cache_size. The cache is disabled unless
+    cache_size is set.
+    """
+    max_size = float(config_data.get('cache_size', default_cache_size))
+
+    if max_size <= 0:
+        return None
+
+    cache_dir = config_data.get('cache_dir') or os.path.join(
+        config_data.get('config_dir') or default_config_dir,
+        'cache'
+    )
+
+    return ResponseCache(
+        os.path.join(
+            os.path.expanduser(cache_dir),
+            config_data.get('profile') or 'default'
+        ),
+        config_data['url'],
+        int(max_size * 1024 * 1024)
+    )
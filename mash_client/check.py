@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+
+"""Nagios style checks of many jobs."""
+
+# Copyright (c) 2026 SUSE LLC. All rights reserved.
+#
+# This file is part of mash_client. mash_client provides a command line
+# utility for interfacing with a MASH server.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import time
+
+from collections import Counter, defaultdict
+
+from mash_client.cli_utils import map_concurrently
+from mash_client.controller import (
+    get_job,
+    get_job_start_time,
+    iter_user_jobs,
+    match_job,
+    parse_job_test_results
+)
+from mash_client.timeline import services
+
+# Plugin exit codes
+OK = 0
+WARNING = 1
+CRITICAL = 2
+UNKNOWN = 3
+
+status_names = {
+    OK: 'OK',
+    WARNING: 'WARNING',
+    CRITICAL: 'CRITICAL',
+    UNKNOWN: 'UNKNOWN'
+}
+
+# Test summary counters reported as perfdata
+test_counters = (
+    ('tests', 'num_tests'),
+    ('pass', 'passed'),
+    ('skip', 'skipped'),
+    ('fail', 'failed'),
+    ('error', 'error')
+)
+
+
+def select_jobs(
+    config_data, clouds=None, pattern=None, since=None, last=None,
+    per_page=None
+):
+    """
+    Return the jobs of the job list matching the selection.
+
+    since is a number of seconds and last the number of most recently
+    started jobs to select per cloud.
+    """
+    now = time.time()
+    jobs = []
+
+    for job in iter_user_jobs(config_data, per_page=per_page):
+        if not match_job(job, clouds=clouds, pattern=pattern):
+            continue
+
+        if since is not None:
+            start_time = get_job_start_time(job)
+
+            if start_time is None or now - start_time > since:
+                continue
+
+        jobs.append(job)
+
+    if last:
+        by_cloud = defaultdict(list)
+
+        for job in jobs:
+            by_cloud[job.get('cloud')].append(job)
+
+        jobs = []
+        for cloud_jobs in by_cloud.values():
+            cloud_jobs.sort(
+                key=lambda job: get_job_start_time(job) or 0,
+                reverse=True
+            )
+            jobs.extend(cloud_jobs[:last])
+
+    return jobs
+
+
+def evaluate_job(job, test_results=None):
+    """
+    Return the check result of a job.
+
+    A failed job or a finished job with failed tests fails the check.
+    A finished job whose pipeline ends before the test service passes,
+    other finished jobs without test results are unknown.
+    """
+    result = {
+        'job_id': job.get('job_id'),
+        'cloud': job.get('cloud'),
+        'state': job.get('state')
+    }
+
+    if job.get('state') == 'failed':
+        result['status'] = 'failing'
+        result['reason'] = 'failed in {0}'.format(
+            job.get('failed_service') or 'unknown service'
+        )
+    elif job.get('state') != 'finished':
+        result['status'] = 'pending'
+    elif job.get('last_service') in services and \
+            services.index(job['last_service']) < services.index('test'):
+        result['status'] = 'passing'
+        result['reason'] = 'no test service'
+    elif not test_results or 'summary' not in test_results:
+        result['status'] = 'unknown'
+        result['reason'] = (test_results or {}).get(
+            'msg', 'The job has no test results.'
+        )
+    else:
+        summary = test_results['summary']
+        result['summary'] = summary
+
+        if summary.get('failed') or summary.get('error'):
+            result['status'] = 'failing'
+            result['reason'] = 'tests failed'
+        else:
+            result['status'] = 'passing'
+
+    return result
+
+
+def check_jobs(config_data, jobs, concurrency=8, fetch_all=False):
+    """
+    Return the check results of jobs.
+
+    Finished jobs are requested concurrently for their test results.
+    With fetch_all every job is requested, for jobs given only by job
+    id.
+    """
+    def fetch(job):
+        if fetch_all or job.get('state') == 'finished':
+            job = get_job(config_data, job['job_id'])
+
+        test_results = None
+        if job.get('state') == 'finished':
+            test_results = parse_job_test_results(job)
+
+        return evaluate_job(job, test_results)
+
+    results = []
+    for job, (result, error) in zip(
+        jobs,
+        map_concurrently(fetch, jobs, concurrency)
+    ):
+        if error:
+            result = {
+                'job_id': job['job_id'],
+                'status': 'unknown',
+                'reason': str(error)
+            }
+
+        results.append(result)
+
+    return results
+
+
+def get_check_status(results, warning=1, critical=1):
+    """
+    Return the plugin status code of the check results.
+
+    The status is critical or warning if the number of failing jobs
+    reaches the threshold. Jobs with unknown results are a warning.
+    Without any jobs the status is unknown.
+    """
+    counts = Counter(result['status'] for result in results)
+
+    if not results:
+        return UNKNOWN
+
+    if critical and counts['failing'] >= critical:
+        return CRITICAL
+
+    if (warning and counts['failing'] >= warning) or counts['unknown']:
+        return WARNING
+
+    return OK
+
+
+def format_check(results, status, warning=1, critical=1, verbose=False):
+    """
+    Return the plugin output of the check results.
+
+    The first line is the status with the perfdata, with verbose
+    failing and unknown jobs follow one per line.
+    """
+    counts = Counter(result['status'] for result in results)
+    tests = Counter()
+
+    for result in results:
+        for label, key in test_counters:
+            tests[label] += int(result.get('summary', {}).get(key, 0))
+
+    if results:
+        text = '{0} jobs, {1} failing, {2} unknown, {3} pending'.format(
+            len(results),
+            counts['failing'],
+            counts['unknown'],
+            counts['pending']
+        )
+    else:
+        text = 'No jobs selected'
+
+    # Plugin thresholds alert above the value, the options at the value
+    perfdata = [
+        'jobs={0};;;0'.format(len(results)),
+        'failing={0};{1};{2};0'.format(
+            counts['failing'],
+            warning - 1 if warning else '',
+            critical - 1 if critical else ''
+        ),
+        'unknown={0};;;0'.format(counts['unknown']),
+        'pending={0};;;0'.format(counts['pending'])
+    ]
+    perfdata += [
+        '{0}={1};;;0'.format(label, tests[label])
+        for label, key in test_counters
+    ]
+
+    lines = [
+        'MASH JOBS {0} - {1}|{2}'.format(
+            status_names[status],
+            text,
+            ' '.join(perfdata)
+        )
+    ]
+
+    if verbose:
+        lines += [
+            '{0} {1} ({2}): {3}'.format(
+                result['status'],
+                result['job_id'],
+                result.get('cloud') or 'unknown cloud',
+                result.get('reason')
+            )
+            for result in results
+            if result['status'] in ('failing', 'unknown')
+        ]
+
+    return '\n'.join(lines)
@@ -21,13 +21,18 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import click
+import importlib
 import logging
+import sys
+import time
 
-from mash_client.cli.auth import auth
-from mash_client.cli.user import user
-from mash_client.cli.account import account
-from mash_client.cli.job import job
-from mash_client.cli.config import config
+from mash_client.completion import complete_option, list_profiles
+from mash_client.cli_utils import (
+    capture_thread_output,
+    echo_style,
+    invoke_command,
+    map_concurrently
+)
 
 
 def print_license(ctx, param, value):
@@ -37,7 +42,101 @@ def print_license(ctx, param, value):
     ctx.exit()
 
 
-@click.group()
+# The modules of the subcommands, named like the command they define
+subcommands = {
+    'account': 'mash_client.cli.account',
+    'auth': 'mash_client.cli.auth',
+    'batch': 'mash_client.cli.batch',
+    'bench': 'mash_client.cli.bench',
+    'check': 'mash_client.cli.check',
+    'config': 'mash_client.cli.config',
+    'doctor': 'mash_client.cli.doctor',
+    'exporter': 'mash_client.cli.exporter',
+    'job': 'mash_client.cli.job',
+    'spool': 'mash_client.cli.spool',
+    'user': 'mash_client.cli.user'
+}
+
+
+class MashGroup(click.Group):
+    """
+    Main command group which keeps the raw arguments.
+
+    The arguments are required to re-run the command for each
+    profile when using --profiles or --all-profiles. The options
+    before the subcommand are applied to each command of a batch.
+
+    Subcommands are imported when they are first used so a command
+    only loads the modules it needs.
+    """
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(subcommands))
+
+    def get_command(self, ctx, name):
+        if name in subcommands and name not in self.commands:
+            module = importlib.import_module(subcommands[name])
+            self.add_command(getattr(module, name))
+
+        return super().get_command(ctx, name)
+
+    def parse_args(self, ctx, args):
+        ctx.meta['mash_args'] = list(args)
+        rest = super().parse_args(ctx, args)
+        ctx.meta['mash_global_args'] = ctx.meta['mash_args'][
+            :len(ctx.meta['mash_args']) - len(rest) - 1
+        ]
+        return rest
+
+
+def strip_profiles_args(args):
+    """
+    Remove the --profiles and --all-profiles options from arguments.
+    """
+    stripped = []
+    args = iter(args)
+
+    for arg in args:
+        if arg == '--profiles':
+            next(args, None)
+        elif arg.startswith('--profiles=') or arg == '--all-profiles':
+            continue
+        else:
+            stripped.append(arg)
+
+    return stripped
+
+
+def run_profiles(profiles, args):
+    """
+    Run the command for each profile concurrently.
+
+    Output lines are labelled with the profile name and the highest
+    exit code of all profiles is returned.
+    """
+    def run(profile):
+        return invoke_command(main, ['--profile', profile] + args, obj={})
+
+    with capture_thread_output():
+        results = map_concurrently(run, profiles, len(profiles))
+
+    failed = []
+    for profile, (result, error) in zip(profiles, results):
+        exit_code, output = result
+
+        for line in output.splitlines():
+            click.echo('[{profile}] {line}'.format(profile=profile, line=line))
+
+        if exit_code:
+            failed.append('{0} ({1})'.format(profile, exit_code))
+
+    if failed:
+        click.echo('Failed profiles: {0}'.format(', '.join(failed)), err=True)
+
+    return max(result[0] for result, error in results)
+
+
+@click.group(cls=MashGroup)
 @click.version_option()
 @click.option(
     '--license',
@@ -56,10 +155,21 @@ def print_license(ctx, param, value):
 )
 @click.option(
     '--profile',
+    shell_complete=complete_option,
     help='The configuration profile to use. Expected to match '
          'a config file in config directory. Example: production, '
          'for ~/.config/mash_client/production.yaml'
 )
+@click.option(
+    '--profiles',
+    help='Comma separated list of profiles. The command is run against '
+         'each profile concurrently and output is labelled by profile.'
+)
+@click.option(
+    '--all-profiles',
+    is_flag=True,
+    help='Run the command against every profile in the config directory.'
+)
 @click.option(
     '--no-color',
     is_flag=True,
@@ -76,6 +186,17 @@ def print_license(ctx, param, value):
     '--port',
     help='The port number the MASH server is listening on.'
 )
+@click.option(
+    '--deadline',
+    type=click.FloatRange(min=0, min_open=True),
+    help='Maximum time in seconds for the command. Shared by all '
+         'requests of the command including retries and pagination.'
+)
+@click.option(
+    '--no-cache',
+    is_flag=True,
+    help='Do not use cached responses and do not cache new responses.'
+)
 @click.option(
     '--debug',
     'log_level',
@@ -96,13 +217,42 @@ def print_license(ctx, param, value):
     help='Disable console output.'
 )
 @click.pass_context
-def main(context, config_dir, profile, no_color, host, port, log_level):
+def main(
+    context, config_dir, profile, profiles, all_profiles, no_color, host,
+    port, deadline, no_cache, log_level
+):
     """
     The command line interface allows you to interact with a MASH server.
 
     It provides commands to submit jobs to the MASH server pipeline or
     add/delete a user account.
     """
+    if profiles or all_profiles:
+        if profile:
+            echo_style(
+                'The --profile option cannot be used with --profiles '
+                'or --all-profiles.',
+                no_color,
+                fg='red'
+            )
+            sys.exit(1)
+
+        if all_profiles:
+            profiles = list_profiles(config_dir)
+        else:
+            profiles = [name for name in profiles.split(',') if name]
+
+        if not profiles:
+            echo_style('No profiles found.', no_color, fg='red')
+            sys.exit(1)
+
+        context.exit(
+            run_profiles(
+                profiles,
+                strip_profiles_args(context.meta['mash_args'])
+            )
+        )
+
     if context.obj is None:
         context.obj = {}
 
@@ -112,10 +262,5 @@ def main(context, config_dir, profile, no_color, host, port, log_level):
     context.obj['host'] = host
     context.obj['port'] = port
     context.obj['log_level'] = log_level
-
-
-main.add_command(job)
-main.add_command(account)
-main.add_command(auth)
-main.add_command(user)
-main.add_command(config)
+    context.obj['deadline'] = time.time() + deadline if deadline else None
+    context.obj['no_cache'] = no_cache
@@ -22,11 +22,8 @@
 
 import click
 
-from mash_client.cli.account.azure import azure
-from mash_client.cli.account.ec2 import ec2
-from mash_client.cli.account.gce import gce
-from mash_client.cli.account.oci import oci
-from mash_client.cli.account.aliyun import aliyun
+from mash_client.cli.account.cloud import make_account_group
+from mash_client.clouds import clouds
 
 
 @click.group()
@@ -36,8 +33,5 @@ def account():
     """
 
 
-account.add_command(azure)
-account.add_command(ec2)
-account.add_command(gce)
-account.add_command(oci)
-account.add_command(aliyun)
+for cloud_name, cloud in clouds.items():
+    account.add_command(make_account_group(cloud_name, cloud))
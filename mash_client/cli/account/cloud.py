@@ -0,0 +1,298 @@
+# -*- coding: utf-8 -*-
+
+"""mash client CLI cloud account endpoints using click library."""
+
+# Copyright (c) 2026 SUSE LLC. All rights reserved.
+#
+# This file is part of mash_client. mash_client provides a command line
+# utility for interfacing with a MASH server.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import click
+import json
+import sys
+
+from mash_client.clouds import get_field_name
+from mash_client.completion import complete_option
+from mash_client.cli_utils import (
+    get_config,
+    handle_errors,
+    handle_request_with_token,
+    abort_if_false,
+    echo_dict,
+    echo_style,
+    additional_regions_repl,
+    test_regions_repl
+)
+
+repls = {
+    'additional_regions': additional_regions_repl,
+    'test_regions': test_regions_repl
+}
+
+
+def field_option(field, update=False):
+    """
+    Return the click option decorator for an account field.
+    """
+    kwargs = {'help': field['help']}
+
+    if field.get('flag') or field.get('repl'):
+        kwargs['is_flag'] = True
+    elif field.get('load'):
+        kwargs['type'] = click.Path(exists=True)
+    elif field.get('choices'):
+        kwargs['type'] = click.Choice(field['choices'])
+    else:
+        kwargs['type'] = click.STRING
+
+    if field.get('required') and not update:
+        kwargs['required'] = True
+
+    return click.option(field['option'], **kwargs)
+
+
+def load_field(field, value):
+    """
+    Return the request value of an account field option.
+    """
+    if field.get('repl'):
+        return repls[field['repl']]()
+    elif field.get('flag'):
+        return True
+    elif field.get('load'):
+        with open(value) as field_file:
+            if field['load'] == 'json':
+                return json.load(field_file)
+
+            return field_file.read()
+
+    return value
+
+
+def get_account_data(cloud, values, no_color, update=False):
+    """
+    Return the account request data from the command values.
+
+    On update only the provided values are sent and empty region
+    lists are left out. Missing credentials are reported before any
+    interactive prompt is started.
+    """
+    data = {}
+    credentials = {}
+    provided = [
+        field for field in cloud['account_fields']
+        if field.get('credential') and values[get_field_name(field)]
+    ]
+
+    if provided and len(provided) < len(cloud['credentials']):
+        echo_style(
+            'Both {0} are required when updating '
+            'credentials.'.format(' and '.join(cloud['credentials'])),
+            no_color,
+            fg='red'
+        )
+        sys.exit(1)
+
+    for field in cloud['account_fields']:
+        if update and field.get('add_only'):
+            continue
+
+        value = values[get_field_name(field)]
+
+        if not value:
+            continue
+
+        value = load_field(field, value)
+
+        if update and not value:
+            continue
+
+        if field.get('credential'):
+            credentials[get_field_name(field)] = value
+        else:
+            data[field.get('key', get_field_name(field))] = value
+
+    if credentials:
+        data['credentials'] = credentials
+
+    return data
+
+
+def make_account_group(cloud_name, cloud):
+    """
+    Return the account command group of a cloud from its registry entry.
+    """
+    display_name = cloud['display_name']
+    endpoint = '/v1/accounts/{0}/'.format(cloud_name)
+
+    @click.group(
+        name=cloud_name,
+        context_settings=dict(token_normalize_func=str.lower),
+        help='Handle mash {0} account requests.'.format(display_name)
+    )
+    def group():
+        pass
+
+    @click.command(
+        help='Add a new {0} account in the user name space on the '
+             'MASH server.'.format(display_name)
+    )
+    @click.option(
+        '--name',
+        type=click.STRING,
+        required=True,
+        help='Name for the account to add.'
+    )
+    @click.pass_context
+    def add(context, name, **values):
+        config_data = get_config(context.obj)
+
+        with handle_errors(config_data['log_level'], config_data['no_color']):
+            data = get_account_data(
+                cloud,
+                values,
+                config_data['no_color']
+            )
+            data['account_name'] = name
+
+            result = handle_request_with_token(config_data, endpoint, data)
+
+            echo_dict(result, config_data['no_color'])
+
+    @click.command(
+        name='info',
+        help='Get {0} account info.'.format(display_name)
+    )
+    @click.option(
+        '--name',
+        type=click.STRING,
+        shell_complete=complete_option,
+        required=True,
+        help='Name of the account.'
+    )
+    @click.pass_context
+    def get(context, name):
+        config_data = get_config(context.obj)
+
+        with handle_errors(config_data['log_level'], config_data['no_color']):
+            result = handle_request_with_token(
+                config_data,
+                endpoint + name,
+                action='get'
+            )
+
+            echo_dict(result, config_data['no_color'])
+
+    @click.command(
+        name='list',
+        help='Get a list of all {0} accounts.'.format(display_name)
+    )
+    @click.pass_context
+    def list_accounts(context):
+        config_data = get_config(context.obj)
+
+        with handle_errors(config_data['log_level'], config_data['no_color']):
+            result = handle_request_with_token(
+                config_data,
+                endpoint,
+                action='get'
+            )
+
+            echo_dict(result, config_data['no_color'])
+
+    @click.command(
+        help='Delete an account in the user name space on the MASH server.'
+    )
+    @click.option(
+        '--force',
+        is_flag=True,
+        callback=abort_if_false,
+        expose_value=False,
+        help='Force deletion without prompt.',
+        prompt='Are you sure you want to delete account? '
+               'You can make account updates instead using '
+               '`mash account {0} update`.'.format(cloud_name)
+    )
+    @click.option(
+        '--name',
+        type=click.STRING,
+        shell_complete=complete_option,
+        required=True,
+        help='Name of the account to be deleted.'
+    )
+    @click.pass_context
+    def delete(context, name):
+        config_data = get_config(context.obj)
+
+        with handle_errors(config_data['log_level'], config_data['no_color']):
+            result = handle_request_with_token(
+                config_data,
+                endpoint + name,
+                action='delete'
+            )
+
+            echo_style(result['msg'], config_data['no_color'])
+
+    @click.command(
+        help='Update an existing {0} account in the user name space on '
+             'the MASH server.'.format(display_name)
+    )
+    @click.option(
+        '--name',
+        type=click.STRING,
+        shell_complete=complete_option,
+        required=True,
+        help='Name for the account to update.'
+    )
+    @click.pass_context
+    def update(context, name, **values):
+        config_data = get_config(context.obj)
+
+        with handle_errors(config_data['log_level'], config_data['no_color']):
+            data = get_account_data(
+                cloud,
+                values,
+                config_data['no_color'],
+                update=True
+            )
+
+            if not data:
+                echo_style(
+                    'Nothing to update',
+                    config_data['no_color'],
+                    fg='red'
+                )
+                sys.exit(1)
+
+            result = handle_request_with_token(
+                config_data,
+                endpoint + name,
+                data
+            )
+
+            echo_dict(result, config_data['no_color'])
+
+    # Options are appended to the commands in registry order
+    for field in cloud['account_fields']:
+        add = field_option(field)(add)
+
+        if not field.get('add_only'):
+            update = field_option(field, update=True)(update)
+
+    for command in (add, get, list_accounts, delete, update):
+        group.add_command(command)
+
+    return group
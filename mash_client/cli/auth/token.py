@@ -23,6 +23,7 @@
 import click
 import sys
 
+from mash_client.completion import complete_option
 from mash_client.cli_utils import (
     get_config,
     handle_errors,
@@ -77,6 +78,7 @@ def token_list(context):
 @click.option(
     '--jti',
     type=click.STRING,
+    shell_complete=complete_option,
     required=True,
     help='The token jti UUID.'
 )
@@ -101,6 +103,7 @@ def get(context, jti):
 @click.option(
     '--jti',
     type=click.STRING,
+    shell_complete=complete_option,
     help='The token jti UUID.'
 )
 @click.pass_context
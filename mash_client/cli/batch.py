@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+"""mash client CLI batch command using click library."""
+
+# Copyright (c) 2026 SUSE LLC. All rights reserved.
+#
+# This file is part of mash_client. mash_client provides a command line
+# utility for interfacing with a MASH server.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import click
+import json
+import shlex
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from mash_client.cli_utils import (
+    capture_thread_output,
+    create_session,
+    get_config,
+    handle_errors,
+    invoke_command
+)
+from mash_client.mash_client_exceptions import MashClientException
+
+
+def parse_batch(text):
+    """
+    Return the argument lists of the commands in a batch file.
+
+    The file is either a JSON list of commands, each a command line
+    string or a list of arguments, or one command line per line.
+    Blank lines and comments are skipped. A leading mash is optional.
+    """
+    try:
+        if text.lstrip().startswith('['):
+            commands = [
+                shlex.split(command) if isinstance(command, str)
+                else [str(arg) for arg in command]
+                for command in json.loads(text)
+            ]
+        else:
+            commands = [
+                shlex.split(line, comments=True)
+                for line in text.splitlines()
+            ]
+    except ValueError as error:
+        raise MashClientException(
+            'Invalid batch file: {0}'.format(error)
+        )
+
+    commands = [command for command in commands if command]
+
+    for command in commands:
+        if command[0] == 'mash':
+            del command[0]
+
+        if command and command[0] == 'batch':
+            raise MashClientException(
+                'Batch commands cannot be nested.'
+            )
+
+    return commands
+
+
+@click.command()
+@click.argument(
+    'commands_file',
+    metavar='FILE',
+    type=click.File('r')
+)
+@click.option(
+    '--jobs',
+    'concurrency',
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help='The number of commands to run concurrently.'
+)
+@click.pass_context
+def batch(context, commands_file, concurrency):
+    """
+    Run the mash commands in FILE in a single process.
+
+    FILE has one command line per line, or a JSON list of commands.
+    Use - to read from stdin. Global options given before batch apply
+    to every command. The commands share an HTTP session and the
+    access token is refreshed at most once.
+
+    For each command a JSON line with the arguments, exit code,
+    duration and output is printed in the order of FILE. Output which
+    is JSON is included as result. The exit code is the highest exit
+    code of all commands.
+    """
+    config_data = get_config(context.obj)
+    root = context.find_root()
+
+    with handle_errors(config_data['log_level'], config_data['no_color']):
+        commands = parse_batch(commands_file.read())
+
+    obj = {'session': create_session(config_data, concurrency)}
+    global_args = root.meta['mash_global_args']
+
+    def run(args):
+        start = time.time()
+        exit_code, output = invoke_command(
+            root.command,
+            global_args + args,
+            obj=dict(obj)
+        )
+        result = {
+            'args': args,
+            'exit_code': exit_code,
+            'duration': round(time.time() - start, 3)
+        }
+
+        try:
+            result['result'] = json.loads(output)
+        except ValueError:
+            result['output'] = output
+
+        return result
+
+    exit_code = 0
+
+    with capture_thread_output():
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            # Results are printed in order as soon as they are available
+            for result in executor.map(run, commands):
+                click.echo(json.dumps(result))
+                exit_code = max(exit_code, result['exit_code'])
+
+    context.exit(exit_code)
@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+
+"""mash client CLI benchmark endpoints using click library."""
+
+# Copyright (c) 2026 SUSE LLC. All rights reserved.
+#
+# This file is part of mash_client. mash_client provides a command line
+# utility for interfacing with a MASH server.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import click
+import json
+
+from mash_client.bench import format_summary, run_scenario, summarize_results
+from mash_client.cli_utils import (
+    create_session,
+    echo_dict,
+    echo_style,
+    get_access_token,
+    get_config,
+    get_tokens_file,
+    get_tokens_from_file,
+    handle_errors,
+    handle_request
+)
+from mash_client.clouds import clouds
+from mash_client.controller import add_job, get_job_status, list_user_jobs
+from mash_client.mash_client_exceptions import MashClientException
+
+
+def bench_options(func):
+    """
+    Add the options shared by all benchmark scenarios.
+    """
+    options = [
+        click.option(
+            '-n',
+            '--requests',
+            'count',
+            type=click.IntRange(min=1),
+            default=100,
+            show_default=True,
+            help='The total number of requests to send.'
+        ),
+        click.option(
+            '-c',
+            '--concurrency',
+            type=click.IntRange(min=1),
+            default=10,
+            show_default=True,
+            help='The number of requests to run concurrently.'
+        ),
+        click.option(
+            '--rate',
+            type=click.FloatRange(min=0, min_open=True),
+            help='Target request rate (requests per second). By default '
+                 'requests are sent as fast as the concurrency allows.'
+        ),
+        click.option(
+            '--json',
+            'json_output',
+            is_flag=True,
+            help='Print the results as JSON instead of a text summary.'
+        ),
+        click.option(
+            '--output',
+            type=click.Path(dir_okay=False, writable=True),
+            help='Also write the JSON results to the given file.'
+        )
+    ]
+
+    for option in reversed(options):
+        func = option(func)
+
+    return func
+
+
+def run_benchmark(
+    config_data, scenario, request, count, concurrency, rate,
+    json_output, output
+):
+    """
+    Run a scenario and echo the summary.
+    """
+    results, elapsed = run_scenario(request, count, concurrency, rate)
+    summary = summarize_results(scenario, results, elapsed, concurrency, rate)
+
+    if output:
+        with open(output, 'w') as output_file:
+            json.dump(summary, output_file, indent=4)
+            output_file.write('\n')
+
+    if json_output:
+        echo_dict(summary, config_data['no_color'])
+    else:
+        echo_style(format_summary(summary), config_data['no_color'])
+
+
+def get_bench_config(context, concurrency):
+    """
+    Return config with a pooled session sized for concurrency.
+
+    The circuit breaker and the response cache are disabled to
+    measure every request on the server. Throttled requests are not
+    retried and neither the rate limit of the profile nor the pauses
+    requested by the server are written to the shared rate limiter
+    state, the benchmark doesn't slow down other processes.
+    """
+    config_data = get_config(context.obj)
+    config_data['session'] = create_session(config_data, concurrency)
+    config_data['breaker_threshold'] = 0
+    config_data['no_cache'] = True
+    config_data['throttle_retries'] = 0
+    config_data['rate_limit'] = None
+    return config_data
+
+
+@click.group()
+def bench():
+    """
+    Generate load against the MASH server and report latencies.
+
+    Each scenario uses the same request path as the regular commands.
+    """
+
+
+@click.command()
+@click.option(
+    '--cloud',
+    type=click.Choice(sorted(clouds)),
+    required=True,
+    help='The cloud framework of the job document.'
+)
+@click.argument(
+    'document',
+    type=click.Path(exists=True)
+)
+@bench_options
+@click.pass_context
+def submit(
+    context, cloud, document, count, concurrency, rate, json_output, output
+):
+    """
+    Submit a job document as a dry run N times.
+
+    The job document is validated by the server but no jobs are created.
+    """
+    config_data = get_bench_config(context, concurrency)
+
+    with handle_errors(config_data['log_level'], config_data['no_color']):
+        with open(document) as job_file:
+            job_data = json.load(job_file)
+
+        job_data['dry_run'] = True
+        get_access_token(config_data)
+
+        def request(index):
+            add_job(config_data, job_data, cloud)
+
+        run_benchmark(
+            config_data, 'submit', request, count, concurrency, rate,
+            json_output, output
+        )
+
+
+@click.command()
+@click.option(
+    '--job-id',
+    'job_ids',
+    type=click.UUID,
+    multiple=True,
+    help='The UUID of a job to poll. May be repeated. By default the '
+         'first jobs from the job list are polled.'
+)
+@click.option(
+    '--jobs',
+    type=click.IntRange(min=1),
+    default=10,
+    show_default=True,
+    help='The number of jobs from the job list to poll '
+         'if no --job-id is provided.'
+)
+@bench_options
+@click.pass_context
+def poll(
+    context, job_ids, jobs, count, concurrency, rate, json_output, output
+):
+    """
+    Poll the status of M jobs N times in total.
+    """
+    config_data = get_bench_config(context, concurrency)
+
+    with handle_errors(config_data['log_level'], config_data['no_color']):
+        if not job_ids:
+            job_ids = [
+                job['job_id'] for job in list_user_jobs(
+                    config_data,
+                    per_page=jobs
+                )
+            ]
+
+        if not job_ids:
+            raise MashClientException('No jobs available to poll.')
+
+        def request(index):
+            get_job_status(
+                config_data,
+                job_ids[index % len(job_ids)],
+                record=False
+            )
+
+        run_benchmark(
+            config_data, 'poll', request, count, concurrency, rate,
+            json_output, output
+        )
+
+
+@click.command(name='list')
+@click.option(
+    '--pages',
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help='The number of distinct pages to cycle through.'
+)
+@click.option(
+    '--per-page',
+    type=click.IntRange(min=1),
+    help='The number of results to return per page.'
+)
+@bench_options
+@click.pass_context
+def list_pages(
+    context, pages, per_page, count, concurrency, rate, json_output, output
+):
+    """
+    Request pages of the job list N times.
+    """
+    config_data = get_bench_config(context, concurrency)
+
+    with handle_errors(config_data['log_level'], config_data['no_color']):
+        get_access_token(config_data)
+
+        def request(index):
+            list_user_jobs(
+                config_data,
+                page=index % pages + 1,
+                per_page=per_page
+            )
+
+        run_benchmark(
+            config_data, 'list', request, count, concurrency, rate,
+            json_output, output
+        )
+
+
+@click.command()
+@bench_options
+@click.pass_context
+def refresh(context, count, concurrency, rate, json_output, output):
+    """
+    Refresh the access token N times.
+
+    The refreshed tokens are discarded and the tokens file is unchanged.
+    """
+    config_data = get_bench_config(context, concurrency)
+
+    with handle_errors(config_data['log_level'], config_data['no_color']):
+        tokens = get_tokens_from_file(
+            get_tokens_file(config_data['config_dir'], config_data['profile'])
+        )
+
+        if 'refresh_token' not in tokens:
+            raise MashClientException(
+                'No refresh token, please login (mash auth login).'
+            )
+
+        def request(index):
+            handle_request(
+                config_data,
+                '/v1/auth/token/refresh',
+                action='post',
+                token=tokens['refresh_token']
+            )
+
+        run_benchmark(
+            config_data, 'refresh', request, count, concurrency, rate,
+            json_output, output
+        )
+
+
+bench.add_command(submit)
+bench.add_command(poll)
+bench.add_command(list_pages)
+bench.add_command(refresh)
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+
+"""mash client CLI check endpoints using click library."""
+
+# Copyright (c) 2026 SUSE LLC. All rights reserved.
+#
+# This file is part of mash_client. mash_client provides a command line
+# utility for interfacing with a MASH server.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import click
+import sys
+
+from contextlib import redirect_stdout
+
+from mash_client.check import (
+    UNKNOWN,
+    check_jobs,
+    format_check,
+    get_check_status,
+    select_jobs
+)
+from mash_client.cli_utils import (
+    create_session,
+    get_access_token,
+    get_config
+)
+from mash_client.clouds import clouds
+from mash_client.completion import complete_option
+from mash_client.controller import parse_duration
+
+
+@click.group()
+def check():
+    """
+    Monitoring plugin checks in Nagios and Icinga format.
+    """
+
+
+@click.command()
+@click.option(
+    '--job-id',
+    'job_ids',
+    type=click.UUID,
+    multiple=True,
+    shell_complete=complete_option,
+    help='The UUID of a job to check. May be repeated. Other selection '
+         'options are ignored.'
+)
+@click.option(
+    '--cloud',
+    'clouds_filter',
+    type=click.Choice(sorted(clouds)),
+    multiple=True,
+    help='Only check jobs of this cloud framework. May be repeated.'
+)
+@click.option(
+    '--match',
+    'pattern',
+    help='Only check jobs with an ID or image name matching the shell '
+         'style pattern. Example: "sles-15-sp5-*"'
+)
+@click.option(
+    '--since',
+    help='Only check jobs started within the duration. Units are s, m, '
+         'h, d and w. Example: 24h'
+)
+@click.option(
+    '--last',
+    type=click.IntRange(min=1),
+    help='Only check the last N jobs started per cloud.'
+)
+@click.option(
+    '-w',
+    '--warning',
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help='The number of failing jobs for a WARNING status. 0 disables '
+         'the threshold.'
+)
+@click.option(
+    '-c',
+    '--critical',
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help='The number of failing jobs for a CRITICAL status. 0 disables '
+         'the threshold.'
+)
+@click.option(
+    '-v',
+    '--verbose',
+    is_flag=True,
+    help='List the failing and unknown jobs after the status line.'
+)
+@click.option(
+    '--jobs',
+    'concurrency',
+    type=click.IntRange(min=1),
+    default=8,
+    show_default=True,
+    help='The number of jobs to request concurrently.'
+)
+@click.option(
+    '--per-page',
+    type=click.IntRange(min=1),
+    help='The number of jobs to request per page of the job list.'
+)
+@click.pass_context
+def jobs(
+    context, job_ids, clouds_filter, pattern, since, last, warning,
+    critical, verbose, concurrency, per_page
+):
+    """
+    Check the state and test results of many jobs at once.
+
+    A job fails the check if it failed or any of its tests failed.
+    Finished jobs without test results are unknown and a WARNING.
+    One status line with perfdata is printed and the exit code is 0
+    for OK, 1 for WARNING, 2 for CRITICAL and 3 for UNKNOWN, for
+    example if no jobs are selected or the server is unreachable.
+    Messages of the config and the login are printed to stderr.
+    """
+    try:
+        # The status line has to be the first line of the output
+        with redirect_stdout(sys.stderr):
+            config_data = get_config(context.obj)
+            get_access_token(config_data)
+
+        config_data['session'] = create_session(config_data, concurrency)
+
+        if job_ids:
+            selected = [{'job_id': str(job_id)} for job_id in job_ids]
+        else:
+            selected = select_jobs(
+                config_data,
+                clouds=clouds_filter,
+                pattern=pattern,
+                since=parse_duration(since) if since else None,
+                last=last,
+                per_page=per_page
+            )
+
+        results = check_jobs(
+            config_data,
+            selected,
+            concurrency,
+            fetch_all=bool(job_ids)
+        )
+    except SystemExit:
+        # The login failed without a refresh token
+        click.echo(
+            'MASH JOBS UNKNOWN - Unable to authenticate, please login '
+            '(mash auth login).'
+        )
+        context.exit(UNKNOWN)
+    except Exception as error:
+        # Any failure of the check itself is UNKNOWN for the monitoring
+        click.echo('MASH JOBS UNKNOWN - {0}: {1}'.format(
+            type(error).__name__,
+            error
+        ))
+        context.exit(UNKNOWN)
+
+    status = get_check_status(results, warning, critical)
+    click.echo(format_check(results, status, warning, critical, verbose))
+    context.exit(status)
+
+
+check.add_command(jobs)
@@ -26,11 +26,11 @@ import os
 import yaml
 
 from mash_client.cli_utils import (
-    default_config_dir,
     get_config,
     echo_dict,
     handle_errors
 )
+from mash_client.paths import default_config_dir
 
 
 @click.group()
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+"""mash client CLI doctor endpoints using click library."""
+
+# Copyright (c) 2026 SUSE LLC. All rights reserved.
+#
+# This file is part of mash_client. mash_client provides a command line
+# utility for interfacing with a MASH server.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import click
+import json
+
+from mash_client.cli_utils import echo_style
+from mash_client.doctor import run_diagnostics
+
+status_colors = {
+    'ok': 'green',
+    'warning': 'yellow',
+    'error': 'red'
+}
+
+
+@click.command()
+@click.option(
+    '--json',
+    'json_output',
+    is_flag=True,
+    help='Print the checks as JSON.'
+)
+@click.pass_context
+def doctor(context, json_output):
+    """
+    Diagnose why mash commands are slow.
+
+    Measures the startup and config load time of mash, name resolution,
+    TCP connect, TLS handshake and request round trip time to the MASH
+    server through the same request path as other commands, checks the
+    tokens with an authenticated request and reports the state of the
+    response cache, circuit breaker and spool. Suggestions are printed
+    for slow or failing checks.
+    """
+    no_color = context.obj['no_color']
+    checks = run_diagnostics(context.obj)
+
+    if json_output:
+        click.echo(json.dumps(checks, indent=4))
+    else:
+        for check in checks:
+            echo_style(
+                '{0:<8} {1:<8} {2}'.format(
+                    check['status'].upper(),
+                    check['check'],
+                    check['message']
+                ),
+                no_color,
+                fg=status_colors[check['status']]
+            )
+
+            if check.get('suggestion'):
+                echo_style(
+                    '{0:<17} {1}'.format('', check['suggestion']),
+                    no_color
+                )
+
+        problems = [
+            check['check'] for check in checks if check['status'] != 'ok'
+        ]
+        if problems:
+            echo_style(
+                'Diagnosis: check {0}.'.format(', '.join(problems)),
+                no_color,
+                fg='red'
+            )
+        else:
+            echo_style('Diagnosis: no problems found.', no_color, fg='green')
+
+    if any(check['status'] == 'error' for check in checks):
+        context.exit(1)
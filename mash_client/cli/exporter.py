@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+"""mash client CLI exporter endpoints using click library."""
+
+# Copyright (c) 2026 SUSE LLC. All rights reserved.
+#
+# This file is part of mash_client. mash_client provides a command line
+# utility for interfacing with a MASH server.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import click
+
+from mash_client.cli_utils import (
+    create_session,
+    echo_style,
+    get_config,
+    handle_errors
+)
+from mash_client.exporter import JobExporter, MetricsServer, parse_listen
+
+
+@click.command()
+@click.option(
+    '--listen',
+    default=':9433',
+    show_default=True,
+    help='The [HOST]:PORT address to serve the metrics on.'
+)
+@click.option(
+    '--interval',
+    type=click.FloatRange(min=1),
+    default=60,
+    show_default=True,
+    help='The time between refreshes of the metrics (seconds).'
+)
+@click.option(
+    '--per-page',
+    type=click.IntRange(min=1),
+    help='The number of jobs to request per page of the job list.'
+)
+@click.pass_context
+def exporter(context, listen, interval, per_page):
+    """
+    Serve job and account metrics for Prometheus on /metrics.
+
+    The job list and account counts are refreshed in the background
+    every interval over one pooled session. Scrapes are answered from
+    the last refresh and never send requests to the MASH server.
+    """
+    config_data = get_config(context.obj)
+    config_data['session'] = create_session(config_data)
+    # Metrics are always requested fresh from the server
+    config_data['no_cache'] = True
+
+    with handle_errors(config_data['log_level'], config_data['no_color']):
+        host, port = parse_listen(listen)
+        job_exporter = JobExporter(config_data, interval, per_page)
+        server = MetricsServer(job_exporter, host, port)
+
+    echo_style(
+        'Serving metrics on {0}'.format(server.url),
+        config_data['no_color']
+    )
+    job_exporter.start()
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        job_exporter.stop()
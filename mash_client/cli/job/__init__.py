@@ -21,33 +21,52 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import click
+import json
 import sys
-import time
+import yaml
 
 from contextlib import suppress
 
+from mash_client.completion import complete_option
 from mash_client.cli_utils import (
     get_config,
     handle_errors,
-    handle_request_with_token,
     abort_if_false,
+    create_session,
     echo_dict,
+    echo_stream,
     echo_style,
-    echo_results
+    echo_results,
+    get_access_token,
+    handle_stream_request_with_token,
+    map_concurrently,
+    sleep_before_deadline
 )
 from mash_client.controller import (
+    add_job,
     delete_job,
+    expand_job_matrix,
     get_job,
+    get_job_schema_by_cloud,
+    iter_user_jobs,
     list_user_jobs,
     get_job_status,
-    get_job_test_results
+    match_job,
+    parse_duration,
+    get_job_test_results,
+    validate_job_document
 )
+from mash_client.export import export_formats, export_jobs
+from mash_client.jsonstream import (
+    iter_json_array_lines,
+    iter_json_object_lines
+)
+from mash_client.mash_client_exceptions import MashClientException
+from mash_client.scheduler import get_queue_documents, submit_queue
+from mash_client.timeline import get_job_timeline, get_service_stats
 
-from mash_client.cli.job.azure import azure
-from mash_client.cli.job.ec2 import ec2
-from mash_client.cli.job.gce import gce
-from mash_client.cli.job.oci import oci
-from mash_client.cli.job.aliyun import aliyun
+from mash_client.cli.job.cloud import make_job_group
+from mash_client.clouds import clouds
 
 
 @click.group()
@@ -68,6 +87,13 @@ def job():
     type=click.INT,
     help='The number of results to return per page.'
 )
+@click.option(
+    '--all',
+    'all_jobs',
+    is_flag=True,
+    help='List all jobs requesting one page after the other. Jobs are '
+         'displayed as they are received.'
+)
 @click.option(
     '--api-version',
     type=click.Choice(['v1']),
@@ -76,13 +102,29 @@ def job():
          'client version.'
 )
 @click.pass_context
-def list_jobs(context, api_version, per_page, page):
+def list_jobs(context, api_version, all_jobs, per_page, page):
     """
     List all jobs in the MASH server pipeline.
     """
     config_data = get_config(context.obj)
 
     with handle_errors(config_data['log_level'], config_data['no_color']):
+        if all_jobs:
+            if page:
+                raise MashClientException(
+                    'The --page option cannot be used with --all.'
+                )
+
+            echo_stream(
+                iter_json_array_lines(iter_user_jobs(
+                    config_data,
+                    per_page=per_page,
+                    api_version=api_version or 'v1'
+                )),
+                config_data['no_color']
+            )
+            return
+
         kwargs = {}
         if page:
             kwargs['page'] = page
@@ -104,6 +146,7 @@ def list_jobs(context, api_version, per_page, page):
 @click.option(
     '--job-id',
     type=click.UUID,
+    shell_complete=complete_option,
     required=True,
     help='The UUID of the job to retrieve.'
 )
@@ -115,14 +158,25 @@ def get(context, job_id, show_data):
     config_data = get_config(context.obj)
 
     with handle_errors(config_data['log_level'], config_data['no_color']):
+        if show_data:
+            # The data section can be large, display it as it is received.
+            # Test results are retrieved via `mash job test-results`.
+            echo_stream(
+                iter_json_object_lines(
+                    handle_stream_request_with_token(
+                        config_data,
+                        '/v1/jobs/{0}'.format(job_id)
+                    ),
+                    expand={'data': ('test_results',)}
+                ),
+                config_data['no_color']
+            )
+            return
+
         result = get_job(config_data, job_id)
 
-        if not show_data:
-            with suppress(KeyError):
-                del result['data']
-        elif 'test_results' in result['data']:
-            # Retrieved via `mash job test-results` command
-            del result['data']['test_results']
+        with suppress(KeyError):
+            del result['data']
 
         echo_dict(result, config_data['no_color'])
 
@@ -131,6 +185,7 @@ def get(context, job_id, show_data):
 @click.option(
     '--job-id',
     type=click.UUID,
+    shell_complete=complete_option,
     required=True,
     help='The UUID of the job for the status query.'
 )
@@ -150,6 +205,7 @@ def status(context, job_id):
 @click.option(
     '--job-id',
     type=click.UUID,
+    shell_complete=complete_option,
     required=True,
     help='The UUID of the job to wait for a finished state.'
 )
@@ -172,18 +228,12 @@ def wait(context, wait_time, job_id):
 
     while True:
         with handle_errors(config_data['log_level'], config_data['no_color']):
-            result = handle_request_with_token(
-                config_data,
-                '/v1/jobs/{0}'.format(job_id),
-                action='get'
-            )
-
-        state = result['state']
+            state = get_job_status(config_data, job_id)['state']
 
-        if state not in ('running', 'undefined'):
-            break
+            if state not in ('running', 'undefined'):
+                break
 
-        time.sleep(wait_time)
+            sleep_before_deadline(config_data, wait_time)
 
     click.echo(state)
 
@@ -199,6 +249,7 @@ def wait(context, wait_time, job_id):
 @click.option(
     '--job-id',
     type=click.UUID,
+    shell_complete=complete_option,
     required=True,
     help='The UUID of the job for test results query.'
 )
@@ -240,6 +291,7 @@ def test_results(context, job_id, verbose):
 @click.option(
     '--job-id',
     type=click.UUID,
+    shell_complete=complete_option,
     required=True,
     help='The UUID of the job to be removed '
          'from the MASH server pipeline.'
@@ -256,15 +308,456 @@ def delete(context, job_id):
         echo_style(result['msg'], config_data['no_color'])
 
 
+@click.command()
+@click.option(
+    '--vars',
+    'vars_file',
+    type=click.Path(exists=True),
+    required=True,
+    help='YAML file mapping each template variable to a list of values.'
+)
+@click.option(
+    '--cloud',
+    type=click.Choice(sorted(clouds)),
+    help='The cloud framework for the jobs. Required unless the matrix '
+         'contains a cloud variable.'
+)
+@click.option(
+    '--dry-run',
+    is_flag=True,
+    help='Validate job documents but do not create jobs.'
+)
+@click.option(
+    '--jobs',
+    'concurrency',
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help='The number of documents to submit concurrently.'
+)
+@click.argument(
+    'template',
+    type=click.Path(exists=True)
+)
+@click.pass_context
+def matrix(context, vars_file, cloud, dry_run, concurrency, template):
+    """
+    Submit a job for each combination of template variables.
+
+    The json TEMPLATE may reference variables as ${name}. The template
+    is expanded over the cartesian product of all variable values and
+    each document is validated before any job is submitted.
+    """
+    config_data = get_config(context.obj)
+    config_data['session'] = create_session(config_data, concurrency)
+
+    with handle_errors(config_data['log_level'], config_data['no_color']):
+        with open(template) as template_file:
+            job_template = json.load(template_file)
+
+        with open(vars_file) as matrix_file:
+            job_matrix = yaml.safe_load(matrix_file)
+
+        documents = []
+        schemas = {}
+        errors = []
+
+        for variables, job_data in expand_job_matrix(job_template, job_matrix):
+            job_cloud = variables.get('cloud', cloud)
+
+            if not job_cloud:
+                raise MashClientException(
+                    'The --cloud option is required if the matrix has '
+                    'no cloud variable.'
+                )
+
+            if job_cloud not in schemas:
+                schemas[job_cloud] = get_job_schema_by_cloud(
+                    config_data,
+                    'raw',
+                    job_cloud
+                )
+
+            if dry_run:
+                job_data['dry_run'] = True
+
+            for error in validate_job_document(job_data, schemas[job_cloud]):
+                errors.append({'variables': variables, 'error': error})
+
+            documents.append((variables, job_data, job_cloud))
+
+        if errors:
+            echo_dict(errors, config_data['no_color'])
+            sys.exit(1)
+
+        get_access_token(config_data)
+        results = map_concurrently(
+            lambda document: add_job(config_data, document[1], document[2]),
+            documents,
+            concurrency
+        )
+
+        output = []
+        for (variables, job_data, job_cloud), (result, error) in zip(
+            documents,
+            results
+        ):
+            item = {'variables': variables}
+
+            if error:
+                item['error'] = str(error)
+            elif 'job_id' in result:
+                item['job_id'] = result['job_id']
+            else:
+                item['msg'] = result.get('msg')
+
+            output.append(item)
+
+        echo_dict(output, config_data['no_color'])
+
+        if any('error' in item for item in output):
+            sys.exit(1)
+
+
+@click.command()
+@click.option(
+    '--state',
+    'states',
+    multiple=True,
+    help='Only prune jobs in this state, for example failed or '
+         'finished. May be repeated.'
+)
+@click.option(
+    '--older-than',
+    help='Only prune jobs started longer ago than the duration. '
+         'Units are s, m, h, d and w. Example: 30d'
+)
+@click.option(
+    '--cloud',
+    'clouds',
+    type=click.Choice(sorted(clouds)),
+    multiple=True,
+    help='Only prune jobs of this cloud framework. May be repeated.'
+)
+@click.option(
+    '--match',
+    'pattern',
+    help='Only prune jobs with an ID or image name matching the shell '
+         'style pattern. Example: "sles-15-sp5-*"'
+)
+@click.option(
+    '--plan',
+    is_flag=True,
+    help='Display the jobs which would be deleted without deleting them.'
+)
+@click.option(
+    '--force',
+    is_flag=True,
+    help='Delete the jobs without prompt.'
+)
+@click.option(
+    '--jobs',
+    'concurrency',
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help='The number of jobs to delete concurrently.'
+)
+@click.option(
+    '--rate',
+    type=click.FloatRange(min=0, min_open=True),
+    help='The maximum number of deletions per second.'
+)
+@click.option(
+    '--per-page',
+    type=click.IntRange(min=1),
+    help='The number of jobs to request per page of the job list.'
+)
+@click.pass_context
+def prune(
+    context, states, older_than, clouds, pattern, plan, force,
+    concurrency, rate, per_page
+):
+    """
+    Delete all jobs matching the given filters.
+
+    The whole job list is searched before the first job is deleted.
+    At least one filter is required.
+    """
+    config_data = get_config(context.obj)
+    config_data['session'] = create_session(config_data, concurrency)
+
+    with handle_errors(config_data['log_level'], config_data['no_color']):
+        if not (states or older_than or clouds or pattern):
+            raise MashClientException(
+                'At least one of --state, --older-than, --cloud or '
+                '--match is required.'
+            )
+
+        filters = {
+            'states': states,
+            'clouds': clouds,
+            'older_than': parse_duration(older_than) if older_than else None,
+            'pattern': pattern
+        }
+        jobs = [
+            {
+                key: job.get(key) for key in (
+                    'job_id', 'state', 'cloud', 'image', 'start_time'
+                )
+            }
+            for job in iter_user_jobs(config_data, per_page=per_page)
+            if match_job(job, **filters)
+        ]
+
+        if plan:
+            echo_dict(jobs, config_data['no_color'])
+            echo_style(
+                '{0} jobs would be deleted.'.format(len(jobs)),
+                config_data['no_color']
+            )
+            return
+
+        if not jobs:
+            echo_style('No matching jobs.', config_data['no_color'])
+            return
+
+        if not force:
+            click.confirm(
+                'Are you sure you want to delete {0} jobs?'.format(len(jobs)),
+                abort=True
+            )
+
+        results = map_concurrently(
+            lambda job: delete_job(config_data, job['job_id']),
+            jobs,
+            concurrency,
+            rate
+        )
+        errors = {
+            job['job_id']: str(error)
+            for job, (result, error) in zip(jobs, results)
+            if error
+        }
+
+        echo_dict(
+            {'deleted': len(jobs) - len(errors), 'errors': errors},
+            config_data['no_color']
+        )
+
+        if errors:
+            sys.exit(1)
+
+
+@click.command()
+@click.option(
+    '--format',
+    'export_format',
+    type=click.Choice(export_formats),
+    default='csv',
+    show_default=True,
+    help='The output format.'
+)
+@click.option(
+    '--output',
+    type=click.Path(dir_okay=False, writable=True),
+    required=True,
+    help='The output file. For csv, ndjson and parquet the test cases '
+         'are written to a second file with the suffix _test_cases. '
+         'For sqlite they are written to the test_cases table.'
+)
+@click.option(
+    '--with-data',
+    is_flag=True,
+    help='Request the data and test results of each job.'
+)
+@click.option(
+    '--jobs',
+    'concurrency',
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help='The number of jobs to request concurrently with --with-data.'
+)
+@click.option(
+    '--per-page',
+    type=click.IntRange(min=1),
+    help='The number of jobs to request per page of the job list.'
+)
+@click.pass_context
+def export(context, export_format, output, with_data, concurrency, per_page):
+    """
+    Export all jobs and their test cases for analysis.
+
+    Jobs are written one row per job and test cases one row per test
+    case with the job_id of the job.
+    """
+    config_data = get_config(context.obj)
+    config_data['session'] = create_session(config_data, concurrency)
+
+    with handle_errors(config_data['log_level'], config_data['no_color']):
+        job_count, test_case_count, error_count = export_jobs(
+            config_data,
+            output,
+            export_format,
+            with_data,
+            concurrency,
+            per_page
+        )
+        echo_style(
+            'Exported {0} jobs and {1} test cases.'.format(
+                job_count,
+                test_case_count
+            ),
+            config_data['no_color']
+        )
+
+        if error_count:
+            echo_style(
+                'The data of {0} jobs could not be requested, see the '
+                'export_error column.'.format(error_count),
+                config_data['no_color'],
+                fg='red'
+            )
+
+
+@click.command(name='submit-queue')
+@click.argument(
+    'directory',
+    type=click.Path(exists=True, file_okay=False)
+)
+@click.option(
+    '--cloud',
+    type=click.Choice(sorted(clouds)),
+    required=True,
+    help='The cloud framework for the jobs.'
+)
+@click.option(
+    '--max-in-flight',
+    type=click.IntRange(min=1),
+    default=10,
+    show_default=True,
+    help='The maximum number of submitted jobs running at once.'
+)
+@click.option(
+    '--poll-interval',
+    type=click.FloatRange(min=0, min_open=True),
+    default=30,
+    show_default=True,
+    help='The time to wait before checking the status of the running '
+         'jobs again while the limit is reached (seconds).'
+)
+@click.option(
+    '--sort-by',
+    help='Submit documents ordered by the value of this document field '
+         'instead of the filename. Example: utctime'
+)
+@click.option(
+    '--reverse',
+    is_flag=True,
+    help='Submit documents in descending order.'
+)
+@click.pass_context
+def submit_queue_command(
+    context, directory, cloud, max_in_flight, poll_interval, sort_by,
+    reverse
+):
+    """
+    Submit the json documents in DIRECTORY as a queue.
+
+    A document is only submitted while fewer than --max-in-flight of
+    the jobs submitted by the queue are running. For each document a
+    JSON line with the job id or error and the number of jobs in
+    flight is printed.
+    """
+    config_data = get_config(context.obj)
+    config_data['session'] = create_session(config_data)
+
+    def report(item, in_flight):
+        click.echo(json.dumps(dict(item, in_flight=in_flight)))
+
+    with handle_errors(config_data['log_level'], config_data['no_color']):
+        documents = get_queue_documents(directory, sort_by, reverse)
+        results = submit_queue(
+            config_data,
+            documents,
+            cloud,
+            max_in_flight,
+            poll_interval,
+            callback=report
+        )
+
+    if any('error' in item for item in results):
+        sys.exit(1)
+
+
+@click.command()
+@click.option(
+    '--job-id',
+    type=click.UUID,
+    shell_complete=complete_option,
+    help='The UUID of the job to display the timeline of.'
+)
+@click.option(
+    '--stats',
+    is_flag=True,
+    help='Display the median, p95 and maximum duration of each service '
+         'per cloud over all recorded jobs.'
+)
+@click.option(
+    '--cloud',
+    type=click.Choice(sorted(clouds)),
+    help='Only include jobs of this cloud framework with --stats.'
+)
+@click.option(
+    '--since',
+    help='Only include jobs observed within the duration with --stats. '
+         'Units are s, m, h, d and w. Example: 7d'
+)
+@click.pass_context
+def timeline(context, job_id, stats, cloud, since):
+    """
+    Display how long each service of a job took.
+
+    The timeline is built from the state transitions recorded locally
+    whenever the status of a job is requested, for example by
+    `mash job status`, `mash job wait` and `mash job submit-queue`.
+    Durations are as precise as the interval the job was polled at.
+    """
+    config_data = get_config(context.obj)
+
+    with handle_errors(config_data['log_level'], config_data['no_color']):
+        if bool(job_id) == stats:
+            raise MashClientException(
+                'Exactly one of --job-id or --stats is required.'
+            )
+
+        if stats:
+            result = get_service_stats(
+                config_data,
+                cloud=cloud,
+                since=parse_duration(since) if since else None
+            )
+        else:
+            # Record the current state before building the timeline
+            get_job_status(config_data, job_id)
+            result = get_job_timeline(config_data, job_id)
+
+        echo_dict(result, config_data['no_color'])
+
+
 job.add_command(delete)
 job.add_command(get)
 job.add_command(list_jobs)
 job.add_command(status)
 job.add_command(wait)
 job.add_command(test_results)
+job.add_command(matrix)
+job.add_command(prune)
+job.add_command(export)
+job.add_command(submit_queue_command)
+job.add_command(timeline)
+
 
-job.add_command(azure)
-job.add_command(ec2)
-job.add_command(gce)
-job.add_command(oci)
-job.add_command(aliyun)
+for cloud_name, cloud in clouds.items():
+    job.add_command(make_job_group(cloud_name, cloud))
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+
+"""mash client CLI cloud job endpoints using click library."""
+
+# Copyright (c) 2026 SUSE LLC. All rights reserved.
+#
+# This file is part of mash_client. mash_client provides a command line
+# utility for interfacing with a MASH server.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import click
+import json
+
+from mash_client.cli_utils import (
+    JSONFile,
+    get_config,
+    handle_errors,
+    echo_dict,
+    echo_style
+)
+from mash_client.controller import (
+    get_job_schema_by_cloud,
+    add_job,
+    parse_duration
+)
+from mash_client.dedupe import add_job_deduplicated
+from mash_client.spool import add_job_or_spool
+
+
+def make_job_group(cloud_name, cloud):
+    """
+    Return the job command group of a cloud from its registry entry.
+    """
+    display_name = cloud['display_name']
+
+    @click.group(
+        name=cloud_name,
+        help='Submit {0} job requests.'.format(display_name)
+    )
+    def group():
+        pass
+
+    @click.command(
+        help='Send add {0} job request to mash server based on provided '
+             'json document.'.format(cloud_name)
+    )
+    @click.option(
+        '--dry-run',
+        is_flag=True,
+        help='Validate job document but do not create job.'
+    )
+    @click.option(
+        '--spool',
+        is_flag=True,
+        help='If the MASH server is unreachable spool the job document '
+             'to submit it later with `mash spool flush`.'
+    )
+    @click.option(
+        '--skip-duplicates',
+        is_flag=True,
+        help='Do not submit a document identical to one submitted within '
+             'the dedupe window. The job id of the earlier job is returned '
+             'unless that job failed or was deleted.'
+    )
+    @click.option(
+        '--dedupe-window',
+        default='24h',
+        show_default=True,
+        help='How long a submitted document is considered a duplicate '
+             'with --skip-duplicates, for example 12h or 7d.'
+    )
+    @click.argument(
+        'document',
+        type=click.Path(exists=True)
+    )
+    @click.option(
+        '--api-version',
+        type=click.Choice(['v1']),
+        help='The version of the API to use for request. '
+             'Defaults to the latest API version based on '
+             'client version.'
+    )
+    @click.pass_context
+    def add(
+        context, dry_run, spool, skip_duplicates, dedupe_window, document,
+        api_version
+    ):
+        config_data = get_config(context.obj)
+
+        with handle_errors(config_data['log_level'], config_data['no_color']):
+            if dry_run:
+                with open(document) as job_file:
+                    job_data = json.load(job_file)
+
+                job_data['dry_run'] = True
+            else:
+                # The document is sent as it is without parsing it
+                job_data = JSONFile(document)
+
+            kwargs = {}
+            if api_version:
+                kwargs['api_version'] = api_version
+
+            submit = add_job_or_spool if spool and not dry_run else add_job
+
+            if skip_duplicates and not dry_run:
+                result = add_job_deduplicated(
+                    config_data,
+                    job_data,
+                    cloud_name,
+                    parse_duration(dedupe_window),
+                    submit=submit,
+                    **kwargs
+                )
+            else:
+                result = submit(config_data, job_data, cloud_name, **kwargs)
+
+            if 'msg' in result:
+                echo_style(result['msg'], config_data['no_color'])
+            else:
+                echo_dict(result, config_data['no_color'])
+
+    @click.command(
+        name='schema',
+        help='Get an annotated json dictionary for {0} jobs.'.format(
+            display_name
+        )
+    )
+    @click.option(
+        '--json',
+        'output_style',
+        flag_value='json',
+        help='Prints an example json dictionary with example values.'
+    )
+    @click.option(
+        '--raw',
+        'output_style',
+        flag_value='raw',
+        help='Prints a raw jsonschema dictionary.'
+    )
+    @click.option(
+        '--annotated',
+        'output_style',
+        flag_value='annotated',
+        default=True,
+        help='Prints a raw jsonschema dictionary.'
+    )
+    @click.pass_context
+    def get_schema(context, output_style):
+        config_data = get_config(context.obj)
+
+        with handle_errors(config_data['log_level'], config_data['no_color']):
+            result = get_job_schema_by_cloud(
+                config_data,
+                output_style,
+                cloud_name
+            )
+
+        echo_dict(result, config_data['no_color'])
+
+    group.add_command(add)
+    group.add_command(get_schema)
+
+    return group
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+"""mash client CLI spool endpoints using click library."""
+
+# Copyright (c) 2026 SUSE LLC. All rights reserved.
+#
+# This file is part of mash_client. mash_client provides a command line
+# utility for interfacing with a MASH server.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import click
+import sys
+
+from mash_client.cli_utils import (
+    create_session,
+    echo_dict,
+    echo_style,
+    get_config,
+    handle_errors
+)
+from mash_client.spool import flush_spool, get_spool_dir, list_spool
+
+
+@click.group()
+def spool():
+    """
+    Manage job documents spooled while the MASH server was unreachable.
+
+    Documents are spooled by `mash job <cloud> add --spool`.
+    """
+
+
+@click.command(name='list')
+@click.pass_context
+def list_spooled(context):
+    """
+    List the spooled job documents.
+    """
+    config_data = get_config(context.obj)
+
+    with handle_errors(config_data['log_level'], config_data['no_color']):
+        entries = list_spool(get_spool_dir(config_data))
+        echo_dict(
+            [
+                {
+                    'id': entry['id'],
+                    'cloud': entry['cloud'],
+                    'image': entry['job_data'].get('image'),
+                    'spooled': entry['spooled']
+                }
+                for entry in entries
+            ],
+            config_data['no_color']
+        )
+
+
+@click.command()
+@click.option(
+    '--jobs',
+    'concurrency',
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help='The number of documents to submit concurrently.'
+)
+@click.option(
+    '--retries',
+    type=click.IntRange(min=0),
+    default=3,
+    show_default=True,
+    help='The number of retries for each document if the connection '
+         'to the MASH server fails.'
+)
+@click.pass_context
+def flush(context, concurrency, retries):
+    """
+    Submit all spooled job documents.
+
+    Documents which still fail to connect, time out or hit a server
+    error stay spooled, documents the server rejects are moved to the
+    failed directory of the spool.
+    Suitable to run from cron.
+    """
+    config_data = get_config(context.obj)
+    config_data['session'] = create_session(config_data, concurrency)
+
+    with handle_errors(config_data['log_level'], config_data['no_color']):
+        results = flush_spool(config_data, concurrency, retries)
+
+        if not results:
+            echo_style('No spooled job documents.', config_data['no_color'])
+            return
+
+        echo_dict(results, config_data['no_color'])
+
+        if any('error' in result for result in results):
+            sys.exit(1)
+
+
+spool.add_command(list_spooled)
+spool.add_command(flush)
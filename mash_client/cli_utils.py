@@ -21,6 +21,8 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import click
+import gzip
+import io
 import json
 import jwt
 import logging
@@ -28,27 +30,51 @@ import os
 import requests
 import socket
 import sys
+import threading
 import time
 import yaml
+import zlib
 
 from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager, suppress
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from urllib.parse import urlparse, parse_qs
+from urllib3.util.request import ACCEPT_ENCODING
+
+from mash_client.breaker import get_circuit_breaker
+from mash_client.cache import get_response_cache
+from mash_client.jsonstream import JSONStream
+from mash_client.mash_client_exceptions import (
+    MashClientException,
+    MashConnectionException,
+    MashDeadlineException
+)
+from mash_client.paths import default_config_dir
+from mash_client.ratelimit import get_rate_limiter, parse_retry_after
+from mash_client.unix_socket import (
+    UNIX_SCHEME,
+    UnixHTTPAdapter,
+    get_unix_socket_url,
+    is_unix_socket_url
+)
 
-from mash_client.mash_client_exceptions import MashClientException
-
-default_config_dir = os.path.expanduser('~/.config/mash_client/')
 default_profile = 'default'
 defaults = {
     'config_dir': default_config_dir,
+    'connect_timeout': 10,
     'profile': default_profile,
+    'read_timeout': 120,
     'host': 'http://127.0.0.1',
     'log_level': logging.INFO,
     'no_color': False,
+    'transport': 'requests',
     'verify': True
 }
-EC2_PARTITIONS = ('aws', 'aws-cn', 'aws-us-gov', 'aws-eusc')
+thread_output = threading.local()
+token_lock = threading.Lock()
+config_cache = {}
+transport_warnings = set()
 
 
 def echo_dict(data, no_color):
@@ -58,6 +84,19 @@ def echo_dict(data, no_color):
     echo_style(json.dumps(data, indent=4), no_color)
 
 
+def echo_stream(texts, no_color, fg='yellow'):
+    """
+    Echo stylized text to terminal as it is produced.
+    """
+    for text in texts:
+        if no_color:
+            click.echo(text, nl=False)
+        else:
+            click.secho(text, fg=fg, nl=False)
+
+    click.echo('')
+
+
 def echo_style(message, no_color, fg='yellow'):
     """
     Echo stylized output to terminal depending on no_color.
@@ -82,8 +121,7 @@ def get_config(cli_context):
     config_file_path = os.path.join(config_dir, profile + '.yaml')
 
     try:
-        with open(config_file_path) as config_file:
-            config_values = yaml.safe_load(config_file)
+        config_values = load_config_file(config_file_path)
     except FileNotFoundError:
         echo_style(
             'Config file: {config_file_path} not found. Using default '
@@ -100,6 +138,11 @@ def get_config(cli_context):
     data = ChainMap(cli_values, config_values, defaults)
 
     host = data['host']
+    if host.startswith('unix://'):
+        # Requests are sent over the Unix domain socket at the path
+        data['url'] = get_unix_socket_url(host[len('unix://'):])
+        return data
+
     if not host.startswith('http'):
         host = ''.join(['http://', host])
 
@@ -111,6 +154,26 @@ def get_config(cli_context):
     return data
 
 
+def load_config_file(config_file_path):
+    """
+    Return the values of a config file.
+
+    The values are kept until the file is modified, commands run in
+    the same process do not parse the file again.
+    """
+    mtime = os.stat(config_file_path).st_mtime_ns
+    cached = config_cache.get(config_file_path)
+
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with open(config_file_path) as config_file:
+        config_values = yaml.safe_load(config_file)
+
+    config_cache[config_file_path] = (mtime, config_values)
+    return config_values
+
+
 def update_config(cli_context, key, value):
     """
     Update a key in the current config profile.
@@ -130,6 +193,95 @@ def update_config(cli_context, key, value):
         yaml.dump(config_values, config_file, default_flow_style=False)
 
 
+def create_session(config_data, pool_size=10):
+    """
+    Create a pooled HTTP session for config.
+
+    Attaching the session to config_data as 'session' lets every
+    request made with that config reuse connections. If the profile
+    sets transport to http2 an HTTP/2 capable session is created,
+    falling back to requests if httpx is not installed. Servers on a
+    Unix domain socket always use requests.
+    """
+    unix_socket = is_unix_socket_url(config_data.get('url'))
+
+    if config_data.get('transport') == 'http2' and not unix_socket:
+        # httpx is only imported when the http2 transport is used
+        from mash_client.transports import Http2Session
+
+        try:
+            return Http2Session(config_data['verify'], pool_size)
+        except ImportError as error:
+            # Warn on stderr to keep the output parseable, once per process
+            message = '{0} Falling back to the requests transport.'.format(
+                error
+            )
+
+            if message not in transport_warnings:
+                transport_warnings.add(message)
+                click.echo(message, err=True)
+
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+    if unix_socket:
+        session.mount(UNIX_SCHEME, UnixHTTPAdapter(pool_size))
+
+    return session
+
+
+def map_concurrently(func, items, concurrency=1, rate=None):
+    """
+    Call func for each item using a pool of concurrency threads.
+
+    If rate is provided calls are started at no more than that many
+    calls per second.
+
+    Returns a list of (result, error) tuples in the order of items
+    where error is the exception raised by func or None.
+    """
+    start = time.time()
+
+    def call(args):
+        index, item = args
+
+        if rate:
+            delay = start + index / rate - time.time()
+
+            if delay > 0:
+                time.sleep(delay)
+
+        try:
+            return func(item), None
+        except Exception as error:
+            return None, error
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(call, enumerate(items)))
+
+
+def get_session(config_data):
+    """
+    Return the HTTP client to use for requests with config.
+
+    Defaults to the requests module unless a session has been
+    attached to the config, the profile selects the http2 transport
+    or the server is on a Unix domain socket.
+    """
+    if not config_data.get('session') and (
+        config_data.get('transport') == 'http2' or
+        is_unix_socket_url(config_data.get('url'))
+    ):
+        config_data['session'] = create_session(config_data)
+
+    return config_data.get('session') or requests
+
+
 @contextmanager
 def handle_errors(log_level, no_color):
     """
@@ -149,113 +301,488 @@ def handle_errors(log_level, no_color):
         sys.exit(1)
 
 
-def handle_request(
+def send_request(
     config_data,
     endpoint,
     job_data=None,
     action='post',
     token=None,
-    raise_for_status=True
+    stream=False,
+    headers=None
 ):
     """
-    Post request based on endpoint and data.
+    Send request based on endpoint and data and return the response.
 
-    If response is successful return the json data.
-    Otherwise raise exception.
+    If stream is True the response body is not read. Additional
+    request headers can be provided with headers. A request_observer
+    in config is called with the action, status code and duration of
+    each response.
     """
-    method = getattr(requests, action)
-
-    headers = {}
-    if job_data is not None:
-        headers = {'content-type': 'application/json'}
+    method = getattr(get_session(config_data), action)
+
+    headers = dict(headers or {})
+    headers['accept-encoding'] = ACCEPT_ENCODING
+    body_size = 0
+    if isinstance(job_data, JSONFile):
+        headers['content-type'] = 'application/json'
+        body_size = job_data.size
+        job_data = open_file_body(config_data, job_data, headers)
+    elif job_data is not None:
+        headers['content-type'] = 'application/json'
         job_data = json.dumps(job_data)
+        body_size = len(job_data)
+        job_data = compress_request_body(config_data, job_data, headers)
+
+    if hasattr(job_data, 'read'):
+        sent_size = body_size
+    else:
+        sent_size = len(job_data) if job_data else 0
 
     if token:
         headers['authorization'] = 'Bearer {token}'.format(token=token)
 
+    breaker = get_circuit_breaker(config_data)
+    limiter = get_rate_limiter(config_data)
+    retries = int(config_data.get('throttle_retries', 3))
+
     try:
-        response = method(
-            ''.join([config_data['url'], endpoint]),
-            data=job_data,
-            headers=headers,
-            verify=config_data['verify']
-        )
-    except requests.ConnectionError:
-        raise MashClientException(
-            'Failed to establish connection with MASH server at: '
-            '{url}'.format(url=config_data['url'])
+        for attempt in range(retries + 1):
+            breaker.before_request()
+            limiter.acquire(config_data.get('deadline'))
+            start = time.time()
+
+            if hasattr(job_data, 'seek'):
+                # Send the file from the start again on retries
+                job_data.seek(0)
+
+            try:
+                response = method(
+                    ''.join([config_data['url'], endpoint]),
+                    data=job_data,
+                    headers=headers,
+                    verify=config_data['verify'],
+                    timeout=get_request_timeout(config_data),
+                    stream=stream
+                )
+            except requests.ConnectionError:
+                breaker.record_failure()
+                raise MashConnectionException(
+                    'Failed to establish connection with MASH server at: '
+                    '{url}'.format(url=config_data['url'])
+                )
+            except requests.Timeout:
+                breaker.record_failure()
+                raise MashClientException(
+                    'Timed out waiting for a response from MASH server at: '
+                    '{url}'.format(url=config_data['url'])
+                )
+
+            observer = config_data.get('request_observer')
+            if observer:
+                observer(action, response.status_code, time.time() - start)
+
+            if response.status_code in range(500, 600):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+            if response.status_code != 429 or attempt == retries:
+                break
+
+            # Throttled, pause all requests to the server and try again
+            limiter.pause(
+                parse_retry_after(response.headers.get('Retry-After'))
+            )
+    finally:
+        if hasattr(job_data, 'close'):
+            job_data.close()
+
+    if config_data.get('log_level') == logging.DEBUG and not stream:
+        echo_request_timing(
+            action,
+            endpoint,
+            response,
+            time.time() - start,
+            sent_size,
+            body_size
         )
 
+    return response
+
+
+def get_response_json(config_data, endpoint, response):
+    """
+    Return the decoded json body of response.
+    """
     try:
-        result = response.json()
+        return response.json()
     except json.decoder.JSONDecodeError:
         raise MashClientException(
             'The requested URL was not found on the server: {url}'.format(
                 url=''.join([config_data['url'], endpoint])
-            )
+            ),
+            status_code=response.status_code
         )
 
-    if not raise_for_status or response.status_code in (200, 201):
-        return result
-    elif 'errors' in result:
+
+def raise_response_error(response, result):
+    """
+    Raise an exception with the error message of a failed request.
+
+    The exception has the status code of the response.
+    """
+    if 'errors' in result:
         # Unknown properties have no keys
         raise MashClientException(
             '\n'.join(
                 ': '.join(filter(None, [key, val]))
                 for key, val in result['errors'].items()
-            )
+            ),
+            status_code=response.status_code
         )
     elif 'msg' in result:
-        raise MashClientException(result['msg'])
+        raise MashClientException(
+            result['msg'],
+            status_code=response.status_code
+        )
     else:
         response.raise_for_status()
 
 
-def handle_request_with_token(
+def handle_request(
     config_data,
     endpoint,
     job_data=None,
     action='post',
+    token=None,
     raise_for_status=True
 ):
     """
-    Submit request to API with access token.
+    Post request based on endpoint and data.
 
-    If access token is past expiration date attempt to refresh token.
+    If response is successful return the json data.
+    Otherwise raise exception.
+
+    GET responses are served from the response cache while they are
+    fresh and revalidated with their ETag once they are stale. Other
+    requests invalidate the cached responses of the endpoint.
     """
-    tokens_file = get_tokens_file(
-        config_data['config_dir'],
-        config_data['profile']
+    cache = get_response_cache(config_data)
+    entry = None
+    headers = {}
+
+    # Bodies of files are not read to compute the cache key
+    cacheable = action == 'get' and not config_data.get('no_cache') and \
+        not isinstance(job_data, JSONFile)
+
+    if cache and cacheable:
+        entry = cache.lookup(endpoint, token, job_data)
+
+        if entry and cache.is_fresh(entry):
+            return entry['result']
+
+        if entry and entry['etag']:
+            headers['if-none-match'] = entry['etag']
+
+    response = send_request(
+        config_data,
+        endpoint,
+        job_data,
+        action,
+        token,
+        headers=headers
     )
-    tokens = get_tokens_from_file(tokens_file)
 
-    if 'access_token' not in tokens:
-        refresh_token(config_data)
+    if cache and action != 'get':
+        cache.invalidate(endpoint)
+    elif entry and response.status_code == 304:
+        cache.revalidated(endpoint, token, entry, response, job_data)
+        return entry['result']
+
+    result = get_response_json(config_data, endpoint, response)
+
+    if cache and cacheable and response.status_code == 200:
+        cache.store(endpoint, token, response, result, job_data)
+
+    if not raise_for_status or response.status_code in (200, 201):
+        return result
+
+    raise_response_error(response, result)
+
+
+def iter_response_chunks(response, chunk_size=65536):
+    """
+    Yield the decoded body of a streamed response in chunks.
+    """
+    if hasattr(response, 'iter_bytes'):
+        # httpx response
+        chunks = response.iter_bytes(chunk_size)
     else:
-        access_token = jwt.decode(
-            tokens['access_token'],
-            verify=False,
-            options={'verify_signature': False}
+        chunks = response.iter_content(chunk_size)
+
+    try:
+        for chunk in chunks:
+            yield chunk
+    finally:
+        response.close()
+
+
+def handle_stream_request_with_token(
+    config_data,
+    endpoint,
+    job_data=None,
+    action='get'
+):
+    """
+    Submit request to API with access token and stream the response.
+
+    Returns a JSONStream which parses the response body as it is
+    received instead of loading it into memory at once.
+    """
+    response = send_request(
+        config_data,
+        endpoint,
+        job_data=job_data,
+        action=action,
+        token=get_access_token(config_data),
+        stream=True
+    )
+
+    if response.status_code not in (200, 201):
+        try:
+            result = get_response_json(config_data, endpoint, response)
+        finally:
+            response.close()
+
+        raise_response_error(response, result)
+
+    return JSONStream(iter_response_chunks(response))
+
+
+def get_deadline_remaining(config_data):
+    """
+    Return the seconds left until the command deadline.
+
+    Returns None if the command has no deadline and raises an
+    exception if the deadline has passed.
+    """
+    deadline = config_data.get('deadline')
+
+    if deadline is None:
+        return None
+
+    remaining = deadline - time.time()
+
+    if remaining <= 0:
+        raise MashDeadlineException('The command deadline was exceeded.')
+
+    return remaining
+
+
+def get_request_timeout(config_data):
+    """
+    Return the (connect, read) timeout for a request.
+
+    The timeouts from config are reduced to the time remaining
+    until the command deadline.
+    """
+    connect_timeout = float(
+        config_data.get('connect_timeout', defaults['connect_timeout'])
+    )
+    read_timeout = float(
+        config_data.get('read_timeout', defaults['read_timeout'])
+    )
+    remaining = get_deadline_remaining(config_data)
+
+    if remaining is not None:
+        connect_timeout = min(connect_timeout, remaining)
+        read_timeout = min(read_timeout, remaining)
+
+    return connect_timeout, read_timeout
+
+
+def sleep_before_deadline(config_data, seconds):
+    """
+    Sleep unless the command deadline passes before the sleep ends.
+    """
+    remaining = get_deadline_remaining(config_data)
+
+    if remaining is not None and seconds >= remaining:
+        raise MashDeadlineException(
+            'The command deadline would be exceeded before the next '
+            'attempt in {0} seconds.'.format(seconds)
         )
-        now = int(time.time() + 10)
 
-        if access_token.get('exp') and now >= access_token['exp']:
-            refresh_token(config_data)
+    time.sleep(seconds)
+
+
+def compress_request_body(config_data, body, headers):
+    """
+    Gzip the request body if it exceeds the configured threshold.
+
+    The threshold is set in bytes with compress_threshold in the
+    profile. Request bodies are sent uncompressed by default.
+    """
+    threshold = config_data.get('compress_threshold')
+
+    if threshold is None or len(body) < int(threshold):
+        return body
+
+    headers['content-encoding'] = 'gzip'
+    return gzip.compress(body.encode('utf-8'))
+
+
+class JSONFile(object):
+    """
+    Request body of a JSON document file which is sent as it is.
+
+    The file is streamed from disk instead of being parsed and
+    serialized again. Use load() to get the parsed document if it
+    has to be changed.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.size = os.path.getsize(path)
+
+    def load(self):
+        with open(self.path) as json_file:
+            return json.load(json_file)
+
+
+def open_file_body(config_data, json_file, headers):
+    """
+    Return the request body for a JSON file.
+
+    Returns the open file unless the file size exceeds the
+    compress_threshold of the profile. Larger files are gzip
+    compressed chunk by chunk.
+    """
+    threshold = config_data.get('compress_threshold')
+    body_file = open(json_file.path, 'rb')
+
+    if threshold is None or json_file.size < int(threshold):
+        headers['content-length'] = str(json_file.size)
+        return body_file
+
+    # wbits 31 writes the gzip header and trailer
+    compressor = zlib.compressobj(wbits=31)
+    chunks = []
+
+    with body_file:
+        for chunk in iter(lambda: body_file.read(65536), b''):
+            chunks.append(compressor.compress(chunk))
+
+    chunks.append(compressor.flush())
+    headers['content-encoding'] = 'gzip'
+    return b''.join(chunks)
+
+
+def get_transfer_size(response):
+    """
+    Return the number of response body bytes received on the wire.
+
+    This is the compressed size if the response was compressed.
+    """
+    if hasattr(response, 'num_bytes_downloaded'):
+        # httpx response
+        return response.num_bytes_downloaded
+
+    with suppress(Exception):
+        return int(response.raw.tell())
+
+    return int(response.headers.get('content-length', 0))
+
+
+def echo_request_timing(action, endpoint, response, elapsed, sent, body_size):
+    """
+    Echo request duration and transfer sizes to stderr.
+
+    Timing output is best effort and never fails the request.
+    """
+    try:
+        received = len(response.content)
+    except Exception:
+        return
+
+    message = (
+        '{action} {endpoint} {status} in {elapsed:.3f}s: '
+        'sent {sent} bytes ({body_size} uncompressed), '
+        'received {wire} bytes ({received} decoded{encoding})'
+    ).format(
+        action=action.upper(),
+        endpoint=endpoint,
+        status=response.status_code,
+        elapsed=elapsed,
+        sent=sent,
+        body_size=body_size,
+        wire=get_transfer_size(response),
+        received=received,
+        encoding=', {0}'.format(
+            response.headers['content-encoding']
+        ) if 'content-encoding' in response.headers else ''
+    )
+    click.echo(message, err=True)
 
-    tokens = get_tokens_from_file(tokens_file)
 
+def handle_request_with_token(
+    config_data,
+    endpoint,
+    job_data=None,
+    action='post',
+    raise_for_status=True
+):
+    """
+    Submit request to API with access token.
+
+    If access token is past expiration date attempt to refresh token.
+    """
     result = handle_request(
         config_data,
         endpoint,
         job_data=job_data,
         action=action,
-        token=tokens['access_token'],
+        token=get_access_token(config_data),
         raise_for_status=raise_for_status
     )
 
     return result
 
 
+def get_access_token(config_data):
+    """
+    Return a valid access token for the config profile.
+
+    If access token is past expiration date attempt to refresh token.
+    Threads wait for a refresh in progress instead of refreshing the
+    token again.
+    """
+    tokens_file = get_tokens_file(
+        config_data['config_dir'],
+        config_data['profile']
+    )
+
+    with token_lock:
+        tokens = get_tokens_from_file(tokens_file)
+
+        if 'access_token' not in tokens:
+            refresh_token(config_data)
+        else:
+            access_token = jwt.decode(
+                tokens['access_token'],
+                verify=False,
+                options={'verify_signature': False}
+            )
+            now = int(time.time() + 10)
+
+            if access_token.get('exp') and now >= access_token['exp']:
+                refresh_token(config_data)
+
+        tokens = get_tokens_from_file(tokens_file)
+
+    return tokens['access_token']
+
+
 def refresh_token(config_data):
     tokens_file = get_tokens_file(
         config_data['config_dir'],
@@ -529,3 +1056,91 @@ def echo_results(data, no_color, verbose=False):
 
     if verbose:
         echo_verbose_results(data, no_color)
+
+
+class ThreadOutput(io.TextIOBase):
+    """
+    Text stream routing writes to the current thread's output buffer.
+
+    Threads without a buffer in thread_output write to the wrapped
+    stream.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    @property
+    def encoding(self):
+        return getattr(self.stream, 'encoding', 'utf-8')
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        buffer = getattr(thread_output, 'buffer', None)
+        (buffer or self.stream).write(data)
+        return len(data)
+
+    def flush(self):
+        if getattr(thread_output, 'buffer', None) is None:
+            self.stream.flush()
+
+    def isatty(self):
+        if getattr(thread_output, 'buffer', None) is not None:
+            return False
+
+        return self.stream.isatty()
+
+
+@contextmanager
+def capture_thread_output():
+    """
+    Route stdout and stderr through per thread buffers while active.
+    """
+    stdout, stderr = sys.stdout, sys.stderr
+    sys.stdout = ThreadOutput(stdout)
+    sys.stderr = ThreadOutput(stderr)
+
+    try:
+        yield
+    finally:
+        sys.stdout, sys.stderr = stdout, stderr
+
+
+def invoke_command(command, args, obj=None):
+    """
+    Invoke a click command in process and return exit code and output.
+
+    Output is only captured when called within capture_thread_output.
+    Stdout and stderr are combined in the order they are written.
+    """
+    buffer = io.StringIO()
+    thread_output.buffer = buffer
+
+    try:
+        result = command.main(
+            args=list(args),
+            obj=obj,
+            prog_name='mash',
+            standalone_mode=False
+        )
+        exit_code = result if isinstance(result, int) else 0
+    except click.ClickException as error:
+        error.show()
+        exit_code = error.exit_code
+    except click.Abort:
+        click.echo('Aborted!', err=True)
+        exit_code = 1
+    except SystemExit as error:
+        if error.code is None or isinstance(error.code, int):
+            exit_code = error.code or 0
+        else:
+            click.echo(error.code, err=True)
+            exit_code = 1
+    except Exception as error:
+        click.echo('{0}: {1}'.format(type(error).__name__, error), err=True)
+        exit_code = 1
+    finally:
+        thread_output.buffer = None
+
+    return exit_code, buffer.getvalue()
@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+
+"""Registry of the clouds supported by the MASH server."""
+
+# Copyright (c) 2026 SUSE LLC. All rights reserved.
+#
+# This file is part of mash_client. mash_client provides a command line
+# utility for interfacing with a MASH server.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# The job and account commands of every cloud are generated from this
+# registry. It is kept free of third party imports so the shell
+# completion can use it.
+#
+# Each cloud has:
+#
+#   display_name     Name of the cloud in help texts.
+#   api_version      Default API version for job requests.
+#   credentials      Keys of the credentials dictionary built from the
+#                    options marked with credential. All of them are
+#                    required when updating credentials.
+#   account_fields   Options of account add and update:
+#
+#     option         The command line option.
+#     key            Key in the request, defaults to the option name.
+#     help           Help text of the option.
+#     required       Required when adding an account.
+#     add_only       Only available when adding an account.
+#     flag           Boolean flag, sent as True if set.
+#     choices        Allowed values.
+#     load           The option is a file path, the request gets the
+#                    file content parsed as json or as text.
+#     repl           The option is a flag that starts the named
+#                    interactive prompt for the value.
+#     credential     Value goes into the credentials dictionary.
+
+EC2_PARTITIONS = ('aws', 'aws-cn', 'aws-us-gov', 'aws-eusc')
+
+clouds = {
+    'aliyun': {
+        'display_name': 'Aliyun',
+        'api_version': 'v1',
+        'credentials': ('access_secret', 'access_key'),
+        'account_fields': (
+            {
+                'option': '--bucket',
+                'required': True,
+                'help': 'The storage bucket where images will be uploaded.'
+            },
+            {
+                'option': '--region',
+                'required': True,
+                'help': 'The region where the test instances will be '
+                        'launched.'
+            },
+            {
+                'option': '--security-group-id',
+                'help': 'The security group ID that will be used for '
+                        'launching test instances.'
+            },
+            {
+                'option': '--vswitch-id',
+                'help': 'The vswitch ID that will be used for launching '
+                        'test instances.'
+            },
+            {
+                'option': '--access-key',
+                'required': True,
+                'credential': True,
+                'help': 'Aliyun access key.'
+            },
+            {
+                'option': '--access-secret',
+                'required': True,
+                'credential': True,
+                'help': 'Aliyun access key secret.'
+            }
+        )
+    },
+    'azure': {
+        'display_name': 'Azure',
+        'api_version': 'v1',
+        'account_fields': (
+            {
+                'option': '--region',
+                'required': True,
+                'help': 'The region where the test instance will be '
+                        'launched.'
+            },
+            {
+                'option': '--source-container',
+                'required': True,
+                'help': 'The name of the container that images will be '
+                        'uploaded to and tested.'
+            },
+            {
+                'option': '--source-resource-group',
+                'required': True,
+                'help': 'The name of the resource group where the source '
+                        'storage account exists.'
+            },
+            {
+                'option': '--source-storage-account',
+                'required': True,
+                'help': 'The name of the ARM based storage account where '
+                        'the source container exists.'
+            },
+            {
+                'option': '--credentials',
+                'required': True,
+                'load': 'json',
+                'help': 'The JSON service account credentials file.'
+            }
+        )
+    },
+    'ec2': {
+        'display_name': 'EC2',
+        'api_version': 'v1',
+        'credentials': ('secret_access_key', 'access_key_id'),
+        'account_fields': (
+            {
+                'option': '--test-regions',
+                'repl': 'test_regions',
+                'help': 'Invoke test region addition process to specify '
+                        'information for test regions'
+            },
+            {
+                'option': '--additional-regions',
+                'repl': 'additional_regions',
+                'help': 'Invoke region addition process to specify '
+                        'information for additional regions'
+            },
+            {
+                'option': '--group',
+                'help': 'Group name to associate the account with.'
+            },
+            {
+                'option': '--partition',
+                'required': True,
+                'add_only': True,
+                'choices': EC2_PARTITIONS,
+                'help': 'The location of the EC2 account. '
+                        '["aws", "aws-cn", "aws-us-gov", "aws-eusc"]'
+            },
+            {
+                'option': '--region',
+                'required': True,
+                'help': 'The target region for image upload and testing.'
+            },
+            {
+                'option': '--subnet',
+                'help': 'An optional subnet id for image upload and '
+                        'testing.'
+            },
+            {
+                'option': '--access-key-id',
+                'required': True,
+                'credential': True,
+                'help': 'AWS access key.'
+            },
+            {
+                'option': '--secret-access-key',
+                'required': True,
+                'credential': True,
+                'help': 'AWS secret access key.'
+            }
+        )
+    },
+    'gce': {
+        'display_name': 'GCE',
+        'api_version': 'v1',
+        'account_fields': (
+            {
+                'option': '--bucket',
+                'required': True,
+                'help': 'The storage bucket where images will be uploaded.'
+            },
+            {
+                'option': '--zone',
+                'key': 'region',
+                'required': True,
+                'help': 'The zone where the test instances will be '
+                        'launched.'
+            },
+            {
+                'option': '--testing-account',
+                'help': 'The name of the testing account that will be used '
+                        'for launching test instances.'
+            },
+            {
+                'option': '--is-publishing-account',
+                'add_only': True,
+                'flag': True,
+                'help': 'The new account is a publishing account.'
+            },
+            {
+                'option': '--credentials',
+                'required': True,
+                'load': 'json',
+                'help': 'The JSON service account credentials file.'
+            }
+        )
+    },
+    'oci': {
+        'display_name': 'OCI',
+        'api_version': 'v1',
+        'account_fields': (
+            {
+                'option': '--bucket',
+                'required': True,
+                'help': 'The storage bucket where images will be uploaded.'
+            },
+            {
+                'option': '--region',
+                'required': True,
+                'help': 'The region where the test instances will be '
+                        'launched.'
+            },
+            {
+                'option': '--availability-domain',
+                'required': True,
+                'help': 'The availability domain that will be used for '
+                        'launching test instances.'
+            },
+            {
+                'option': '--compartment-id',
+                'required': True,
+                'help': 'The compartment ID where the images will stored.'
+            },
+            {
+                'option': '--oci-user-id',
+                'required': True,
+                'help': 'The ID for the OCI user.'
+            },
+            {
+                'option': '--tenancy',
+                'required': True,
+                'help': 'The OCI tenancy where the user exists.'
+            },
+            {
+                'option': '--signing-key-file',
+                'key': 'signing_key',
+                'required': True,
+                'load': 'text',
+                'help': 'The path to the private signing key used for '
+                        'validating OCI API calls.'
+            }
+        )
+    }
+}
+
+
+def get_field_name(field):
+    """
+    Return the parameter name of an account field option.
+    """
+    return field['option'].lstrip('-').replace('-', '_')
@@ -0,0 +1,359 @@
+# -*- coding: utf-8 -*-
+
+"""Shell completion of server side values from a local cache."""
+
+# Copyright (c) 2026 SUSE LLC. All rights reserved.
+#
+# This file is part of mash_client. mash_client provides a command line
+# utility for interfacing with a MASH server.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Completion requests are served before the CLI is imported. Keep the
+# imports of this module limited to the standard library.
+import glob
+import json
+import os
+import shlex
+import subprocess
+import sys
+import time
+
+from mash_client.clouds import clouds
+from mash_client.paths import default_config_dir
+
+default_ttl = 300
+refresh_lock_timeout = 60
+completion_shells = {
+    'bash_complete': 'bash',
+    'zsh_complete': 'zsh',
+    'fish_complete': 'fish'
+}
+
+
+def get_cache_file(config_dir, profile):
+    return ''.join([config_dir, profile, '_completion.json'])
+
+
+def read_cache(config_dir, profile):
+    """
+    Return the completion cache for a profile.
+
+    If the cache is missing or older than its TTL a refresh is started
+    in the background. The cache is never refreshed in the foreground.
+    """
+    cache_file = get_cache_file(config_dir, profile)
+
+    try:
+        with open(cache_file) as cache:
+            data = json.load(cache)
+    except (OSError, ValueError):
+        data = {}
+
+    if time.time() - data.get('updated', 0) > data.get('ttl', default_ttl):
+        start_background_refresh(config_dir, profile)
+
+    return data
+
+
+def start_background_refresh(config_dir, profile):
+    """
+    Refresh the completion cache in a detached process.
+
+    A lock file prevents concurrent refreshes of the same profile.
+    """
+    lock_file = get_cache_file(config_dir, profile) + '.lock'
+
+    try:
+        if time.time() - os.path.getmtime(lock_file) < refresh_lock_timeout:
+            return
+
+        os.remove(lock_file)
+    except OSError:
+        pass
+
+    try:
+        os.close(os.open(lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+    except OSError:
+        return
+
+    subprocess.Popen(
+        [
+            sys.executable, '-m', 'mash_client.completion',
+            config_dir, profile
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+        close_fds=True
+    )
+
+
+def refresh_cache(config_dir, profile, pages=5, per_page=100):
+    """
+    Download completion values from the MASH server into the cache.
+
+    Stores the most recent job ids, the account names of each cloud
+    and the token jtis. Sections that fail to download are kept from
+    the previous cache.
+    """
+    from mash_client.cli_utils import get_config, handle_request_with_token
+    from mash_client.controller import list_user_jobs
+
+    config_data = get_config({'config_dir': config_dir, 'profile': profile})
+    cache_file = get_cache_file(config_dir, profile)
+
+    try:
+        with open(cache_file) as cache:
+            data = json.load(cache)
+    except (OSError, ValueError):
+        data = {}
+
+    try:
+        jobs = []
+        for page in range(1, pages + 1):
+            result = list_user_jobs(config_data, page=page, per_page=per_page)
+            jobs += [
+                [job['job_id'], ' '.join(filter(None, [
+                    job.get('state'), job.get('image')
+                ]))]
+                for job in result
+            ]
+
+            if len(result) < per_page:
+                break
+
+        data['jobs'] = jobs
+    except Exception:
+        pass
+
+    accounts = data.get('accounts', {})
+    for cloud in clouds:
+        try:
+            result = handle_request_with_token(
+                config_data,
+                '/v1/accounts/{cloud}/'.format(cloud=cloud),
+                action='get'
+            )
+            accounts[cloud] = [account['name'] for account in result]
+        except Exception:
+            pass
+
+    data['accounts'] = accounts
+
+    try:
+        result = handle_request_with_token(
+            config_data,
+            '/v1/auth/token',
+            action='get'
+        )
+        data['tokens'] = [token['jti'] for token in result]
+    except Exception:
+        pass
+
+    data['updated'] = time.time()
+    data['ttl'] = int(config_data.get('completion_ttl', default_ttl))
+
+    temp_file = cache_file + '.tmp'
+    with open(temp_file, 'w') as cache:
+        json.dump(data, cache)
+
+    os.replace(temp_file, cache_file)
+
+
+def run_refresh(config_dir, profile):
+    """
+    Refresh the completion cache and release the refresh lock.
+    """
+    try:
+        refresh_cache(config_dir, profile)
+    finally:
+        lock_file = get_cache_file(config_dir, profile) + '.lock'
+
+        if os.path.exists(lock_file):
+            os.remove(lock_file)
+
+
+def list_profiles(config_dir=None):
+    """
+    Return the names of all profiles in the config directory.
+    """
+    config_dir = config_dir or default_config_dir
+    return sorted(
+        os.path.basename(path)[:-len('.yaml')]
+        for path in glob.glob(os.path.join(config_dir, '*.yaml'))
+    )
+
+
+def get_completions(option, config_dir, profile, cloud=None):
+    """
+    Return (value, help) tuples for an option from the cache.
+    """
+    config_dir = config_dir or default_config_dir
+
+    if option == '--profile':
+        return [(name, '') for name in list_profiles(config_dir)]
+
+    data = read_cache(config_dir, profile or 'default')
+
+    if option == '--job-id':
+        return [tuple(job) for job in data.get('jobs', [])]
+    elif option == '--name' and cloud:
+        return [(name, '') for name in data.get('accounts', {}).get(cloud, [])]
+    elif option == '--jti':
+        return [(jti, '') for jti in data.get('tokens', [])]
+
+    return []
+
+
+def get_option_value(args, *names):
+    value = None
+
+    for index, arg in enumerate(args[:-1]):
+        if arg in names:
+            value = args[index + 1]
+
+    return value
+
+
+def get_completion_args(shell):
+    """
+    Return command line arguments and incomplete word like click.
+    """
+    def split(value):
+        try:
+            return shlex.split(value)
+        except ValueError:
+            return shlex.split(value + '"')
+
+    words = split(os.environ.get('COMP_WORDS', ''))
+
+    if shell == 'fish':
+        incomplete = os.environ.get('COMP_CWORD', '')
+        incomplete = split(incomplete)[0] if incomplete else ''
+        args = words[1:]
+
+        if incomplete and args and args[-1] == incomplete:
+            args.pop()
+    else:
+        cword = int(os.environ.get('COMP_CWORD', 0))
+        args = words[1:cword]
+        incomplete = words[cword] if cword < len(words) else ''
+
+    return args, incomplete
+
+
+def format_completion(shell, value, help_text):
+    if shell == 'zsh':
+        if help_text:
+            return 'plain\n{0}\n{1}'.format(
+                value.replace(':', r'\:'),
+                help_text
+            )
+
+        return 'plain\n{0}\n_'.format(value)
+    elif shell == 'fish' and help_text:
+        return 'plain,{0}\t{1}'.format(value, help_text)
+
+    return 'plain,{0}'.format(value)
+
+
+def fast_complete():
+    """
+    Serve completion of cached option values without importing the CLI.
+
+    Returns False if the completion request has to be handled by click.
+    """
+    shell = completion_shells.get(os.environ.get('_MASH_COMPLETE'))
+
+    if not shell:
+        return False
+
+    args, incomplete = get_completion_args(shell)
+
+    if not args or args[-1] not in ('--job-id', '--name', '--jti',
+                                    '--profile'):
+        return False
+
+    cloud = None
+    if args[-1] == '--name':
+        if 'account' not in args:
+            return False
+
+        index = args.index('account')
+        cloud = args[index + 1] if index + 1 < len(args) else None
+
+        if cloud not in clouds:
+            return False
+
+    completions = get_completions(
+        args[-1],
+        get_option_value(args, '-C', '--config-dir'),
+        get_option_value(args, '--profile'),
+        cloud
+    )
+    lines = [
+        format_completion(shell, value, help_text)
+        for value, help_text in completions
+        if value.startswith(incomplete)
+    ]
+
+    if lines:
+        sys.stdout.write('\n'.join(lines) + '\n')
+
+    return True
+
+
+def complete_option(ctx, param, incomplete):
+    """
+    Click shell_complete callback for options with cached values.
+    """
+    from click.shell_completion import CompletionItem
+
+    root_params = ctx.find_root().params
+    cloud = None
+
+    if ctx.parent and ctx.parent.info_name in clouds:
+        cloud = ctx.parent.info_name
+
+    completions = get_completions(
+        max(param.opts, key=len),
+        root_params.get('config_dir'),
+        root_params.get('profile'),
+        cloud
+    )
+    return [
+        CompletionItem(value, help=help_text or None)
+        for value, help_text in completions
+        if value.startswith(incomplete)
+    ]
+
+
+def main():
+    """
+    Entry point of the mash command.
+
+    Answers completion requests for cached values directly and hands
+    everything else to the click CLI.
+    """
+    if fast_complete():
+        sys.exit(0)
+
+    from mash_client.cli import main as cli_main
+    cli_main()
+
+
+if __name__ == '__main__':
+    run_refresh(sys.argv[1], sys.argv[2])
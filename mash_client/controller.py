@@ -20,7 +20,14 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import fnmatch
+import itertools
 import json
+import re
+
+from contextlib import suppress
+from datetime import datetime, timezone
+from string import Template
 
 from mash_client.cli_utils import (
     handle_request,
@@ -28,8 +35,12 @@ from mash_client.cli_utils import (
     get_tokens_file,
     get_tokens_from_file,
     get_annotated_property,
-    handle_request_with_token
+    handle_request_with_token,
+    handle_stream_request_with_token
 )
+from mash_client.clouds import clouds
+from mash_client.mash_client_exceptions import MashClientException
+from mash_client.timeline import record_job_state
 
 
 def get_job_schema_by_cloud(
@@ -174,7 +185,110 @@ def list_user_jobs(
     )
 
 
-def get_job_status(config_data, job_id, raise_for_status=True):
+def iter_user_jobs(config_data, per_page=None, api_version='v1'):
+    """
+    Yield all jobs of the user one at a time.
+
+    Pages of per_page jobs (default 100) are requested in order until
+    a page is not full. Each page is parsed as it is received so memory
+    use does not grow with the number of jobs.
+    """
+    per_page = per_page or 100
+    page = 1
+
+    while True:
+        count = 0
+        jobs = handle_stream_request_with_token(
+            config_data,
+            '/{api_version}/jobs/'.format(api_version=api_version),
+            job_data={'page': page, 'per_page': per_page},
+            action='get'
+        )
+
+        for job in jobs.items():
+            count += 1
+            yield job
+
+        if count < per_page:
+            return
+
+        page += 1
+
+
+def parse_duration(value):
+    """
+    Return the number of seconds of a duration such as 30d or 12h.
+
+    Supported units are s, m, h, d and w. Without a unit the value
+    is in days.
+    """
+    units = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+    match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([smhdw]?)\s*', value)
+
+    if not match:
+        raise MashClientException(
+            'Invalid duration: {0}. Expected a number with an optional '
+            'unit s, m, h, d or w. Example: 30d'.format(value)
+        )
+
+    return float(match.group(1)) * units[match.group(2) or 'd']
+
+
+def get_job_start_time(job):
+    """
+    Return the start time of a job as a UTC timestamp or None.
+    """
+    try:
+        start_time = datetime.strptime(
+            job['start_time'][:19].replace(' ', 'T'),
+            '%Y-%m-%dT%H:%M:%S'
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+    return start_time.replace(tzinfo=timezone.utc).timestamp()
+
+
+def match_job(
+    job, states=None, clouds=None, older_than=None, pattern=None,
+    now=None
+):
+    """
+    Return True if the job matches all of the given filters.
+
+    older_than is a number of seconds and pattern a shell style
+    pattern matched against the job id and image name. Jobs without
+    a valid start time never match older_than.
+    """
+    if states and job.get('state') not in states:
+        return False
+
+    if clouds and job.get('cloud') not in clouds:
+        return False
+
+    if older_than is not None:
+        start_time = get_job_start_time(job)
+        now = now or datetime.now(timezone.utc).timestamp()
+
+        if start_time is None or now - start_time < older_than:
+            return False
+
+    if pattern and not any(
+        fnmatch.fnmatchcase(str(job.get(key) or ''), pattern)
+        for key in ('job_id', 'image')
+    ):
+        return False
+
+    return True
+
+
+def get_job_status(config_data, job_id, raise_for_status=True, record=True):
+    """
+    Return the state and current service of a job.
+
+    Unless record is False state changes are recorded for the job
+    timeline.
+    """
     result = handle_request_with_token(
         config_data,
         '/v1/jobs/{0}'.format(job_id),
@@ -185,6 +299,16 @@ def get_job_status(config_data, job_id, raise_for_status=True):
     if 'state' not in result:
         return result
 
+    if record:
+        # The timeline is best effort and never fails a status request
+        with suppress(OSError):
+            record_job_state(
+                config_data,
+                job_id,
+                result,
+                get_job_start_time(result)
+            )
+
     status_info = {'state': result['state']}
 
     if result['state'] == 'running' and 'current_service' in result:
@@ -206,6 +330,13 @@ def get_job_test_results(config_data, job_id, raise_for_status=True):
         # job_id is required in all jobs.
         return result
 
+    return parse_job_test_results(result)
+
+
+def parse_job_test_results(result):
+    """
+    Return the decoded test results of a job with data.
+    """
     try:
         raw_test_results = result['data']['test_results']
     except KeyError:
@@ -226,15 +357,8 @@ def add_job(
     api_version=None,
     raise_for_status=True
 ):
-    versions = {
-        'aliyun': 'v1',
-        'azure': 'v1',
-        'ec2': 'v1',
-        'gce': 'v1',
-        'oci': 'v1'
-    }
     if not api_version:
-        api_version = versions[cloud]
+        api_version = clouds[cloud]['api_version']
 
     return handle_request_with_token(
         config_data,
@@ -245,3 +369,75 @@ def add_job(
         job_data,
         raise_for_status=raise_for_status
     )
+
+
+def render_job_template(template, variables):
+    """
+    Substitute ${name} placeholders in all strings of a job template.
+
+    A string consisting of a single placeholder is replaced by the
+    variable value itself which allows non string values.
+    """
+    if isinstance(template, dict):
+        return {
+            key: render_job_template(value, variables)
+            for key, value in template.items()
+        }
+    elif isinstance(template, list):
+        return [render_job_template(value, variables) for value in template]
+    elif isinstance(template, str):
+        match = re.fullmatch(r'\$\{(\w+)\}', template)
+
+        if match and match.group(1) in variables:
+            return variables[match.group(1)]
+
+        return Template(template).safe_substitute(variables)
+
+    return template
+
+
+def expand_job_matrix(template, matrix):
+    """
+    Yield variables and job document for each matrix combination.
+
+    The matrix maps variable names to a list of values. Documents are
+    rendered for the cartesian product of all variables.
+    """
+    names = list(matrix)
+    values = [
+        value if isinstance(value, list) else [value]
+        for value in matrix.values()
+    ]
+
+    for combination in itertools.product(*values):
+        variables = dict(zip(names, combination))
+        yield variables, render_job_template(template, variables)
+
+
+def validate_job_document(job_data, schema):
+    """
+    Return a list of problems found in a rendered job document.
+
+    Checks for unresolved template placeholders and required or
+    unknown properties based on the job schema.
+    """
+    errors = []
+    unresolved = sorted(set(re.findall(r'\$\{(\w+)\}', json.dumps(job_data))))
+
+    if unresolved:
+        errors.append(
+            'Unresolved template variables: {0}'.format(', '.join(unresolved))
+        )
+
+    for key in schema.get('required', []):
+        if key not in job_data:
+            errors.append("'{0}' is a required property".format(key))
+
+    if schema.get('additionalProperties') is False:
+        for key in job_data:
+            if key not in schema.get('properties', {}) and key != 'dry_run':
+                errors.append(
+                    "Additional property '{0}' is not allowed".format(key)
+                )
+
+    return errors
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+"""Deduplication of identical job submissions."""
+
+# Copyright (c) 2026 SUSE LLC. All rights reserved.
+#
+# This file is part of mash_client. mash_client provides a command line
+# utility for interfacing with a MASH server.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import hashlib
+import json
+import time
+
+from mash_client.cli_utils import JSONFile
+from mash_client.controller import add_job, get_job_status
+from mash_client.mash_client_exceptions import MashClientException
+from mash_client.ratelimit import get_state_file, locked_state
+
+# Submissions are forgotten after 30 days
+retention = 30 * 86400
+
+
+def get_document_hash(cloud, job_data):
+    """
+    Return the hash of a normalized job document.
+
+    Key order and whitespace of the document do not change the hash.
+    """
+    if isinstance(job_data, JSONFile):
+        job_data = job_data.load()
+
+    document = json.dumps(
+        {'cloud': cloud, 'document': job_data},
+        sort_keys=True,
+        separators=(',', ':')
+    )
+    return hashlib.sha256(document.encode()).hexdigest()
+
+
+def add_job_deduplicated(
+    config_data, job_data, cloud, window, api_version=None, submit=add_job
+):
+    """
+    Submit a job unless an identical document was submitted recently.
+
+    If the same document was submitted within window seconds and the
+    job still exists and has not failed, the existing job is returned
+    instead. Submissions are recorded per server in the submissions
+    state file. Errors other than a deleted job are raised, so a job is
+    not submitted again while the server cannot be reached.
+    """
+    state_file = get_state_file(config_data, 'submissions')
+    doc_hash = get_document_hash(cloud, job_data)
+
+    with locked_state(state_file) as state:
+        entry = state.get(doc_hash)
+
+    if entry and time.time() - entry['submitted'] <= window:
+        try:
+            status = get_job_status(config_data, entry['job_id'])
+        except MashClientException as error:
+            if error.status_code != 404:
+                raise
+
+            # The job has been deleted
+            status = {}
+
+        if status.get('state') and status['state'] != 'failed':
+            return dict(status, job_id=entry['job_id'], duplicate=True)
+
+    result = submit(config_data, job_data, cloud, api_version=api_version)
+
+    if result.get('job_id'):
+        with locked_state(state_file) as state:
+            now = time.time()
+
+            for key in [
+                key for key, value in state.items()
+                if now - value['submitted'] > retention
+            ]:
+                del state[key]
+
+            state[doc_hash] = {
+                'job_id': result['job_id'],
+                'submitted': now
+            }
+
+    return result
@@ -0,0 +1,482 @@
+# -*- coding: utf-8 -*-
+
+"""Diagnostics of the performance of the client and its server."""
+
+# Copyright (c) 2026 SUSE LLC. All rights reserved.
+#
+# This file is part of mash_client. mash_client provides a command line
+# utility for interfacing with a MASH server.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import glob
+import json
+import os
+import socket
+import ssl
+import subprocess
+import sys
+import time
+
+from urllib.parse import urlparse
+
+import jwt
+
+from mash_client.breaker import get_circuit_breaker
+from mash_client.cache import get_response_cache
+from mash_client.cli_utils import (
+    config_cache,
+    create_session,
+    get_config,
+    get_tokens_file,
+    handle_request,
+    handle_request_with_token
+)
+from mash_client.spool import get_spool_dir, list_spool
+from mash_client.unix_socket import get_unix_socket_path, is_unix_socket_url
+
+# Durations in seconds above which a check is a warning
+thresholds = {
+    'import': 1.0,
+    'config': 0.05,
+    'dns': 0.1,
+    'connect': 0.1,
+    'tls': 0.2,
+    'rtt': 0.5,
+    'auth': 1.0
+}
+
+# Access tokens expiring sooner are refreshed by the next command
+token_margin = 300
+
+
+def timed(func, *args, **kwargs):
+    """
+    Return the result of func and the seconds it took.
+    """
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def make_check(name, status, value, message, suggestion=None):
+    check = {
+        'check': name,
+        'status': status,
+        'value': value,
+        'message': message
+    }
+
+    if suggestion:
+        check['suggestion'] = suggestion
+
+    return check
+
+
+def duration_check(name, seconds, message, suggestion):
+    """
+    Return a check of a duration compared to its threshold.
+    """
+    slow = seconds > thresholds[name]
+
+    return make_check(
+        name,
+        'warning' if slow else 'ok',
+        round(seconds * 1000, 1),
+        '{0} took {1:.1f} ms'.format(message, seconds * 1000),
+        suggestion if slow else None
+    )
+
+
+def check_import():
+    """
+    Measure the startup and import time of a new mash process.
+    """
+    def run(code):
+        return timed(
+            subprocess.run,
+            [sys.executable, '-c', code],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )[1]
+
+    try:
+        interpreter = run('pass')
+        startup = run('import mash_client.cli')
+    except (OSError, subprocess.CalledProcessError) as error:
+        return make_check(
+            'import', 'warning', None,
+            'Unable to measure the import time: {0}'.format(error)
+        )
+
+    check = duration_check(
+        'import',
+        startup,
+        'Starting mash',
+        'Run many commands in one process with `mash batch`.'
+    )
+    check['message'] += ' ({0:.1f} ms for the interpreter)'.format(
+        interpreter * 1000
+    )
+    return check
+
+
+def check_config(cli_context):
+    """
+    Measure loading the config without the config file cache.
+    """
+    config_cache.clear()
+    config_data, seconds = timed(get_config, cli_context)
+
+    return config_data, duration_check(
+        'config',
+        seconds,
+        'Loading the config',
+        'Reduce the size of the profile YAML file.'
+    )
+
+
+def get_address(config_data):
+    """
+    Return the host and port of the server in config.
+    """
+    url = urlparse(config_data['url'])
+    port = url.port or (443 if url.scheme == 'https' else 80)
+    return url.hostname, port
+
+
+def check_unix_socket(config_data):
+    """
+    Measure connecting to the Unix domain socket of the server.
+    """
+    socket_path = get_unix_socket_path(config_data['url'])
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(float(config_data.get('connect_timeout', 10)))
+
+    try:
+        seconds = timed(sock.connect, socket_path)[1]
+    except OSError as error:
+        return make_check(
+            'connect', 'error', None,
+            'Unable to connect to {0}: {1}'.format(socket_path, error),
+            'Check that the MASH server is listening on the socket.'
+        )
+    finally:
+        sock.close()
+
+    return duration_check(
+        'connect',
+        seconds,
+        'Connecting to {0}'.format(socket_path),
+        'The server accepts connections slowly, check its load.'
+    )
+
+
+def check_network(config_data):
+    """
+    Measure name resolution, TCP connect and TLS handshake.
+    """
+    if is_unix_socket_url(config_data['url']):
+        # There is no name to resolve and no TLS on a socket path
+        return [check_unix_socket(config_data)]
+
+    host, port = get_address(config_data)
+    checks = []
+
+    try:
+        addresses, seconds = timed(
+            socket.getaddrinfo, host, port, type=socket.SOCK_STREAM
+        )
+    except socket.gaierror as error:
+        return [make_check(
+            'dns', 'error', None,
+            'Unable to resolve {0}: {1}'.format(host, error),
+            'Check the host in the profile.'
+        )]
+
+    checks.append(duration_check(
+        'dns',
+        seconds,
+        'Resolving {0}'.format(host),
+        'Use a local caching resolver or an address in the host option.'
+    ))
+
+    family, sock_type, proto, canonname, address = addresses[0]
+    connect_timeout = float(config_data.get('connect_timeout', 10))
+
+    try:
+        sock, seconds = timed(
+            socket.create_connection, address[:2], connect_timeout
+        )
+    except OSError as error:
+        checks.append(make_check(
+            'connect', 'error', None,
+            'Unable to connect to {0}:{1}: {2}'.format(
+                address[0], port, error
+            ),
+            'Check that the MASH server is running and reachable.'
+        ))
+        return checks
+
+    checks.append(duration_check(
+        'connect',
+        seconds,
+        'Connecting to {0}:{1}'.format(address[0], port),
+        'The network latency to the server is high, run mash closer to '
+        'the server.'
+    ))
+
+    try:
+        if urlparse(config_data['url']).scheme == 'https':
+            context = ssl.create_default_context()
+
+            if not config_data.get('verify', True):
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+
+            try:
+                sock, seconds = timed(
+                    context.wrap_socket, sock, server_hostname=host
+                )
+            except (OSError, ssl.SSLError) as error:
+                checks.append(make_check(
+                    'tls', 'error', None,
+                    'TLS handshake failed: {0}'.format(error),
+                    'Check the certificate of the server and the verify '
+                    'option.'
+                ))
+                return checks
+
+            check = duration_check(
+                'tls',
+                seconds,
+                'The {0} handshake'.format(sock.version()),
+                'Reuse connections by running many commands with '
+                '`mash batch`.'
+            )
+            checks.append(check)
+    finally:
+        sock.close()
+
+    return checks
+
+
+def check_rtt(config_data, count=3):
+    """
+    Measure requests to the server through the client request path.
+
+    The first request opens the connection, the round trip time is the
+    fastest of the following requests on the same connection.
+    """
+    endpoint = '/v1/jobs/ec2/'
+    durations = []
+    config_data = dict(config_data, session=create_session(config_data, 1))
+
+    try:
+        for request in range(count):
+            durations.append(timed(
+                handle_request, config_data, endpoint, action='get'
+            )[1])
+    except Exception as error:
+        return make_check(
+            'rtt', 'error', None,
+            'Request to {0} failed: {1}'.format(config_data['url'], error),
+            'Check that the MASH server is running and reachable.'
+        )
+
+    check = duration_check(
+        'rtt',
+        min(durations[1:] or durations),
+        'A request on an open connection',
+        'The server responds slowly, check its load.'
+    )
+    check['message'] += ' ({0:.1f} ms with connecting)'.format(
+        durations[0] * 1000
+    )
+    return check
+
+
+def get_expiry(token):
+    try:
+        return jwt.decode(
+            token,
+            options={'verify_signature': False}
+        ).get('exp')
+    except jwt.PyJWTError:
+        return None
+
+
+def check_token(config_data):
+    """
+    Check the expiry of the tokens and an authenticated request.
+    """
+    tokens_file = get_tokens_file(
+        config_data['config_dir'],
+        config_data['profile']
+    )
+    login = 'Login with `mash auth login`.'
+
+    try:
+        with open(tokens_file) as tokens_data:
+            tokens = json.load(tokens_data)
+    except (OSError, ValueError):
+        return make_check(
+            'auth', 'error', None, 'No tokens available.', login
+        )
+
+    now = time.time()
+    access_exp = get_expiry(tokens.get('access_token', ''))
+    refresh_exp = get_expiry(tokens.get('refresh_token', ''))
+
+    if refresh_exp and refresh_exp <= now and (
+        not access_exp or access_exp <= now + token_margin
+    ):
+        return make_check(
+            'auth', 'error', None, 'The refresh token has expired.', login
+        )
+
+    if not tokens.get('refresh_token') and (
+        not access_exp or access_exp <= now + token_margin
+    ):
+        return make_check(
+            'auth', 'error', None,
+            'The access token expires and there is no refresh token.',
+            login
+        )
+
+    try:
+        result, seconds = timed(
+            handle_request_with_token,
+            config_data,
+            '/v1/user/',
+            action='get'
+        )
+    except Exception as error:
+        return make_check(
+            'auth', 'error', None,
+            'Authenticated request failed: {0}'.format(error),
+            login
+        )
+
+    check = duration_check(
+        'auth',
+        seconds,
+        'An authenticated request',
+        'The token was refreshed or the server is slow, check its load.'
+    )
+
+    if access_exp and access_exp > now:
+        check['message'] += ', the access token expires in {0:.0f} ' \
+            'seconds'.format(access_exp - now)
+
+        if refresh_exp:
+            check['message'] += ', the refresh token in {0:.0f} ' \
+                'seconds'.format(refresh_exp - now)
+    else:
+        check['message'] += ', the access token was refreshed'
+
+    return check
+
+
+def check_cache(config_data):
+    """
+    Report the size of the response cache.
+    """
+    cache = get_response_cache(config_data)
+
+    if not cache:
+        # The cache is optional and disabled by default
+        return make_check(
+            'cache', 'ok', None,
+            'The response cache is disabled, set cache_size in the '
+            'profile to reuse responses.'
+        )
+
+    entries = glob.glob(os.path.join(cache.cache_dir, '*.json'))
+    size = sum(os.path.getsize(entry) for entry in entries)
+
+    return make_check(
+        'cache', 'ok', len(entries),
+        '{0} cached responses using {1:.1f} of {2:.1f} MB in {3}'.format(
+            len(entries),
+            size / 1024.0 / 1024.0,
+            cache.max_size / 1024.0 / 1024.0,
+            cache.cache_dir
+        )
+    )
+
+
+def check_breaker(config_data):
+    """
+    Report whether requests are blocked by the circuit breaker.
+    """
+    breaker = get_circuit_breaker(config_data)
+
+    try:
+        with open(breaker.state_file) as state_file:
+            state = json.load(state_file)
+    except (OSError, ValueError):
+        state = {}
+
+    wait = state.get('open_until', 0) - time.time()
+
+    if state.get('failures', 0) >= breaker.threshold > 0 and wait > 0:
+        return make_check(
+            'breaker', 'warning', state['failures'],
+            'Requests are blocked for {0:.0f} seconds after {1} '
+            'consecutive failures.'.format(wait, state['failures']),
+            'Wait for the cooldown or check the server.'
+        )
+
+    return make_check(
+        'breaker', 'ok', state.get('failures', 0),
+        '{0} recent failures.'.format(state.get('failures', 0))
+    )
+
+
+def check_spool(config_data):
+    """
+    Report the job documents waiting in the spool.
+    """
+    spooled = len(list_spool(get_spool_dir(config_data)))
+
+    if spooled:
+        return make_check(
+            'spool', 'warning', spooled,
+            '{0} spooled job documents.'.format(spooled),
+            'Submit them with `mash spool flush`.'
+        )
+
+    return make_check('spool', 'ok', 0, 'No spooled job documents.')
+
+
+def run_diagnostics(cli_context):
+    """
+    Return the checks of the client and the server in config.
+    """
+    checks = [check_import()]
+    config_data, check = check_config(cli_context)
+    checks.append(check)
+
+    # Measure the request path without cached responses
+    config_data['no_cache'] = True
+
+    checks += check_network(config_data)
+    checks.append(check_rtt(config_data))
+    checks.append(check_token(config_data))
+    checks.append(check_cache(config_data))
+    checks.append(check_breaker(config_data))
+    checks.append(check_spool(config_data))
+    return checks
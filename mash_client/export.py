@@ -0,0 +1,379 @@
+# -*- coding: utf-8 -*-
+
+"""Export of jobs and test results to analytics formats."""
+
+# Copyright (c) 2026 SUSE LLC. All rights reserved.
+#
+# This file is part of mash_client. mash_client provides a command line
+# utility for interfacing with a MASH server.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import csv
+import itertools
+import json
+import os
+
+from mash_client.cli_utils import get_access_token, map_concurrently
+from mash_client.controller import get_job, iter_user_jobs
+from mash_client.mash_client_exceptions import MashClientException
+
+# (name, type) of the exported columns, types are int, float or str
+job_columns = (
+    ('job_id', str),
+    ('cloud', str),
+    ('state', str),
+    ('current_service', str),
+    ('failed_service', str),
+    ('last_service', str),
+    ('image', str),
+    ('cloud_architecture', str),
+    ('utctime', str),
+    ('start_time', str),
+    ('download_url', str),
+    ('num_tests', int),
+    ('passed', int),
+    ('failed', int),
+    ('skipped', int),
+    ('error', int),
+    ('test_duration', float),
+    ('data', str),
+    ('export_error', str)
+)
+test_case_columns = (
+    ('job_id', str),
+    ('test_index', int),
+    ('nodeid', str),
+    ('outcome', str),
+    ('duration', float)
+)
+export_formats = ('csv', 'ndjson', 'parquet', 'sqlite')
+
+
+def convert_value(value, column_type):
+    """
+    Return value converted to the column type or None.
+    """
+    if value is None or value == '':
+        return None
+
+    if column_type is str and isinstance(value, (dict, list)):
+        return json.dumps(value, sort_keys=True)
+
+    try:
+        return column_type(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def make_row(values, columns):
+    return {
+        name: convert_value(values.get(name), column_type)
+        for name, column_type in columns
+    }
+
+
+def flatten_job(job):
+    """
+    Return the job row and the test case rows of a job.
+
+    The test_results of the job data are parsed into one row per test
+    case and summary columns of the job row. The remaining data is
+    kept as a JSON string.
+    """
+    values = dict(job)
+    data = dict(values.pop('data', None) or {})
+    test_cases = []
+
+    try:
+        test_results = json.loads(data.pop('test_results'))
+    except (KeyError, TypeError, ValueError):
+        test_results = {}
+
+    summary = test_results.get('summary') or {}
+    values.update({
+        'num_tests': summary.get('num_tests'),
+        'passed': summary.get('passed'),
+        'failed': summary.get('failed'),
+        'skipped': summary.get('skipped'),
+        'error': summary.get('error'),
+        'test_duration': summary.get('duration'),
+        'data': data or None
+    })
+
+    for index, test in enumerate(test_results.get('tests') or []):
+        duration = test.get('duration')
+
+        if duration is None:
+            # pytest-json-report keeps the duration per test phase
+            duration = sum(
+                (test.get(phase) or {}).get('duration') or 0
+                for phase in ('setup', 'call', 'teardown')
+            ) or None
+
+        test_cases.append(make_row(
+            {
+                'job_id': job.get('job_id'),
+                'test_index': test.get('test_index', index),
+                'nodeid': test.get('nodeid'),
+                'outcome': test.get('outcome'),
+                'duration': duration
+            },
+            test_case_columns
+        ))
+
+    return make_row(values, job_columns), test_cases
+
+
+def get_test_cases_path(output):
+    """
+    Return the path of the test case table for file per table formats.
+    """
+    base, extension = os.path.splitext(output)
+    return '{0}_test_cases{1}'.format(base, extension)
+
+
+class CSVWriter(object):
+    """
+    Write jobs and test cases to two CSV files.
+    """
+
+    def __init__(self, output):
+        self.files = [
+            open(output, 'w', newline=''),
+            open(get_test_cases_path(output), 'w', newline='')
+        ]
+        self.writers = [
+            csv.DictWriter(
+                output_file,
+                [name for name, column_type in columns]
+            )
+            for output_file, columns in zip(
+                self.files,
+                (job_columns, test_case_columns)
+            )
+        ]
+
+        for writer in self.writers:
+            writer.writeheader()
+
+    def write(self, jobs, test_cases):
+        self.writers[0].writerows(jobs)
+        self.writers[1].writerows(test_cases)
+
+    def close(self):
+        for output_file in self.files:
+            output_file.close()
+
+
+class NDJSONWriter(object):
+    """
+    Write jobs and test cases to two newline delimited JSON files.
+    """
+
+    def __init__(self, output):
+        self.files = [
+            open(output, 'w'),
+            open(get_test_cases_path(output), 'w')
+        ]
+
+    def write(self, jobs, test_cases):
+        for output_file, rows in zip(self.files, (jobs, test_cases)):
+            for row in rows:
+                output_file.write(json.dumps(row) + '\n')
+
+    def close(self):
+        for output_file in self.files:
+            output_file.close()
+
+
+class SQLiteWriter(object):
+    """
+    Write jobs and test cases to the jobs and test_cases tables.
+
+    Existing tables are replaced.
+    """
+
+    column_types = {int: 'INTEGER', float: 'REAL', str: 'TEXT'}
+
+    def __init__(self, output):
+        # sqlite3 is only imported when exporting to a database
+        import sqlite3
+
+        self.connection = sqlite3.connect(output)
+        self.tables = (
+            ('jobs', job_columns),
+            ('test_cases', test_case_columns)
+        )
+
+        for table, columns in self.tables:
+            self.connection.execute('DROP TABLE IF EXISTS {0}'.format(table))
+            self.connection.execute('CREATE TABLE {0} ({1})'.format(
+                table,
+                ', '.join(
+                    '{0} {1}'.format(name, self.column_types[column_type])
+                    for name, column_type in columns
+                )
+            ))
+
+    def write(self, jobs, test_cases):
+        for (table, columns), rows in zip(self.tables, (jobs, test_cases)):
+            names = [name for name, column_type in columns]
+            self.connection.executemany(
+                'INSERT INTO {0} ({1}) VALUES ({2})'.format(
+                    table,
+                    ', '.join(names),
+                    ', '.join('?' * len(names))
+                ),
+                [[row[name] for name in names] for row in rows]
+            )
+
+        self.connection.commit()
+
+    def close(self):
+        self.connection.execute(
+            'CREATE INDEX IF NOT EXISTS test_cases_job_id '
+            'ON test_cases (job_id)'
+        )
+        self.connection.commit()
+        self.connection.close()
+
+
+class ParquetWriter(object):
+    """
+    Write jobs and test cases to two Parquet files.
+
+    Each batch of rows is written as a row group. pyarrow is only
+    imported when the parquet format is used.
+    """
+
+    column_types = {int: 'int64', float: 'float64', str: 'string'}
+
+    def __init__(self, output):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise MashClientException(
+                'The parquet format requires pyarrow: '
+                'pip install "mash-client[parquet]"'
+            )
+
+        self.pyarrow = pyarrow
+        self.schemas = [
+            pyarrow.schema([
+                (name, getattr(pyarrow, self.column_types[column_type])())
+                for name, column_type in columns
+            ])
+            for columns in (job_columns, test_case_columns)
+        ]
+        self.writers = [
+            pyarrow.parquet.ParquetWriter(path, schema)
+            for path, schema in zip(
+                (output, get_test_cases_path(output)),
+                self.schemas
+            )
+        ]
+
+    def write(self, jobs, test_cases):
+        for writer, schema, rows in zip(
+            self.writers,
+            self.schemas,
+            (jobs, test_cases)
+        ):
+            if rows:
+                writer.write_table(
+                    self.pyarrow.Table.from_pylist(rows, schema=schema)
+                )
+
+    def close(self):
+        for writer in self.writers:
+            writer.close()
+
+
+writers = {
+    'csv': CSVWriter,
+    'ndjson': NDJSONWriter,
+    'parquet': ParquetWriter,
+    'sqlite': SQLiteWriter
+}
+
+
+def export_jobs(
+    config_data, output, export_format, with_data=False, concurrency=4,
+    per_page=None, batch_size=None
+):
+    """
+    Export all jobs of the user to output in export_format.
+
+    Jobs are read from the job list page by page and written in
+    batches, so memory use is bounded by the batch size. With
+    with_data the full job including data and test results is
+    requested concurrently for each job of a batch. If a job cannot be
+    requested, for example because it was deleted meanwhile, the row
+    from the job list is written with the error in export_error.
+
+    Returns the number of exported jobs, test cases and jobs with an
+    export error.
+    """
+    batch_size = batch_size or concurrency * 10
+    writer = writers[export_format](output)
+    job_count = 0
+    test_case_count = 0
+    error_count = 0
+
+    try:
+        if with_data:
+            get_access_token(config_data)
+
+        jobs = iter_user_jobs(config_data, per_page=per_page)
+
+        while True:
+            batch = list(itertools.islice(jobs, batch_size))
+
+            if not batch:
+                break
+
+            if with_data:
+                results = map_concurrently(
+                    lambda job: get_job(config_data, job['job_id']),
+                    batch,
+                    concurrency
+                )
+
+                jobs_data = []
+                for job, (result, error) in zip(batch, results):
+                    if error:
+                        result = dict(job, export_error=str(error))
+                        error_count += 1
+
+                    jobs_data.append(result)
+
+                batch = jobs_data
+
+            job_rows = []
+            test_case_rows = []
+
+            for job in batch:
+                job_row, test_cases = flatten_job(job)
+                job_rows.append(job_row)
+                test_case_rows += test_cases
+
+            writer.write(job_rows, test_case_rows)
+            job_count += len(job_rows)
+            test_case_count += len(test_case_rows)
+    finally:
+        writer.close()
+
+    return job_count, test_case_count, error_count
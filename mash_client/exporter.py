@@ -0,0 +1,372 @@
+# -*- coding: utf-8 -*-
+
+"""Prometheus metrics of MASH jobs and accounts."""
+
+# Copyright (c) 2026 SUSE LLC. All rights reserved.
+#
+# This file is part of mash_client. mash_client provides a command line
+# utility for interfacing with a MASH server.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import threading
+import time
+
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from mash_client.cli_utils import handle_request_with_token
+from mash_client.clouds import clouds
+from mash_client.controller import iter_user_jobs
+from mash_client.mash_client_exceptions import MashClientException
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+latency_buckets = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def parse_listen(listen):
+    """
+    Return the (host, port) tuple of a [HOST]:PORT listen address.
+
+    An empty host listens on all interfaces.
+    """
+    host, _, port = listen.rpartition(':')
+
+    try:
+        port = int(port)
+    except ValueError:
+        raise MashClientException(
+            'Invalid listen address {0}, expected [HOST]:PORT.'.format(
+                listen
+            )
+        )
+
+    return host.strip('[]'), port
+
+
+def format_labels(labels):
+    """
+    Return the labels of a sample in the text exposition format.
+    """
+    if not labels:
+        return ''
+
+    return '{{{0}}}'.format(','.join(
+        '{0}="{1}"'.format(
+            name,
+            str(value).replace('\\', r'\\').replace('"', r'\"').replace(
+                '\n', r'\n'
+            )
+        )
+        for name, value in labels
+    ))
+
+
+def format_metric(name, metric_type, help_text, samples):
+    """
+    Return the lines of a metric family.
+
+    samples is a list of (suffix, labels, value) tuples where labels
+    is a list of (name, value) tuples.
+    """
+    lines = [
+        '# HELP {0} {1}'.format(name, help_text),
+        '# TYPE {0} {1}'.format(name, metric_type)
+    ]
+
+    for suffix, labels, value in samples:
+        lines.append('{0}{1}{2} {3}'.format(
+            name,
+            suffix,
+            format_labels(labels),
+            repr(float(value))
+        ))
+
+    return lines
+
+
+class Histogram(object):
+    """
+    Thread safe histogram of observations per label values.
+    """
+
+    def __init__(self, label_names, buckets=latency_buckets):
+        self.label_names = label_names
+        self.buckets = buckets
+        self.lock = threading.Lock()
+        self.values = {}
+
+    def observe(self, label_values, value):
+        with self.lock:
+            counts, total, count = self.values.get(
+                label_values,
+                ([0] * len(self.buckets), 0.0, 0)
+            )
+            counts = [
+                bucket_count + (value <= bound)
+                for bucket_count, bound in zip(counts, self.buckets)
+            ]
+            self.values[label_values] = (counts, total + value, count + 1)
+
+    def samples(self):
+        """
+        Return the cumulative bucket, sum and count samples.
+        """
+        samples = []
+
+        with self.lock:
+            values = sorted(self.values.items())
+
+        for label_values, (counts, total, count) in values:
+            labels = list(zip(self.label_names, label_values))
+
+            for bound, bucket_count in zip(self.buckets, counts):
+                samples.append(
+                    ('_bucket', labels + [('le', repr(bound))], bucket_count)
+                )
+
+            samples.append(('_bucket', labels + [('le', '+Inf')], count))
+            samples.append(('_sum', labels, total))
+            samples.append(('_count', labels, count))
+
+        return samples
+
+
+class JobExporter(object):
+    """
+    Collect job and account metrics of a MASH server in the background.
+
+    The job list and the accounts of every cloud are requested every
+    interval seconds over the session of config_data and the metrics
+    are rendered once per refresh. Scrapes are served from the rendered
+    metrics so the load on the MASH server does not depend on the
+    number of scrapes.
+    """
+
+    def __init__(self, config_data, interval=60, per_page=None):
+        self.config_data = config_data
+        self.interval = interval
+        self.per_page = per_page
+        self.latency = Histogram(('method', 'code'))
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.jobs = Counter()
+        self.accounts = {}
+        self.up = 0
+        self.last_refresh = 0
+        self.refresh_duration = 0
+        self.refresh_errors = 0
+        self.metrics = self.render()
+        self._thread = None
+
+        config_data['request_observer'] = self.observe_request
+
+    def observe_request(self, action, status_code, duration):
+        self.latency.observe((action.upper(), str(status_code)), duration)
+
+    def collect(self):
+        """
+        Return the job counts and account counts of the server.
+        """
+        jobs = Counter()
+
+        for job in iter_user_jobs(self.config_data, per_page=self.per_page):
+            state = job.get('state') or ''
+
+            if state == 'running':
+                service = job.get('current_service')
+            else:
+                service = job.get('failed_service')
+
+            jobs[(state, job.get('cloud') or '', service or '')] += 1
+
+        accounts = {
+            cloud: len(
+                handle_request_with_token(
+                    self.config_data,
+                    '/v1/accounts/{0}/'.format(cloud),
+                    action='get'
+                )
+            )
+            for cloud in sorted(clouds)
+        }
+
+        return jobs, accounts
+
+    def refresh(self):
+        """
+        Request the metrics from the server and render them.
+
+        If a request fails the previous job and account counts are
+        kept and mash_up is 0.
+        """
+        start = time.time()
+
+        try:
+            jobs, accounts = self.collect()
+        except Exception:
+            # Keep serving the previous metrics whatever the failure
+            with self.lock:
+                self.up = 0
+                self.refresh_errors += 1
+        else:
+            with self.lock:
+                self.jobs = jobs
+                self.accounts = accounts
+                self.up = 1
+                self.last_refresh = time.time()
+
+        with self.lock:
+            self.refresh_duration = time.time() - start
+
+        metrics = self.render()
+
+        with self.lock:
+            self.metrics = metrics
+
+    def render(self):
+        """
+        Return the metrics in the Prometheus text exposition format.
+        """
+        with self.lock:
+            jobs = sorted(self.jobs.items())
+            accounts = sorted(self.accounts.items())
+            gauges = (
+                ('mash_up', 'gauge',
+                 'Whether the last refresh of the metrics succeeded.',
+                 self.up),
+                ('mash_exporter_last_refresh_timestamp_seconds', 'gauge',
+                 'Time of the last successful refresh.',
+                 self.last_refresh),
+                ('mash_exporter_refresh_duration_seconds', 'gauge',
+                 'Duration of the last refresh.',
+                 self.refresh_duration),
+                ('mash_exporter_refresh_errors_total', 'counter',
+                 'Number of failed refreshes.',
+                 self.refresh_errors)
+            )
+
+        lines = format_metric(
+            'mash_jobs',
+            'gauge',
+            'Number of jobs by state, cloud and current or failed service.',
+            [
+                ('', [('state', state), ('cloud', cloud),
+                      ('service', service)], count)
+                for (state, cloud, service), count in jobs
+            ]
+        )
+        lines += format_metric(
+            'mash_accounts',
+            'gauge',
+            'Number of cloud accounts by cloud.',
+            [('', [('cloud', cloud)], count) for cloud, count in accounts]
+        )
+        lines += format_metric(
+            'mash_api_request_duration_seconds',
+            'histogram',
+            'Duration of requests to the MASH API.',
+            self.latency.samples()
+        )
+
+        for name, metric_type, help_text, value in gauges:
+            lines += format_metric(name, metric_type, help_text, [
+                ('', [], value)
+            ])
+
+        return '\n'.join(lines) + '\n'
+
+    def get_metrics(self):
+        with self.lock:
+            return self.metrics
+
+    def run(self):
+        while not self.stopped.is_set():
+            self.refresh()
+            self.stopped.wait(self.interval)
+
+    def start(self):
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.stopped.set()
+
+        if self._thread:
+            self._thread.join()
+
+
+class MetricsRequestHandler(BaseHTTPRequestHandler):
+    """
+    Request handler serving the rendered metrics on /metrics.
+    """
+
+    def log_message(self, *args):
+        # supress logging of scrapes
+        pass
+
+    def do_GET(self):
+        if self.path.split('?')[0] != '/metrics':
+            self.send_error(404)
+            return
+
+        body = self.server.exporter.get_metrics().encode()
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class MetricsServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server for the metrics of an exporter.
+    """
+    daemon_threads = True
+
+    def __init__(self, exporter, host='', port=0):
+        super().__init__((host, port), MetricsRequestHandler)
+        self.exporter = exporter
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return 'http://{host}:{port}/metrics'.format(
+            host=host or 'localhost',
+            port=port
+        )
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self.serve_forever,
+            daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
@@ -0,0 +1,755 @@
+# -*- coding: utf-8 -*-
+
+"""Local stand-in for the MASH server API used for tests and benchmarks."""
+
+# Copyright (c) 2026 SUSE LLC. All rights reserved.
+#
+# This file is part of mash_client. mash_client provides a command line
+# utility for interfacing with a MASH server.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import argparse
+import gzip
+import hashlib
+import json
+import jwt
+import os
+import random
+import re
+import socket
+import socketserver
+import threading
+import time
+import uuid
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from mash_client.clouds import clouds
+from mash_client.unix_socket import get_unix_socket_url
+
+CLOUDS = tuple(sorted(clouds))
+SERVICES = (
+    'obs', 'upload', 'create', 'test', 'replicate', 'publish', 'deprecate'
+)
+SECRET = 'fake-mash-server-token-signing-secret'
+
+job_schema = {
+    'additionalProperties': True,
+    'properties': {
+        'cloud_account': {
+            'description': 'The account to use for the job.',
+            'example': 'account1',
+            'minLength': 1,
+            'type': 'string'
+        },
+        'image': {
+            'description': 'The name of the image file.',
+            'example': 'openSUSE-Leap-15.0-OEM',
+            'type': 'string'
+        },
+        'utctime': {
+            'description': 'The time the job will run.',
+            'example': 'now',
+            'type': 'string'
+        },
+        'download_url': {
+            'description': 'The URL of the image to download.',
+            'type': 'string'
+        }
+    },
+    'required': ['cloud_account', 'image', 'utctime', 'download_url'],
+    'type': 'object'
+}
+
+
+class FakeMashState(object):
+    """
+    In memory state for the fake MASH server.
+
+    Jobs progress through the pipeline services based on the time
+    elapsed since they were created. Each service takes service_time
+    seconds. A job fails in a random service with probability
+    job_failure_rate.
+    """
+
+    def __init__(self, service_time=1.0, job_failure_rate=0.0, seed=None):
+        self.service_time = service_time
+        self.job_failure_rate = job_failure_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.jobs = {}
+        self.accounts = {cloud: {} for cloud in CLOUDS}
+        self.tokens = {}
+        self.users = {}
+        self.request_count = 0
+        self.not_modified_count = 0
+
+    def create_tokens(self, email, no_expiry=False):
+        now = int(time.time())
+        tokens = {}
+
+        for token_type, expiry in (('access', 900), ('refresh', 2592000)):
+            jti = str(uuid.uuid4())
+            payload = {
+                'iat': now,
+                'nbf': now,
+                'jti': jti,
+                'identity': email,
+                'type': token_type
+            }
+
+            if not (token_type == 'refresh' and no_expiry):
+                payload['exp'] = now + expiry
+
+            tokens[token_type + '_token'] = jwt.encode(
+                payload,
+                SECRET,
+                algorithm='HS256'
+            )
+
+            if token_type == 'refresh':
+                with self.lock:
+                    self.tokens[jti] = {
+                        'id': jti,
+                        'jti': jti,
+                        'token_type': token_type,
+                        'expires': payload.get('exp'),
+                        'user_id': email
+                    }
+
+        return tokens
+
+    def add_job(self, cloud, job_doc):
+        job_id = str(uuid.uuid4())
+        failed_service = None
+
+        if self.random.random() < self.job_failure_rate:
+            failed_service = self.random.choice(SERVICES)
+
+        job = {
+            'job_id': job_id,
+            'cloud': cloud,
+            'created': time.time(),
+            'failed_service': failed_service,
+            'document': job_doc
+        }
+
+        with self.lock:
+            self.jobs[job_id] = job
+
+        return self.get_job(job_id)
+
+    def get_job(self, job_id, show_data=True):
+        with self.lock:
+            job = self.jobs.get(job_id)
+
+        if not job:
+            return None
+
+        elapsed = time.time() - job['created']
+        index = int(elapsed / self.service_time) if self.service_time else (
+            len(SERVICES)
+        )
+
+        info = {
+            'job_id': job['job_id'],
+            'cloud': job['cloud'],
+            'image': job['document'].get('image'),
+            'utctime': job['document'].get('utctime'),
+            'download_url': job['document'].get('download_url'),
+            'cloud_architecture': job['document'].get(
+                'cloud_architecture', 'x86_64'
+            ),
+            'last_service': job['document'].get('last_service', SERVICES[-1]),
+            'start_time': time.strftime(
+                '%Y-%m-%dT%H:%M:%S', time.gmtime(job['created'])
+            )
+        }
+
+        if job['failed_service'] and \
+                SERVICES.index(job['failed_service']) <= index:
+            info['state'] = 'failed'
+            info['failed_service'] = job['failed_service']
+        elif index >= len(SERVICES):
+            info['state'] = 'finished'
+        else:
+            info['state'] = 'running'
+            info['current_service'] = SERVICES[index]
+
+        if show_data:
+            info['data'] = {}
+
+            if index > SERVICES.index('test'):
+                info['data']['test_results'] = json.dumps({
+                    'summary': {
+                        'duration': 1.0,
+                        'num_tests': 2,
+                        'passed': 2
+                    },
+                    'tests': [
+                        {'nodeid': 'test_sles.py::test_sles', 'outcome':
+                            'passed', 'test_index': 0},
+                        {'nodeid': 'test_hostname', 'outcome': 'passed',
+                            'test_index': 1}
+                    ]
+                })
+
+        return info
+
+    def list_jobs(self, page=1, per_page=20):
+        with self.lock:
+            job_ids = list(self.jobs)
+
+        start = (page - 1) * per_page
+        return [
+            self.get_job(job_id, show_data=False)
+            for job_id in job_ids[start:start + per_page]
+        ]
+
+
+class FakeMashRequestHandler(BaseHTTPRequestHandler):
+    """
+    Request handler emulating the MASH server v1 REST API.
+    """
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        # supress logging of requests
+        pass
+
+    def do_GET(self):
+        self.handle_method('GET')
+
+    def do_POST(self):
+        self.handle_method('POST')
+
+    def do_PUT(self):
+        self.handle_method('PUT')
+
+    def do_DELETE(self):
+        self.handle_method('DELETE')
+
+    def handle_method(self, method):
+        server = self.server
+        body = self.read_body()
+
+        with server.state.lock:
+            server.state.request_count += 1
+
+        if server.latency:
+            time.sleep(server.latency)
+
+        if server.random.random() < server.throttle_rate:
+            self.send_json(
+                429,
+                {'msg': 'Too many requests.'},
+                headers={'Retry-After': str(server.retry_after)}
+            )
+            return
+
+        if server.random.random() < server.error_rate:
+            self.send_json(500, {'msg': 'Injected server error.'})
+            return
+
+        url = urlparse(self.path)
+        params = {
+            key: values[0] for key, values in parse_qs(url.query).items()
+        }
+
+        if isinstance(body, dict):
+            params.update(body)
+
+        for route_method, pattern, handler_name in ROUTES:
+            match = re.fullmatch(pattern, url.path)
+
+            if route_method == method and match:
+                status, result = getattr(self, handler_name)(
+                    params,
+                    **match.groupdict()
+                )
+
+                if method == 'GET' and status == 200 and \
+                        server.cache_max_age is not None:
+                    self.send_cacheable(result)
+                else:
+                    self.send_json(status, result)
+                return
+
+        self.send_json(404, {'msg': 'Not found.'})
+
+    def read_body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+
+        if not length:
+            return None
+
+        data = self.rfile.read(length)
+
+        if self.headers.get('Content-Encoding') == 'gzip':
+            data = gzip.decompress(data)
+
+        try:
+            return json.loads(data)
+        except ValueError:
+            return None
+
+    def send_json(self, status, result, headers=None):
+        data = json.dumps(result).encode()
+        min_size = self.server.compress_min_size
+        headers = dict(headers or {})
+
+        if min_size is not None and len(data) >= min_size and \
+                'gzip' in self.headers.get('Accept-Encoding', ''):
+            data = gzip.compress(data)
+            headers['Content-Encoding'] = 'gzip'
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+
+        for key, value in headers.items():
+            self.send_header(key, value)
+
+        self.end_headers()
+        self.wfile.write(data)
+
+    def send_cacheable(self, result):
+        """
+        Send result with an ETag, or 304 if the client has it already.
+        """
+        etag = '"{0}"'.format(hashlib.sha256(
+            json.dumps(result, sort_keys=True).encode()
+        ).hexdigest()[:16])
+        max_age = self.server.cache_max_age
+        headers = {
+            'ETag': etag,
+            'Cache-Control': 'private, max-age={0}'.format(max_age)
+            if max_age else 'no-cache'
+        }
+
+        if self.headers.get('If-None-Match') == etag:
+            with self.server.state.lock:
+                self.server.state.not_modified_count += 1
+
+            self.send_response(304)
+            self.send_header('Content-Length', '0')
+
+            for key, value in headers.items():
+                self.send_header(key, value)
+
+            self.end_headers()
+            return
+
+        self.send_json(200, result, headers=headers)
+
+    def get_identity(self):
+        auth = self.headers.get('Authorization', '')
+
+        try:
+            token = jwt.decode(
+                auth.replace('Bearer ', ''),
+                SECRET,
+                algorithms=['HS256']
+            )
+        except jwt.PyJWTError:
+            return None
+
+        return token
+
+    # Auth endpoints
+
+    def login(self, params):
+        email = params.get('email')
+        password = params.get('password')
+        users = self.server.state.users
+
+        # Unknown users are allowed to login with any password
+        if not email or users.get(email, password) != password:
+            return 401, {'msg': 'Username or password is invalid.'}
+
+        return 200, self.server.state.create_tokens(
+            email,
+            params.get('no_expiry', False)
+        )
+
+    def logout(self, params):
+        token = self.get_identity()
+
+        if not token:
+            return 401, {'msg': 'Token is invalid.'}
+
+        self.server.state.tokens.pop(token['jti'], None)
+        return 200, {'msg': 'Logout successful.'}
+
+    def refresh(self, params):
+        token = self.get_identity()
+
+        if not token or token['type'] != 'refresh':
+            return 401, {'msg': 'Token is invalid.'}
+
+        tokens = self.server.state.create_tokens(token['identity'])
+        return 200, {'access_token': tokens['access_token']}
+
+    def list_tokens(self, params):
+        return 200, list(self.server.state.tokens.values())
+
+    def get_token(self, params, jti):
+        token = self.server.state.tokens.get(jti)
+
+        if not token:
+            return 404, {'msg': 'Token not found.'}
+
+        return 200, token
+
+    def delete_token(self, params, jti):
+        if not self.server.state.tokens.pop(jti, None):
+            return 404, {'msg': 'Token not found.'}
+
+        return 200, {'msg': 'Token deleted.'}
+
+    def delete_tokens(self, params):
+        count = len(self.server.state.tokens)
+        self.server.state.tokens.clear()
+        return 200, {'msg': '{0} tokens deleted.'.format(count)}
+
+    # Job endpoints
+
+    def list_jobs(self, params):
+        if not self.get_identity():
+            return 401, {'msg': 'Token is invalid.'}
+
+        return 200, self.server.state.list_jobs(
+            int(params.get('page', 1)),
+            int(params.get('per_page', self.server.per_page))
+        )
+
+    def get_schema(self, params, cloud):
+        if cloud not in CLOUDS:
+            return 404, {'msg': 'Not found.'}
+
+        return 200, job_schema
+
+    def add_job(self, params, cloud):
+        if not self.get_identity():
+            return 401, {'msg': 'Token is invalid.'}
+
+        missing = [key for key in job_schema['required'] if key not in params]
+
+        if missing:
+            return 400, {
+                'errors': {
+                    key: "'{0}' is a required property".format(key)
+                    for key in missing
+                },
+                'message': 'Input payload validation failed'
+            }
+
+        if params.get('dry_run'):
+            return 200, {'msg': 'Job doc is valid!'}
+
+        return 201, self.server.state.add_job(cloud, params)
+
+    def get_job(self, params, job_id):
+        if not self.get_identity():
+            return 401, {'msg': 'Token is invalid.'}
+
+        job = self.server.state.get_job(job_id)
+
+        if not job:
+            return 404, {'msg': 'Job does not exist.'}
+
+        return 200, job
+
+    def delete_job(self, params, job_id):
+        if not self.get_identity():
+            return 401, {'msg': 'Token is invalid.'}
+
+        with self.server.state.lock:
+            job = self.server.state.jobs.pop(job_id, None)
+
+        if not job:
+            return 404, {'msg': 'Job does not exist.'}
+
+        return 200, {'msg': 'Job deleted'}
+
+    # Account endpoints
+
+    def list_accounts(self, params, cloud):
+        return 200, list(self.server.state.accounts[cloud].values())
+
+    def add_account(self, params, cloud):
+        name = params.get('account_name')
+
+        if not name:
+            return 400, {'msg': 'Account name is required.'}
+
+        account = {
+            key: value for key, value in params.items()
+            if key != 'credentials'
+        }
+        account['id'] = str(uuid.uuid4())
+        account['name'] = account.pop('account_name')
+        self.server.state.accounts[cloud][name] = account
+        return 201, account
+
+    def get_account(self, params, cloud, name):
+        account = self.server.state.accounts[cloud].get(name)
+
+        if not account:
+            return 404, {'msg': 'Account does not exist.'}
+
+        return 200, account
+
+    def update_account(self, params, cloud, name):
+        account = self.server.state.accounts[cloud].get(name)
+
+        if not account:
+            return 404, {'msg': 'Account does not exist.'}
+
+        account.update({
+            key: value for key, value in params.items()
+            if key != 'credentials'
+        })
+        return 200, account
+
+    def delete_account(self, params, cloud, name):
+        if not self.server.state.accounts[cloud].pop(name, None):
+            return 404, {'msg': 'Account does not exist.'}
+
+        return 200, {'msg': 'Account deleted'}
+
+    # User endpoints
+
+    def create_user(self, params):
+        self.server.state.users[params['email']] = params['password']
+        return 201, {'id': str(uuid.uuid4()), 'email': params['email']}
+
+    def get_user(self, params):
+        token = self.get_identity()
+
+        if not token:
+            return 401, {'msg': 'Token is invalid.'}
+
+        return 200, {'id': '1', 'email': token['identity']}
+
+    def delete_user(self, params):
+        token = self.get_identity()
+
+        if not token:
+            return 401, {'msg': 'Token is invalid.'}
+
+        self.server.state.users.pop(token['identity'], None)
+        return 200, {'msg': 'User deleted'}
+
+    def password(self, params):
+        return 200, {'msg': 'Password changed successfully.'}
+
+
+_cloud = '(?P<cloud>{0})'.format('|'.join(CLOUDS))
+ROUTES = (
+    ('POST', '/v1/auth/login', 'login'),
+    ('DELETE', '/v1/auth/logout', 'logout'),
+    ('POST', '/v1/auth/token/refresh', 'refresh'),
+    ('GET', '/v1/auth/token', 'list_tokens'),
+    ('DELETE', '/v1/auth/token', 'delete_tokens'),
+    ('GET', '/v1/auth/token/(?P<jti>[^/]+)', 'get_token'),
+    ('DELETE', '/v1/auth/token/(?P<jti>[^/]+)', 'delete_token'),
+    ('GET', '/v1/jobs/', 'list_jobs'),
+    ('GET', '/v1/jobs/{0}/'.format(_cloud), 'get_schema'),
+    ('POST', '/v1/jobs/{0}/'.format(_cloud), 'add_job'),
+    ('GET', '/v1/jobs/(?P<job_id>[^/]+)', 'get_job'),
+    ('DELETE', '/v1/jobs/(?P<job_id>[^/]+)', 'delete_job'),
+    ('GET', '/v1/accounts/{0}/'.format(_cloud), 'list_accounts'),
+    ('POST', '/v1/accounts/{0}/'.format(_cloud), 'add_account'),
+    ('GET', '/v1/accounts/{0}/(?P<name>[^/]+)'.format(_cloud),
+        'get_account'),
+    ('POST', '/v1/accounts/{0}/(?P<name>[^/]+)'.format(_cloud),
+        'update_account'),
+    ('DELETE', '/v1/accounts/{0}/(?P<name>[^/]+)'.format(_cloud),
+        'delete_account'),
+    ('POST', '/v1/user/', 'create_user'),
+    ('GET', '/v1/user/', 'get_user'),
+    ('DELETE', '/v1/user/', 'delete_user'),
+    ('POST', '/v1/user/password', 'password'),
+    ('PUT', '/v1/user/password', 'password'),
+)
+
+
+class FakeMashServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server emulating a MASH server instance.
+
+    latency: Seconds to sleep before handling each request.
+    error_rate: Probability of a request failing with a 500 response.
+    throttle_rate: Probability of a request failing with a 429 response
+        including a Retry-After header of retry_after seconds.
+    per_page: Default page size for job listings.
+    compress_min_size: Minimum size in bytes of response bodies that are
+        gzip compressed if the client accepts it. None disables it.
+    service_time: Seconds each job spends in every pipeline service.
+    job_failure_rate: Probability of a job failing in a pipeline service.
+    cache_max_age: If set GET responses have an ETag and may be cached
+        for this many seconds, 0 requires revalidation. Requests with a
+        matching If-None-Match header get a 304 response.
+    unix_socket: If set the server listens on a Unix domain socket at
+        this path instead of host and port.
+
+    Usage as a context manager serves requests in a background thread::
+
+        with FakeMashServer(latency=0.01) as server:
+            handle_request({'url': server.url, ...}, '/v1/jobs/ec2/')
+    """
+    daemon_threads = True
+
+    def __init__(
+        self,
+        host='127.0.0.1',
+        port=0,
+        latency=0.0,
+        error_rate=0.0,
+        throttle_rate=0.0,
+        retry_after=1,
+        per_page=20,
+        compress_min_size=1024,
+        service_time=1.0,
+        job_failure_rate=0.0,
+        cache_max_age=None,
+        unix_socket=None,
+        users=None,
+        seed=None
+    ):
+        if unix_socket:
+            self.address_family = socket.AF_UNIX
+            address = unix_socket
+        else:
+            address = (host, port)
+
+        super().__init__(address, FakeMashRequestHandler)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.per_page = per_page
+        self.compress_min_size = compress_min_size
+        self.cache_max_age = cache_max_age
+        self.random = random.Random(seed)
+        self.state = FakeMashState(service_time, job_failure_rate, seed)
+        self.state.users.update(users or {})
+        self._thread = None
+
+    def server_bind(self):
+        if self.address_family != socket.AF_UNIX:
+            return super().server_bind()
+
+        # There is no host name to look up for a socket path
+        socketserver.TCPServer.server_bind(self)
+        self.server_name = 'localhost'
+        self.server_port = 0
+
+    @property
+    def url(self):
+        if self.address_family == socket.AF_UNIX:
+            return get_unix_socket_url(self.server_address)
+
+        host, port = self.server_address[:2]
+        return 'http://{host}:{port}'.format(host=host, port=port)
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self.serve_forever,
+            daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+        if self.address_family == socket.AF_UNIX:
+            os.remove(self.server_address)
+
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+def main(args=None):
+    """
+    Run the fake MASH server in the foreground.
+    """
+    parser = argparse.ArgumentParser(
+        description='Local stand-in for the MASH server API.'
+    )
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5000)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--throttle-rate', type=float, default=0.0)
+    parser.add_argument('--retry-after', type=int, default=1)
+    parser.add_argument('--per-page', type=int, default=20)
+    parser.add_argument('--compress-min-size', type=int, default=1024)
+    parser.add_argument('--service-time', type=float, default=1.0)
+    parser.add_argument('--job-failure-rate', type=float, default=0.0)
+    parser.add_argument('--cache-max-age', type=int)
+    parser.add_argument(
+        '--unix-socket',
+        help='Path of a Unix domain socket to listen on instead of host '
+             'and port.'
+    )
+    parser.add_argument(
+        '--user',
+        action='append',
+        default=[],
+        help='EMAIL:PASSWORD of a user allowed to login.'
+    )
+    options = parser.parse_args(args)
+
+    server = FakeMashServer(
+        host=options.host,
+        port=options.port,
+        latency=options.latency,
+        error_rate=options.error_rate,
+        throttle_rate=options.throttle_rate,
+        retry_after=options.retry_after,
+        per_page=options.per_page,
+        compress_min_size=options.compress_min_size,
+        service_time=options.service_time,
+        job_failure_rate=options.job_failure_rate,
+        cache_max_age=options.cache_max_age,
+        unix_socket=options.unix_socket,
+        users=dict(user.split(':', 1) for user in options.user)
+    )
+    print('Serving fake MASH API on {url}'.format(url=server.url))
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+        if options.unix_socket:
+            os.remove(options.unix_socket)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+
+"""Incremental parsing of large JSON responses."""
+
+# Copyright (c) 2026 SUSE LLC. All rights reserved.
+#
+# This file is part of mash_client. mash_client provides a command line
+# utility for interfacing with a MASH server.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import codecs
+import json
+import re
+
+from mash_client.mash_client_exceptions import MashClientException
+
+whitespace = ' \t\n\r'
+string_content = re.compile(r'(?:[^"\\]|\\.)*', re.DOTALL)
+
+
+class JSONStream(object):
+    """
+    Pull parser for a JSON document read from an iterable of chunks.
+
+    Only the value currently being parsed is held in memory. Arrays
+    are consumed item by item with items() and objects key by key with
+    keys(). Any other value is decoded completely with value().
+    """
+
+    def __init__(self, chunks, compact_size=65536):
+        self.chunks = iter(chunks)
+        self.decoder = codecs.getincrementaldecoder('utf-8')()
+        self.json_decoder = json.JSONDecoder()
+        self.compact_size = compact_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        """
+        Append the next chunk to the buffer.
+
+        Returns False once the input is exhausted.
+        """
+        if self.eof:
+            return False
+
+        if self.pos > self.compact_size:
+            # Drop the consumed part of the buffer
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+
+        for chunk in self.chunks:
+            if isinstance(chunk, bytes):
+                chunk = self.decoder.decode(chunk)
+
+            if chunk:
+                self.buffer += chunk
+                return True
+
+        self.buffer += self.decoder.decode(b'', final=True)
+        self.eof = True
+        return False
+
+    def peek(self):
+        """
+        Return the next non whitespace character without consuming it.
+        """
+        while True:
+            while self.pos < len(self.buffer):
+                if self.buffer[self.pos] not in whitespace:
+                    return self.buffer[self.pos]
+
+                self.pos += 1
+
+            if not self.fill():
+                raise MashClientException(
+                    'Unexpected end of JSON response.'
+                )
+
+    def expect(self, chars):
+        """
+        Consume the next character which must be one of chars.
+        """
+        char = self.peek()
+
+        if char not in chars:
+            raise MashClientException(
+                'Invalid JSON response: expected {0} but found {1}.'.format(
+                    ' or '.join(repr(expected) for expected in chars),
+                    repr(char)
+                )
+            )
+
+        self.pos += 1
+        return char
+
+    def value(self):
+        """
+        Decode and return the next complete value.
+
+        A value is only accepted once data follows it, so a number is
+        never cut off at a chunk boundary. After a failed attempt the
+        buffer is grown geometrically before decoding again, keeping
+        the parsing of large values linear.
+        """
+        self.peek()
+
+        while True:
+            try:
+                result, end = self.json_decoder.raw_decode(
+                    self.buffer,
+                    self.pos
+                )
+            except ValueError:
+                if self.eof:
+                    raise MashClientException('Invalid JSON response.')
+            else:
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return result
+
+            target = max(len(self.buffer) - self.pos, 1) * 2
+
+            while len(self.buffer) - self.pos < target and self.fill():
+                pass
+
+    def skip(self):
+        """
+        Consume the next value without decoding it.
+
+        Strings are skipped without building them, so large values
+        the caller is not interested in are never held in memory.
+        """
+        char = self.peek()
+
+        if char == '"':
+            self.pos += 1
+
+            while True:
+                self.pos = string_content.match(self.buffer, self.pos).end()
+
+                if self.pos < len(self.buffer) and \
+                        self.buffer[self.pos] == '"':
+                    self.pos += 1
+                    return
+
+                if not self.fill():
+                    raise MashClientException(
+                        'Unexpected end of JSON response.'
+                    )
+        elif char == '{':
+            for key in self.keys():
+                self.skip()
+        elif char == '[':
+            self.pos += 1
+
+            if self.peek() == ']':
+                self.pos += 1
+                return
+
+            while True:
+                self.skip()
+
+                if self.expect(',]') == ']':
+                    return
+        else:
+            self.value()
+
+    def items(self):
+        """
+        Yield the items of an array one at a time.
+        """
+        self.expect('[')
+
+        if self.peek() == ']':
+            self.pos += 1
+            return
+
+        while True:
+            yield self.value()
+
+            if self.expect(',]') == ']':
+                return
+
+    def keys(self):
+        """
+        Yield the keys of an object one at a time.
+
+        The value of each key has to be consumed with value(), items()
+        or keys() before the next key is requested.
+        """
+        self.expect('{')
+
+        if self.peek() == '}':
+            self.pos += 1
+            return
+
+        while True:
+            key = self.value()
+
+            if not isinstance(key, str):
+                raise MashClientException(
+                    'Invalid JSON response: object key is not a string.'
+                )
+
+            self.expect(':')
+            yield key
+
+            if self.expect(',}') == '}':
+                return
+
+
+def iter_json_items(chunks):
+    """
+    Yield the items of a JSON array read from chunks.
+    """
+    return JSONStream(chunks).items()
+
+
+def dump_indented(value, level):
+    """
+    Return value as JSON indented for the given nesting level.
+    """
+    return json.dumps(value, indent=4).replace('\n', '\n' + '    ' * level)
+
+
+def iter_json_array_lines(items):
+    """
+    Yield an iterable as the text of a JSON array.
+
+    The output is identical to json.dumps(list(items), indent=4).
+    """
+    first = True
+
+    for item in items:
+        yield '{0}\n    {1}'.format('[' if first else ',', dump_indented(
+            item, 1
+        ))
+        first = False
+
+    yield '[]' if first else '\n]'
+
+
+def iter_json_object_lines(stream, expand=None, skip=(), level=0):
+    """
+    Yield the object at the position of stream as indented JSON text.
+
+    Keys in skip are left out. The values of keys in expand are
+    streamed key by key if they are objects, leaving out the keys
+    expand maps them to. All other values are decoded one at a time.
+    The output is identical to json.dumps(value, indent=4).
+    """
+    first = True
+    indent = '    ' * (level + 1)
+
+    for key in stream.keys():
+        if key in skip:
+            stream.skip()
+            continue
+
+        yield '{0}\n{1}{2}: '.format(
+            '{' if first else ',',
+            indent,
+            json.dumps(key)
+        )
+        first = False
+
+        if expand and key in expand and stream.peek() == '{':
+            for text in iter_json_object_lines(
+                stream,
+                skip=expand[key],
+                level=level + 1
+            ):
+                yield text
+        else:
+            yield dump_indented(stream.value(), level + 1)
+
+    yield '{}' if first else '\n{0}}}'.format('    ' * level)
@@ -22,4 +22,25 @@
 
 
 class MashClientException(Exception):
-    """Generic exception for the mash client package."""
+    """
+    Generic exception for the mash client package.
+
+    status_code is the status of the error response of the MASH server
+    if the exception was raised for one.
+    """
+
+    def __init__(self, *args, status_code=None):
+        super(MashClientException, self).__init__(*args)
+        self.status_code = status_code
+
+
+class MashConnectionException(MashClientException):
+    """Exception for failures to connect to the MASH server."""
+
+
+class MashCircuitOpenException(MashConnectionException):
+    """Exception for requests blocked while the MASH server is failing."""
+
+
+class MashDeadlineException(MashClientException):
+    """Exception for commands exceeding their deadline."""
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+
+"""Client side rate limiting shared by all processes of a host."""
+
+# Copyright (c) 2026 SUSE LLC. All rights reserved.
+#
+# This file is part of mash_client. mash_client provides a command line
+# utility for interfacing with a MASH server.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import fcntl
+import json
+import os
+import re
+import time
+
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+from mash_client.paths import default_config_dir
+from mash_client.mash_client_exceptions import MashDeadlineException
+
+default_retry_after = 1.0
+max_retry_after = 300.0
+
+
+def get_state_file(config_data, prefix):
+    """
+    Return the path of a per host state file shared between processes.
+
+    State files are stored in the state_dir from config which defaults
+    to the config directory.
+    """
+    state_dir = os.path.expanduser(
+        config_data.get('state_dir') or
+        config_data.get('config_dir') or
+        default_config_dir
+    )
+    host = re.sub(r'[^\w.-]', '_', urlparse(config_data['url']).netloc)
+    return os.path.join(state_dir, '{0}_{1}.json'.format(prefix, host))
+
+
+@contextmanager
+def locked_state(state_file):
+    """
+    Lock a JSON state file and yield its content as a dictionary.
+
+    Changes to the dictionary are written back before the lock is
+    released.
+    """
+    os.makedirs(os.path.dirname(state_file), exist_ok=True)
+
+    with open(state_file, 'a+') as state:
+        fcntl.flock(state, fcntl.LOCK_EX)
+
+        try:
+            state.seek(0)
+
+            try:
+                data = json.loads(state.read() or '{}')
+            except ValueError:
+                data = {}
+
+            original = dict(data)
+            yield data
+
+            if data != original:
+                state.seek(0)
+                state.truncate()
+                json.dump(data, state)
+                state.flush()
+        finally:
+            fcntl.flock(state, fcntl.LOCK_UN)
+
+
+def parse_retry_after(value):
+    """
+    Return the seconds to wait from a Retry-After header value.
+
+    The value is either a number of seconds or an HTTP date.
+    """
+    if not value:
+        return default_retry_after
+
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return default_retry_after
+
+    return min(max(delay, 0.0), max_retry_after)
+
+
+class RateLimiter(object):
+    """
+    Token bucket rate limiter for requests to a MASH server.
+
+    The bucket is kept in a lock protected state file so processes
+    sending requests to the same server share the same limit. A
+    throttled response pauses every process until the server's
+    Retry-After time has passed.
+    """
+
+    def __init__(self, state_file, rate=None, burst=None):
+        self.state_file = state_file
+        self.rate = rate
+        self.burst = max(burst or rate or 1, 1)
+
+    def reserve(self):
+        """
+        Take a token from the bucket if one is available.
+
+        Returns the number of seconds to wait before trying again or 0
+        if the request may be sent.
+        """
+        if not self.rate and not os.path.exists(self.state_file):
+            return 0
+
+        with locked_state(self.state_file) as state:
+            now = time.time()
+            paused = state.get('paused_until', 0) - now
+
+            if paused > 0:
+                return paused
+
+            if not self.rate:
+                return 0
+
+            tokens = min(
+                self.burst,
+                state.get('tokens', self.burst) +
+                max(now - state.get('updated', now), 0) * self.rate
+            )
+
+            if tokens >= 1:
+                state['tokens'] = tokens - 1
+                state['updated'] = now
+                return 0
+
+            return (1 - tokens) / self.rate
+
+    def acquire(self, deadline=None):
+        """
+        Block until a request may be sent.
+
+        Raises an exception instead of waiting past the deadline
+        (a time.time() value).
+        """
+        while True:
+            wait = self.reserve()
+
+            if not wait:
+                return
+
+            if deadline and time.time() + wait > deadline:
+                raise MashDeadlineException(
+                    'Waiting {0:.1f} seconds for the rate limit would '
+                    'exceed the deadline.'.format(wait)
+                )
+
+            time.sleep(wait)
+
+    def pause(self, seconds):
+        """
+        Pause all requests to the server for the number of seconds.
+        """
+        with locked_state(self.state_file) as state:
+            state['paused_until'] = max(
+                state.get('paused_until', 0),
+                time.time() + seconds
+            )
+            # The server is at its limit, start again with an empty bucket
+            state['tokens'] = 0
+            state['updated'] = state['paused_until']
+
+
+def get_rate_limiter(config_data):
+    """
+    Return the rate limiter for the server in config.
+
+    The profile sets the rate limit in requests per second with
+    rate_limit and the bucket size with rate_burst. Without a rate
+    limit only pauses requested by the server are enforced.
+    """
+    rate = config_data.get('rate_limit')
+
+    return RateLimiter(
+        get_state_file(config_data, 'ratelimit'),
+        float(rate) if rate else None,
+        int(config_data.get('rate_burst') or 0) or None
+    )
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+"""Submission of job documents with a limit on running jobs."""
+
+# Copyright (c) 2026 SUSE LLC. All rights reserved.
+#
+# This file is part of mash_client. mash_client provides a command line
+# utility for interfacing with a MASH server.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import glob
+import os
+
+from mash_client.cli_utils import (
+    JSONFile,
+    map_concurrently,
+    sleep_before_deadline
+)
+from mash_client.controller import add_job, get_job_status
+from mash_client.mash_client_exceptions import (
+    MashClientException,
+    MashConnectionException
+)
+
+# Jobs stay in flight until they reach one of these states
+final_states = ('finished', 'failed')
+
+
+def get_queue_documents(directory, sort_by=None, reverse=False):
+    """
+    Return (name, document) tuples of the json files in directory.
+
+    Documents are in filename order unless sort_by names a document
+    field to order them by. Documents without the field come last
+    in filename order.
+    """
+    paths = sorted(glob.glob(os.path.join(directory, '*.json')))
+    documents = [
+        (os.path.basename(path), JSONFile(path)) for path in paths
+    ]
+
+    if not sort_by:
+        return list(reversed(documents)) if reverse else documents
+
+    values = {}
+    for name, document in documents:
+        try:
+            values[name] = document.load().get(sort_by)
+        except ValueError as error:
+            raise MashClientException(
+                'Invalid job document {0}: {1}'.format(name, error)
+            )
+
+    present = [item for item in documents if values[item[0]] is not None]
+    missing = [item for item in documents if values[item[0]] is None]
+
+    try:
+        present.sort(key=lambda item: values[item[0]], reverse=reverse)
+    except TypeError:
+        raise MashClientException(
+            'The values of {0} cannot be compared.'.format(sort_by)
+        )
+
+    return present + missing
+
+
+def poll_in_flight(config_data, in_flight, concurrency=10):
+    """
+    Remove the jobs which are no longer running from in_flight.
+
+    The status of all jobs is requested concurrently. Jobs in a final
+    state and jobs which no longer exist are removed. Jobs whose status
+    cannot be requested, for example because of a connection failure,
+    a timeout or a server error, stay in flight until the next poll.
+    """
+    job_ids = list(in_flight)
+    results = map_concurrently(
+        lambda job_id: get_job_status(config_data, job_id),
+        job_ids,
+        min(concurrency, len(job_ids))
+    )
+
+    for job_id, (status, error) in zip(job_ids, results):
+        if error:
+            if getattr(error, 'status_code', None) == 404:
+                del in_flight[job_id]
+        elif status.get('state') in final_states:
+            del in_flight[job_id]
+
+
+def submit_queue(
+    config_data, documents, cloud, max_in_flight, poll_interval,
+    callback=None, submit=add_job
+):
+    """
+    Submit documents while fewer than max_in_flight jobs are running.
+
+    Only the jobs submitted by the queue are counted. The status of
+    those jobs is polled every poll_interval seconds while the limit
+    is reached. Documents the server rejects are reported and skipped,
+    a connection failure stops the queue.
+
+    callback is called with the result of each document and the
+    number of jobs in flight. Returns the list of results.
+    """
+    in_flight = {}
+    results = []
+
+    for name, job_data in documents:
+        while len(in_flight) >= max_in_flight:
+            sleep_before_deadline(config_data, poll_interval)
+            poll_in_flight(config_data, in_flight)
+
+        item = {'document': name}
+
+        try:
+            result = submit(config_data, job_data, cloud)
+        except MashConnectionException:
+            raise
+        except MashClientException as error:
+            item['error'] = str(error)
+        else:
+            if 'job_id' in result:
+                item['job_id'] = result['job_id']
+                in_flight[result['job_id']] = name
+            else:
+                item['msg'] = result.get('msg')
+
+        results.append(item)
+
+        if callback:
+            callback(item, len(in_flight))
+
+    return results
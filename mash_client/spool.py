@@ -0,0 +1,337 @@
+# -*- coding: utf-8 -*-
+
+"""Durable on-disk queue for job submissions."""
+
+# Copyright (c) 2026 SUSE LLC. All rights reserved.
+#
+# This file is part of mash_client. mash_client provides a command line
+# utility for interfacing with a MASH server.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import fcntl
+import hashlib
+import json
+import os
+import threading
+import time
+
+from contextlib import contextmanager
+
+from mash_client.cli_utils import (
+    JSONFile,
+    get_access_token,
+    map_concurrently,
+    sleep_before_deadline
+)
+from mash_client.controller import add_job
+from mash_client.mash_client_exceptions import (
+    MashClientException,
+    MashConnectionException,
+    MashDeadlineException
+)
+
+journal_lock = threading.Lock()
+
+# Client errors which do not mean the document itself was rejected
+transient_status_codes = (401, 403, 408, 429)
+
+
+def get_spool_dir(config_data):
+    """
+    Return the spool directory for the config profile.
+
+    Defaults to spool/{profile}/ in the config directory.
+    """
+    spool_dir = config_data.get('spool_dir') or os.path.join(
+        config_data['config_dir'],
+        'spool'
+    )
+    return os.path.join(os.path.expanduser(spool_dir), config_data['profile'])
+
+
+def write_journal(spool_dir, event, doc_id, **kwargs):
+    """
+    Append an event for a spooled document to the journal.
+    """
+    entry = dict(time=time.time(), event=event, id=doc_id, **kwargs)
+
+    with journal_lock:
+        with open(os.path.join(spool_dir, 'journal'), 'a') as journal:
+            journal.write(json.dumps(entry) + '\n')
+            journal.flush()
+            os.fsync(journal.fileno())
+
+
+def read_journal(spool_dir):
+    """
+    Return all journal events, skipping a partially written last line.
+    """
+    events = []
+
+    try:
+        with open(os.path.join(spool_dir, 'journal')) as journal:
+            for line in journal:
+                try:
+                    events.append(json.loads(line))
+                except ValueError:
+                    pass
+    except FileNotFoundError:
+        pass
+
+    return events
+
+
+def compact_journal(spool_dir):
+    """
+    Remove the events of documents which are no longer spooled.
+
+    The journal is only needed to avoid submitting a spooled document
+    twice, events of submitted and failed documents are dropped.
+    """
+    spooled = {entry['id'] for entry in list_spool(spool_dir)}
+    journal_path = os.path.join(spool_dir, 'journal')
+    temp_path = journal_path + '.tmp'
+
+    with journal_lock:
+        events = [
+            event for event in read_journal(spool_dir)
+            if event.get('id') in spooled
+        ]
+
+        with open(temp_path, 'w') as journal:
+            for event in events:
+                journal.write(json.dumps(event) + '\n')
+
+            journal.flush()
+            os.fsync(journal.fileno())
+
+        os.replace(temp_path, journal_path)
+
+
+def spool_job(spool_dir, cloud, job_data, api_version=None):
+    """
+    Write a job document to the spool and return its id.
+
+    The id is a hash of the normalized document, spooling the same
+    document twice results in a single entry.
+    """
+    entry = {'cloud': cloud, 'api_version': api_version, 'job_data': job_data}
+    doc_id = hashlib.sha256(
+        json.dumps(entry, sort_keys=True, separators=(',', ':')).encode()
+    ).hexdigest()[:16]
+    doc_path = os.path.join(spool_dir, doc_id + '.json')
+
+    os.makedirs(spool_dir, exist_ok=True)
+
+    if os.path.exists(doc_path):
+        return doc_id
+
+    entry['id'] = doc_id
+    entry['spooled'] = time.time()
+    temp_path = doc_path + '.tmp'
+
+    with open(temp_path, 'w') as doc_file:
+        json.dump(entry, doc_file)
+        doc_file.flush()
+        os.fsync(doc_file.fileno())
+
+    os.replace(temp_path, doc_path)
+    write_journal(spool_dir, 'spooled', doc_id, cloud=cloud)
+    return doc_id
+
+
+def list_spool(spool_dir):
+    """
+    Return the spooled entries sorted by spool time.
+    """
+    entries = []
+
+    try:
+        names = os.listdir(spool_dir)
+    except FileNotFoundError:
+        return entries
+
+    for name in names:
+        if not name.endswith('.json'):
+            continue
+
+        with open(os.path.join(spool_dir, name)) as doc_file:
+            entries.append(json.load(doc_file))
+
+    return sorted(entries, key=lambda entry: entry['spooled'])
+
+
+@contextmanager
+def spool_lock(spool_dir):
+    """
+    Hold an exclusive lock on the spool while flushing it.
+    """
+    os.makedirs(spool_dir, exist_ok=True)
+
+    with open(os.path.join(spool_dir, '.lock'), 'w') as lock_file:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            raise MashClientException(
+                'The spool {0} is already being flushed.'.format(spool_dir)
+            )
+
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def is_rejected(error):
+    """
+    Return True if the server rejected the job document.
+
+    Only 4xx responses reject a document. Timeouts, server errors and
+    pages of proxies without a status code may succeed later.
+    """
+    status_code = error.status_code or 0
+    return 400 <= status_code < 500 and \
+        status_code not in transient_status_codes
+
+
+def add_job_or_spool(config_data, job_data, cloud, api_version=None):
+    """
+    Submit a job and spool it if the MASH server is unreachable.
+    """
+    try:
+        return add_job(config_data, job_data, cloud, api_version=api_version)
+    except MashConnectionException:
+        if isinstance(job_data, JSONFile):
+            job_data = job_data.load()
+
+        doc_id = spool_job(
+            get_spool_dir(config_data),
+            cloud,
+            job_data,
+            api_version
+        )
+
+    return {
+        'msg': 'Unable to connect to the MASH server. The job document '
+               'was spooled as {0}. Submit it later with: '
+               'mash spool flush'.format(doc_id)
+    }
+
+
+def flush_spool(config_data, concurrency=4, retries=3, backoff=2):
+    """
+    Submit all spooled job documents.
+
+    Documents are submitted with bounded concurrency and connection
+    failures are retried with exponential backoff. Documents that
+    fail to connect after all retries or fail with a timeout or server
+    error stay spooled. Documents the server rejects with a 4xx
+    response are moved to the failed directory. A document the journal
+    shows as submitted since it was spooled is not submitted again, a
+    document spooled again after it was submitted is. The journal is
+    compacted once the spool is flushed.
+    """
+    spool_dir = get_spool_dir(config_data)
+
+    with spool_lock(spool_dir):
+        entries = list_spool(spool_dir)
+
+        if not entries:
+            return []
+
+        submitted = {
+            event['id']: event
+            for event in read_journal(spool_dir)
+            if event['event'] == 'submitted'
+        }
+
+        try:
+            get_access_token(config_data)
+        except MashConnectionException as error:
+            return [
+                {'id': entry['id'], 'error': str(error), 'spooled': True}
+                for entry in entries
+            ]
+
+        def submit(entry):
+            doc_id = entry['id']
+            doc_path = os.path.join(spool_dir, doc_id + '.json')
+
+            event = submitted.get(doc_id)
+
+            if event and event['time'] >= entry.get('spooled', 0):
+                # Submitted before the document could be removed
+                os.remove(doc_path)
+                return {'id': doc_id, 'job_id': event['job_id']}
+
+            for attempt in range(retries + 1):
+                try:
+                    result = add_job(
+                        config_data,
+                        entry['job_data'],
+                        entry['cloud'],
+                        api_version=entry['api_version']
+                    )
+                except MashConnectionException as error:
+                    if attempt == retries:
+                        write_journal(spool_dir, 'deferred', doc_id)
+                        return {
+                            'id': doc_id,
+                            'error': str(error),
+                            'spooled': True
+                        }
+
+                    sleep_before_deadline(config_data, backoff * 2 ** attempt)
+                except MashDeadlineException as error:
+                    return {'id': doc_id, 'error': str(error), 'spooled': True}
+                except MashClientException as error:
+                    if not is_rejected(error):
+                        write_journal(spool_dir, 'deferred', doc_id)
+                        return {
+                            'id': doc_id,
+                            'error': str(error),
+                            'spooled': True
+                        }
+
+                    failed_dir = os.path.join(spool_dir, 'failed')
+                    os.makedirs(failed_dir, exist_ok=True)
+                    os.replace(
+                        doc_path,
+                        os.path.join(failed_dir, doc_id + '.json')
+                    )
+                    write_journal(
+                        spool_dir,
+                        'failed',
+                        doc_id,
+                        error=str(error)
+                    )
+                    return {'id': doc_id, 'error': str(error)}
+                else:
+                    write_journal(
+                        spool_dir,
+                        'submitted',
+                        doc_id,
+                        job_id=result.get('job_id')
+                    )
+                    os.remove(doc_path)
+                    return {'id': doc_id, 'job_id': result.get('job_id')}
+
+        results = map_concurrently(submit, entries, concurrency)
+        compact_journal(spool_dir)
+
+        return [
+            result or {'id': entry['id'], 'error': str(error)}
+            for entry, (result, error) in zip(entries, results)
+        ]
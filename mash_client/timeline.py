@@ -0,0 +1,331 @@
+# -*- coding: utf-8 -*-
+
+"""Recording of job state transitions and service durations."""
+
+# Copyright (c) 2026 SUSE LLC. All rights reserved.
+#
+# This file is part of mash_client. mash_client provides a command line
+# utility for interfacing with a MASH server.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import glob
+import json
+import os
+import re
+import time
+
+from collections import defaultdict
+
+from mash_client.bench import percentile
+from mash_client.ratelimit import get_state_file
+
+# The services of the MASH pipeline in the order they run
+services = (
+    'obs', 'upload', 'create', 'test', 'replicate', 'publish', 'deprecate'
+)
+
+# Transitions of jobs not seen for 30 days are forgotten
+retention = 30 * 86400
+
+# The last state recorded for each timeline file by this process
+recorded_states = {}
+
+
+def format_time(timestamp):
+    if timestamp is None:
+        return None
+
+    return time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(timestamp))
+
+
+def get_timeline_dir(config_data):
+    """
+    Return the directory of the job timelines of the server.
+    """
+    return os.path.splitext(get_state_file(config_data, 'timeline'))[0]
+
+
+def get_timeline_file(config_data, job_id):
+    return os.path.join(
+        get_timeline_dir(config_data),
+        re.sub(r'[^\w.-]', '_', str(job_id)) + '.jsonl'
+    )
+
+
+def load_entry(timeline_file):
+    """
+    Return the recorded events and details of a job or None.
+
+    Consecutive observations of the same state, written by processes
+    polling the job at the same time, are merged.
+    """
+    entry = {'events': []}
+
+    try:
+        with open(timeline_file) as timeline:
+            for line in timeline:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+
+                event = record.pop('event')
+                if not entry['events'] or \
+                        entry['events'][-1][1:] != event[1:]:
+                    entry['events'].append(event)
+
+                entry.update(record)
+    except FileNotFoundError:
+        return None
+
+    return entry if entry['events'] else None
+
+
+def prune_timelines(timeline_dir, now):
+    """
+    Remove the timelines of jobs not observed within the retention.
+
+    Timelines are pruned at most once a day.
+    """
+    marker = os.path.join(timeline_dir, '.pruned')
+
+    try:
+        if now - os.stat(marker).st_mtime < 86400:
+            return
+    except FileNotFoundError:
+        pass
+
+    with open(marker, 'w'):
+        pass
+
+    for timeline_file in glob.glob(os.path.join(timeline_dir, '*.jsonl')):
+        try:
+            if now - os.stat(timeline_file).st_mtime > retention:
+                os.remove(timeline_file)
+        except FileNotFoundError:
+            pass
+
+
+def record_job_state(config_data, job_id, job, start_time=None):
+    """
+    Record the state of a job if it changed since the last observation.
+
+    Each observed state and service of a job is appended with the time
+    it was first seen to the timeline file of the job. The last state
+    recorded by the process is kept in memory so polling a job which
+    did not change does not touch the file.
+    """
+    state = job.get('state')
+
+    if not state:
+        return
+
+    if state == 'running':
+        service = job.get('current_service')
+    else:
+        service = job.get('failed_service')
+
+    timeline_file = get_timeline_file(config_data, job_id)
+
+    if recorded_states.get(timeline_file) == (state, service):
+        return
+
+    entry = load_entry(timeline_file)
+
+    if entry and entry['events'][-1][1:] == [state, service]:
+        recorded_states[timeline_file] = (state, service)
+        return
+
+    event = [round(time.time(), 3), state, service]
+    record = {'event': event}
+
+    for key, value in (
+        ('cloud', job.get('cloud')),
+        ('last_service', job.get('last_service')),
+        ('start_time', start_time)
+    ):
+        if value and (not entry or entry.get(key) != value):
+            record[key] = value
+
+    os.makedirs(os.path.dirname(timeline_file), exist_ok=True)
+
+    if not entry:
+        prune_timelines(os.path.dirname(timeline_file), event[0])
+
+    with open(timeline_file, 'a') as timeline:
+        timeline.write(json.dumps(record) + '\n')
+
+    recorded_states[timeline_file] = (state, service)
+
+
+def get_skipped_services(service, next_service):
+    """
+    Return the services between two observed services.
+    """
+    if service not in services or next_service not in services:
+        return []
+
+    return list(services[services.index(service) + 1:
+                         services.index(next_service)])
+
+
+def build_timeline(entry):
+    """
+    Return the service segments of a recorded job.
+
+    A segment starts when a service was first observed and ends when
+    the next state was observed. The precision is the interval the job
+    was polled at. Services which started and ended between two
+    observations are listed in includes of the previous segment.
+    The first service starts at the start time of the job.
+    """
+    events = entry['events']
+    segments = []
+
+    for index, (observed, state, service) in enumerate(events):
+        if state != 'running' or not service:
+            continue
+
+        start = observed
+        if index == 0 and service == services[0] and entry.get('start_time'):
+            start = min(entry['start_time'], observed)
+
+        segment = {'service': service, 'start': start, 'end': None}
+
+        if index + 1 < len(events):
+            end, next_state, next_service = events[index + 1]
+            segment['end'] = end
+
+            if next_state == 'finished':
+                last_service = entry.get('last_service')
+                includes = get_skipped_services(service, last_service)
+
+                if last_service in services and last_service != service:
+                    includes.append(last_service)
+            else:
+                includes = get_skipped_services(service, next_service)
+
+            if next_state == 'failed':
+                segment['failed'] = True
+
+                if next_service and next_service != service:
+                    includes.append(next_service)
+
+            if includes:
+                segment['includes'] = includes
+
+        segments.append(segment)
+
+    return segments
+
+
+def format_timeline(job_id, entry):
+    """
+    Return the timeline of a recorded job for display.
+    """
+    segments = []
+
+    for segment in build_timeline(entry):
+        duration = None
+        if segment['end'] is not None:
+            duration = round(segment['end'] - segment['start'], 1)
+
+        segments.append(
+            dict(
+                segment,
+                start=format_time(segment['start']),
+                end=format_time(segment['end']),
+                duration=duration
+            )
+        )
+
+    last_event = entry['events'][-1]
+    return {
+        'job_id': job_id,
+        'cloud': entry.get('cloud'),
+        'state': last_event[1],
+        'observations': len(entry['events']),
+        'services': segments
+    }
+
+
+def get_job_timeline(config_data, job_id):
+    """
+    Return the timeline of a job from its timeline file.
+    """
+    entry = load_entry(get_timeline_file(config_data, job_id))
+
+    if not entry:
+        return None
+
+    return format_timeline(str(job_id), entry)
+
+
+def get_service_stats(config_data, cloud=None, since=None):
+    """
+    Return duration statistics per cloud and service of recorded jobs.
+
+    Only segments with an observed end which contain a single service
+    and did not fail are included. If since is provided only jobs
+    observed within the last since seconds are included.
+    """
+    timeline_dir = get_timeline_dir(config_data)
+    entries = []
+
+    for timeline_file in glob.glob(os.path.join(timeline_dir, '*.jsonl')):
+        entry = load_entry(timeline_file)
+
+        if entry:
+            entries.append(entry)
+
+    now = time.time()
+    durations = defaultdict(lambda: defaultdict(list))
+
+    for entry in entries:
+        job_cloud = entry.get('cloud') or 'unknown'
+
+        if cloud and job_cloud != cloud:
+            continue
+
+        if since and now - entry['events'][-1][0] > since:
+            continue
+
+        for segment in build_timeline(entry):
+            if segment['end'] is None or segment.get('includes') or \
+                    segment.get('failed'):
+                continue
+
+            durations[job_cloud][segment['service']].append(
+                segment['end'] - segment['start']
+            )
+
+    stats = {}
+    for job_cloud, cloud_durations in sorted(durations.items()):
+        stats[job_cloud] = {}
+
+        for service in services:
+            values = sorted(cloud_durations.get(service, []))
+
+            if not values:
+                continue
+
+            stats[job_cloud][service] = {
+                'count': len(values),
+                'median': round(percentile(values, 50), 1),
+                'p95': round(percentile(values, 95), 1),
+                'max': round(values[-1], 1)
+            }
+
+    return stats
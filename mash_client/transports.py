@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+"""Alternative HTTP transports for mash client requests."""
+
+# Copyright (c) 2026 SUSE LLC. All rights reserved.
+#
+# This file is part of mash_client. mash_client provides a command line
+# utility for interfacing with a MASH server.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import requests
+import ssl
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+
+class Http2Session(object):
+    """
+    HTTP/2 capable session backed by httpx.
+
+    Provides the subset of the requests.Session interface used by
+    handle_request. Concurrent requests to the same host are
+    multiplexed over a single connection when the server negotiates
+    HTTP/2. Transport errors are re-raised as the equivalent requests
+    exceptions.
+    """
+
+    def __init__(self, verify=True, pool_size=10):
+        if httpx is None:
+            raise ImportError(
+                'The http2 transport requires httpx: '
+                'pip install "httpx[http2]"'
+            )
+
+        if isinstance(verify, str):
+            verify = ssl.create_default_context(cafile=verify)
+
+        self.client = httpx.Client(
+            http2=True,
+            verify=verify,
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size
+            )
+        )
+
+    def request(
+        self, method, url, data=None, headers=None, timeout=None,
+        stream=False, **kwargs
+    ):
+        if headers:
+            # httpx advertises the encodings it is able to decode
+            headers = {
+                key: value for key, value in headers.items()
+                if key.lower() != 'accept-encoding'
+            }
+
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+
+        try:
+            request = self.client.build_request(
+                method.upper(),
+                url,
+                content=data,
+                headers=headers,
+                timeout=timeout
+            )
+            response = self.client.send(request, stream=stream)
+
+            if stream and response.status_code not in (200, 201):
+                # Error messages are decoded at once
+                response.read()
+
+            return response
+        except httpx.ConnectTimeout as error:
+            raise requests.ConnectTimeout(str(error))
+        except httpx.TimeoutException as error:
+            raise requests.ReadTimeout(str(error))
+        except httpx.TransportError as error:
+            raise requests.ConnectionError(str(error))
+
+    def get(self, url, **kwargs):
+        return self.request('get', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('post', url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request('put', url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request('delete', url, **kwargs)
+
+    def close(self):
+        self.client.close()
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+"""Transport of requests over Unix domain sockets."""
+
+# Copyright (c) 2026 SUSE LLC. All rights reserved.
+#
+# This file is part of mash_client. mash_client provides a command line
+# utility for interfacing with a MASH server.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import socket
+import threading
+
+from requests.adapters import HTTPAdapter
+from urllib.parse import quote, unquote, urlparse
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool
+
+UNIX_SCHEME = 'http+unix://'
+
+
+def get_unix_socket_url(socket_path):
+    """
+    Return the base URL of requests to the Unix domain socket path.
+
+    The path is percent encoded as the host of the URL.
+    """
+    return UNIX_SCHEME + quote(socket_path, safe='')
+
+
+def get_unix_socket_path(url):
+    """
+    Return the socket path of an http+unix URL.
+    """
+    return unquote(urlparse(url).netloc)
+
+
+def is_unix_socket_url(url):
+    return bool(url) and url.startswith(UNIX_SCHEME)
+
+
+class UnixHTTPConnection(HTTPConnection):
+    """
+    HTTP connection over a Unix domain socket.
+    """
+
+    def __init__(self, *args, socket_path=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.socket_path = socket_path
+
+    def _new_conn(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        try:
+            sock.settimeout(self.timeout)
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+
+        return sock
+
+
+class UnixHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = UnixHTTPConnection
+
+
+class UnixHTTPAdapter(HTTPAdapter):
+    """
+    Transport adapter sending requests over Unix domain sockets.
+
+    Mounted for http+unix URLs. Connections to each socket are pooled
+    like TCP connections.
+    """
+
+    def __init__(self, pool_size=10):
+        self.pool_size = pool_size
+        self.pools = {}
+        self.pools_lock = threading.Lock()
+        super().__init__(pool_connections=pool_size, pool_maxsize=pool_size)
+
+    def get_connection(self, url, proxies=None):
+        socket_path = get_unix_socket_path(url)
+
+        with self.pools_lock:
+            pool = self.pools.get(socket_path)
+
+            if pool is None:
+                pool = UnixHTTPConnectionPool(
+                    'localhost',
+                    maxsize=self.pool_size,
+                    socket_path=socket_path
+                )
+                self.pools[socket_path] = pool
+
+        return pool
+
+    def get_connection_with_tls_context(
+        self, request, verify, proxies=None, cert=None
+    ):
+        return self.get_connection(request.url, proxies)
+
+    def request_url(self, request, proxies):
+        return request.path_url
+
+    def close(self):
+        with self.pools_lock:
+            for pool in self.pools.values():
+                pool.close()
+
+            self.pools.clear()
+
+        super().close()
@@ -48,14 +48,21 @@ setup(
     },
     entry_points={
         'console_scripts': [
-            'mash=mash_client.cli:main'
+            'mash=mash_client.completion:main'
         ]
     },
     include_package_data=True,
     python_requires='>=3.8',
     install_requires=requirements,
     extras_require={
-        'dev': dev_requirements
+        'dev': dev_requirements,
+        'http2': ['httpx[http2]'],
+        'parquet': ['pyarrow'],
+        'compression': [
+            'brotli',
+            'backports.zstd; python_version < "3.14"',
+            'zstandard'
+        ]
     },
     license='GPLv3+',
     zip_safe=False,
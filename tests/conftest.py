@@ -0,0 +1,96 @@
+import pytest
+
+from mash_client import cli_utils
+from mash_client.controller import login_with_pass
+from mash_client.fake_server import FakeMashServer
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        'markers',
+        'fake_server(**kwargs): options of the fake_server fixture'
+    )
+
+
+@pytest.fixture(autouse=True)
+def state_dir(tmp_path, monkeypatch):
+    """
+    Write the state files of commands to a temporary directory.
+
+    Tests using the config in tests/data would otherwise record job
+    timelines and other state in the source tree.
+    """
+    state_dir = tmp_path / 'state'
+    monkeypatch.setitem(cli_utils.defaults, 'state_dir', str(state_dir))
+    return state_dir
+
+
+@pytest.fixture
+def job_doc():
+    """
+    Return a valid job document for every cloud.
+    """
+    return {
+        'cloud_account': 'acnt1',
+        'image': 'test_image_oem',
+        'utctime': 'now',
+        'download_url': 'http://download.opensuse.org/images'
+    }
+
+
+@pytest.fixture
+def fake_server(request):
+    """
+    Run a fake MASH server for the test.
+
+    Options of the server are set with the fake_server marker, for
+    example @pytest.mark.fake_server(service_time=0).
+    """
+    marker = request.node.get_closest_marker('fake_server')
+    options = marker.kwargs if marker else {}
+
+    with FakeMashServer(**options) as server:
+        yield server
+
+
+@pytest.fixture
+def logged_in_config(fake_server, tmp_path, state_dir):
+    """
+    Return the config of the default profile logged in to fake_server.
+
+    The tokens are stored in tmp_path, which is the config directory,
+    and state files in the state directory of commands.
+    """
+    config_data = {
+        'url': fake_server.url,
+        'verify': False,
+        'config_dir': str(tmp_path) + '/',
+        'profile': 'default',
+        'state_dir': str(state_dir)
+    }
+    login_with_pass(config_data, 'user1@fake.com', 'secret')
+    return config_data
+
+
+@pytest.fixture
+def mash_args(fake_server, tmp_path):
+    """
+    Return the global mash arguments to run commands against fake_server.
+    """
+    host, port = fake_server.server_address[:2]
+    return [
+        '-C', str(tmp_path) + '/', '--host', 'http://' + host,
+        '--port', str(port), '--no-color'
+    ]
+
+
+@pytest.fixture
+def config_dir(fake_server, tmp_path):
+    """
+    Return a config directory with a default profile for fake_server.
+    """
+    host, port = fake_server.server_address[:2]
+    (tmp_path / 'default.yaml').write_text(
+        'host: http://{0}\nport: {1}\n'.format(host, port)
+    )
+    return str(tmp_path) + '/'
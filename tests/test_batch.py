@@ -0,0 +1,70 @@
+import json
+import uuid
+
+from pytest import raises
+
+from mash_client.cli import main
+from mash_client.cli.batch import parse_batch
+from mash_client.controller import add_job
+from mash_client.mash_client_exceptions import MashClientException
+
+from click.testing import CliRunner
+
+
+def test_parse_batch():
+    assert parse_batch(
+        '# release jobs\n'
+        'mash job list\n'
+        '\n'
+        'job status --job-id "1 2"  # quoted\n'
+    ) == [['job', 'list'], ['job', 'status', '--job-id', '1 2']]
+
+    assert parse_batch(
+        '["mash job list", ["job", "status", "--job-id", 1]]'
+    ) == [['job', 'list'], ['job', 'status', '--job-id', '1']]
+
+    with raises(MashClientException):
+        parse_batch('["job list"')
+
+    with raises(MashClientException):
+        parse_batch('batch other.txt')
+
+
+def test_batch(tmp_path, logged_in_config, config_dir, job_doc):
+    job_ids = [add_job(logged_in_config, job_doc, 'ec2')['job_id']]
+    job_ids.append(add_job(logged_in_config, job_doc, 'gce')['job_id'])
+
+    lines = [
+        'mash job status --job-id {0}'.format(job_id)
+        for job_id in job_ids
+    ]
+    lines.append('job status --job-id {0}'.format(uuid.uuid4()))
+    lines.append('account ec2 list')
+    batch_file = tmp_path / 'batch.txt'
+    batch_file.write_text('\n'.join(lines))
+
+    runner = CliRunner()
+    result = runner.invoke(
+        main,
+        ['-C', config_dir, 'batch', str(batch_file), '--jobs', '4']
+    )
+    assert result.exit_code == 1
+
+    results = [json.loads(line) for line in result.output.splitlines()]
+    assert [item['exit_code'] for item in results] == [0, 0, 1, 0]
+    assert results[0]['args'] == ['job', 'status', '--job-id', job_ids[0]]
+    assert results[0]['result']['state'] in ('running', 'finished')
+    assert 'Job does not exist' in results[2]['output']
+    assert results[3]['result'] == []
+
+    # JSON list from stdin
+    result = runner.invoke(
+        main,
+        ['-C', config_dir, 'batch', '-'],
+        input=json.dumps([['account', 'gce', 'list'], 'job list'])
+    )
+    assert result.exit_code == 0
+
+    results = [json.loads(line) for line in result.output.splitlines()]
+    assert len(results) == 2
+    assert len(results[1]['result']) == 2
@@ -0,0 +1,100 @@
+import json
+import uuid
+
+from click.testing import CliRunner
+from pytest import mark
+
+from mash_client.bench import percentile, summarize_results
+from mash_client.cli import main
+from mash_client.controller import add_job
+
+
+def test_percentile():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile(values, 100) == 100
+    assert percentile([], 50) == 0.0
+
+
+def test_summarize_results():
+    results = [(0.1, None), (0.2, None), (0.3, 'MashClientException')]
+    summary = summarize_results('poll', results, 1.5, 2)
+
+    assert summary['requests'] == 3
+    assert summary['throughput'] == 2.0
+    assert summary['errors'] == 1
+    assert summary['error_types'] == {'MashClientException': 1}
+    assert summary['latency_ms']['p50'] == 200.0
+    assert summary['latency_ms']['max'] == 300.0
+
+
+def invoke_bench(mash_args, args):
+    runner = CliRunner()
+    return runner.invoke(main, mash_args + ['bench'] + args)
+
+
+@mark.fake_server(cache_max_age=60)
+def test_bench_poll(
+    tmp_path, fake_server, logged_in_config, mash_args, job_doc
+):
+    # Responses are not served from the cache of the profile
+    (tmp_path / 'default.yaml').write_text('cache_size: 10\n')
+    add_job(logged_in_config, job_doc, 'ec2')
+    args = ['poll', '-n', '20', '-c', '4', '--json']
+
+    result = invoke_bench(mash_args, args)
+    poll_count = fake_server.state.request_count
+
+    result = invoke_bench(mash_args, args)
+    assert fake_server.state.request_count - poll_count >= 20
+
+    assert result.exit_code == 0
+    summary = json.loads(result.output)
+    assert summary['scenario'] == 'poll'
+    assert summary['requests'] == 20
+    assert summary['errors'] == 0
+
+
+def test_bench_poll_throttled(
+    tmp_path, state_dir, fake_server, logged_in_config, mash_args
+):
+    (tmp_path / 'default.yaml').write_text('rate_limit: 100\n')
+    fake_server.throttle_rate = 1.0
+    request_count = fake_server.state.request_count
+
+    result = invoke_bench(
+        mash_args,
+        [
+            'poll', '--job-id', str(uuid.uuid4()), '-n', '10', '-c', '2',
+            '--json'
+        ]
+    )
+
+    # Throttled requests are errors and not retried
+    assert result.exit_code == 0
+    assert fake_server.state.request_count - request_count == 10
+    summary = json.loads(result.output)
+    assert summary['errors'] == 10
+    assert not list(state_dir.glob('ratelimit_*.json'))
+
+
+@mark.fake_server(seed=1)
+def test_bench_submit(
+    tmp_path, fake_server, logged_in_config, mash_args, job_doc
+):
+    document = tmp_path / 'job.json'
+    document.write_text(json.dumps(job_doc))
+    add_job(logged_in_config, job_doc, 'ec2')
+    fake_server.error_rate = 0.5
+
+    result = invoke_bench(
+        mash_args,
+        ['submit', '--cloud', 'ec2', str(document), '-n', '10']
+    )
+    assert len(fake_server.state.jobs) == 1
+
+    assert result.exit_code == 0
+    assert 'Scenario:    submit' in result.output
+    assert 'MashClientException' in result.output
+    assert 'p99=' in result.output
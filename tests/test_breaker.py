@@ -0,0 +1,128 @@
+import os
+import pytest
+import time
+
+from mash_client.breaker import CircuitBreaker, get_circuit_breaker
+from mash_client.controller import get_job_status
+from mash_client.mash_client_exceptions import (
+    MashCircuitOpenException,
+    MashClientException,
+    MashConnectionException
+)
+
+
+def test_circuit_breaker(tmp_path):
+    state_file = str(tmp_path / 'breaker.json')
+    breaker = CircuitBreaker(state_file, 'http://mash', 2, 0.2)
+
+    breaker.before_request()
+    breaker.record_failure()
+    breaker.before_request()
+    breaker.record_failure()
+
+    # Open, the state is shared through the state file
+    with pytest.raises(MashCircuitOpenException) as error:
+        CircuitBreaker(state_file, 'http://mash', 2, 0.2).before_request()
+
+    assert 'after 2 consecutive failures' in str(error.value)
+
+    # Half-open, a single probe is let through
+    time.sleep(0.2)
+    breaker.before_request()
+
+    with pytest.raises(MashCircuitOpenException):
+        breaker.before_request()
+
+    # Failed probe opens the circuit again
+    breaker.record_failure()
+    with pytest.raises(MashCircuitOpenException):
+        breaker.before_request()
+
+    time.sleep(0.2)
+    breaker.before_request()
+    breaker.record_success()
+    breaker.before_request()
+    breaker.before_request()
+
+
+def test_circuit_breaker_stale_failures(tmp_path):
+    state_file = str(tmp_path / 'breaker.json')
+    breaker = CircuitBreaker(state_file, 'http://mash', 2, 0.1)
+
+    breaker.record_failure()
+    time.sleep(0.15)
+    breaker.record_failure()
+    breaker.before_request()
+
+
+def test_circuit_breaker_remove_stale(tmp_path):
+    stale_file = tmp_path / 'breaker_127.0.0.1_5001.json'
+    stale_file.write_text('{"failures": 1}')
+    recent_file = tmp_path / 'breaker_127.0.0.1_5002.json'
+    recent_file.write_text('{"failures": 1}')
+
+    past = time.time() - 60
+    os.utime(str(stale_file), (past, past))
+
+    breaker = get_circuit_breaker({
+        'url': 'http://127.0.0.1:5000',
+        'state_dir': str(tmp_path),
+        'breaker_cooldown': 30
+    })
+    breaker.record_failure()
+
+    assert not stale_file.exists()
+    assert recent_file.exists()
+    assert os.path.exists(breaker.state_file)
+
+    # A closed circuit has no state file
+    breaker.record_success()
+    assert not os.path.exists(breaker.state_file)
+
+
+def test_circuit_breaker_disabled(tmp_path):
+    breaker = get_circuit_breaker({
+        'url': 'http://mash',
+        'config_dir': str(tmp_path),
+        'breaker_threshold': 0
+    })
+
+    for _ in range(10):
+        breaker.record_failure()
+        breaker.before_request()
+
+    assert not (tmp_path / 'breaker_mash.json').exists()
+
+
+def test_handle_request_circuit_breaker(
+    tmp_path, fake_server, logged_in_config
+):
+    logged_in_config['breaker_threshold'] = 3
+    job_id = fake_server.state.add_job('ec2', {'image': 'test'})['job_id']
+    fake_server.error_rate = 1.0
+
+    for _ in range(3):
+        with pytest.raises(MashClientException) as error:
+            get_job_status(logged_in_config, job_id)
+
+        assert str(error.value) == 'Injected server error.'
+
+    request_count = fake_server.state.request_count
+
+    with pytest.raises(MashCircuitOpenException):
+        get_job_status(logged_in_config, job_id)
+
+    assert fake_server.state.request_count == request_count
+    fake_server.stop()
+
+    # Connection failures count as failures
+    logged_in_config['state_dir'] = str(tmp_path / 'other')
+
+    for _ in range(3):
+        with pytest.raises(MashConnectionException) as error:
+            get_job_status(logged_in_config, job_id)
+
+        assert not isinstance(error.value, MashCircuitOpenException)
+
+    with pytest.raises(MashCircuitOpenException):
+        get_job_status(logged_in_config, job_id)
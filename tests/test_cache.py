@@ -0,0 +1,160 @@
+import os
+import time
+
+from pytest import mark
+from unittest.mock import Mock
+
+from mash_client.cache import ResponseCache, get_expiry, get_response_cache
+from mash_client.cli_utils import handle_request_with_token
+from mash_client.controller import add_job, list_user_jobs
+
+
+def make_response(headers):
+    response = Mock()
+    response.headers = headers
+    return response
+
+
+def test_get_expiry():
+    now = 1000.0
+
+    assert get_expiry(make_response({}), now) == 0
+    assert get_expiry(
+        make_response({'Cache-Control': 'private, max-age=60'}),
+        now
+    ) == 1060.0
+    assert get_expiry(
+        make_response({'Cache-Control': 'max-age=60', 'Age': '10'}),
+        now
+    ) == 1050.0
+    assert get_expiry(make_response({'Cache-Control': 'no-cache'}), now) == 0
+    assert get_expiry(
+        make_response({'Cache-Control': 'no-store, max-age=60'}),
+        now
+    ) is None
+    assert get_expiry(
+        make_response({'Expires': 'Thu, 01 Jan 1970 00:20:00 GMT'}),
+        now
+    ) == 1200.0
+    assert get_expiry(make_response({'Expires': 'invalid'}), now) == 0
+
+
+def test_response_cache_lru(tmp_path):
+    cache = ResponseCache(str(tmp_path), 'http://mash', 1024)
+    response = make_response({'Cache-Control': 'max-age=60'})
+
+    for index in range(4):
+        cache.store(
+            '/v1/accounts/ec2/acnt{0}'.format(index),
+            None,
+            response,
+            {'data': 'x' * 300}
+        )
+        # Distinct access times for the eviction order
+        entry_file = cache.get_entry_file(
+            '/v1/accounts/ec2/acnt{0}'.format(index),
+            None
+        )
+        os.utime(entry_file, (time.time() - 10 + index,) * 2)
+
+    # Least recently used entry was evicted
+    assert cache.lookup('/v1/accounts/ec2/acnt0', None) is None
+    assert cache.lookup('/v1/accounts/ec2/acnt3', None)
+
+    # Entries without freshness information or ETag are not stored
+    cache.store('/v1/user/', None, make_response({}), {'id': '1'})
+    assert cache.lookup('/v1/user/', None) is None
+
+
+def test_response_cache_disabled(tmp_path):
+    assert get_response_cache({
+        'url': 'http://mash',
+        'config_dir': str(tmp_path),
+        'cache_size': 0
+    }) is None
+
+    # The cache is only used if the profile sets a size
+    assert get_response_cache({
+        'url': 'http://mash',
+        'config_dir': str(tmp_path)
+    }) is None
+
+
+@mark.fake_server(cache_max_age=60)
+def test_handle_request_cache(fake_server, logged_in_config):
+    logged_in_config['cache_size'] = 10
+
+    assert handle_request_with_token(
+        logged_in_config,
+        '/v1/accounts/ec2/',
+        action='get'
+    ) == []
+
+    # Fresh response is served without a request
+    request_count = fake_server.state.request_count
+    assert handle_request_with_token(
+        logged_in_config,
+        '/v1/accounts/ec2/',
+        action='get'
+    ) == []
+    assert fake_server.state.request_count == request_count
+
+    # Adding an account invalidates the account list
+    handle_request_with_token(
+        logged_in_config,
+        '/v1/accounts/ec2/',
+        {'account_name': 'acnt1', 'region': 'us-east-1'}
+    )
+    accounts = handle_request_with_token(
+        logged_in_config,
+        '/v1/accounts/ec2/',
+        action='get'
+    )
+    assert [account['name'] for account in accounts] == ['acnt1']
+
+    # Cache is skipped with --no-cache
+    request_count = fake_server.state.request_count
+    handle_request_with_token(
+        dict(logged_in_config, no_cache=True),
+        '/v1/accounts/ec2/',
+        action='get'
+    )
+    assert fake_server.state.request_count == request_count + 1
+
+
+@mark.fake_server(cache_max_age=0)
+def test_handle_request_revalidate(fake_server, logged_in_config):
+    logged_in_config['cache_size'] = 10
+
+    for _ in range(3):
+        result = handle_request_with_token(
+            logged_in_config,
+            '/v1/user/',
+            action='get'
+        )
+        assert result['email'] == 'user1@fake.com'
+
+    assert fake_server.state.not_modified_count == 2
+
+
+@mark.fake_server(cache_max_age=60, per_page=2)
+def test_handle_request_cache_body(logged_in_config, job_doc):
+    logged_in_config['cache_size'] = 10
+
+    for index in range(4):
+        add_job(
+            logged_in_config,
+            dict(job_doc, image='i{0}'.format(index)),
+            'ec2'
+        )
+
+    # Pages of the job list are cached separately
+    for _ in range(2):
+        pages = [
+            [
+                job['image']
+                for job in list_user_jobs(logged_in_config, page=page)
+            ]
+            for page in (1, 2)
+        ]
+        assert pages[0] != pages[1]
@@ -0,0 +1,141 @@
+import json
+import jwt
+import time
+
+from mash_client.check import (
+    CRITICAL,
+    OK,
+    UNKNOWN,
+    WARNING,
+    evaluate_job,
+    format_check,
+    get_check_status
+)
+from mash_client.cli import main
+from mash_client.controller import add_job
+
+from click.testing import CliRunner
+from pytest import mark
+
+
+def test_evaluate_job():
+    assert evaluate_job({'state': 'running'})['status'] == 'pending'
+    assert evaluate_job(
+        {'state': 'failed', 'failed_service': 'upload'}
+    )['reason'] == 'failed in upload'
+    assert evaluate_job(
+        {'state': 'finished'},
+        {'msg': 'The job has no test results.'}
+    )['status'] == 'unknown'
+    assert evaluate_job(
+        {'state': 'finished'},
+        {'summary': {'num_tests': 2, 'passed': 1, 'failed': 1}}
+    )['status'] == 'failing'
+    assert evaluate_job(
+        {'state': 'finished'},
+        {'summary': {'num_tests': 2, 'passed': 2}}
+    )['status'] == 'passing'
+
+    # Jobs which end before the test service have no test results
+    assert evaluate_job(
+        {'state': 'finished', 'last_service': 'create'},
+        {'msg': 'The job has no test results.'}
+    )['status'] == 'passing'
+    assert evaluate_job(
+        {'state': 'finished', 'last_service': 'publish'},
+        {'msg': 'The job has no test results.'}
+    )['status'] == 'unknown'
+
+
+def test_check_status():
+    passing = {'status': 'passing', 'summary': {'num_tests': 2, 'passed': 2}}
+    failing = {'status': 'failing', 'job_id': '1', 'reason': 'tests failed'}
+
+    assert get_check_status([]) == UNKNOWN
+    assert get_check_status([passing]) == OK
+    assert get_check_status([passing, {'status': 'unknown'}]) == WARNING
+    assert get_check_status([passing, failing]) == CRITICAL
+    assert get_check_status([failing], warning=1, critical=2) == WARNING
+    assert get_check_status([failing], warning=0, critical=0) == OK
+
+    output = format_check(
+        [passing, passing, failing],
+        CRITICAL,
+        warning=1,
+        critical=2,
+        verbose=True
+    )
+    assert output.splitlines() == [
+        'MASH JOBS CRITICAL - 3 jobs, 1 failing, 0 unknown, 0 pending|'
+        'jobs=3;;;0 failing=1;0;1;0 unknown=0;;;0 pending=0;;;0 '
+        'tests=4;;;0 pass=4;;;0 skip=0;;;0 fail=0;;;0 error=0;;;0',
+        'failing 1 (unknown cloud): tests failed'
+    ]
+
+
+@mark.fake_server(service_time=0.01)
+def test_check_jobs(fake_server, logged_in_config, config_dir, job_doc):
+    job_ids = [
+        add_job(logged_in_config, job_doc, cloud)['job_id']
+        for cloud in ('ec2', 'ec2', 'ec2', 'gce')
+    ]
+    fake_server.state.jobs[job_ids[0]]['failed_service'] = 'obs'
+    time.sleep(0.1)
+
+    def check(*args):
+        runner = CliRunner()
+        return runner.invoke(
+            main,
+            ['-C', config_dir, 'check', 'jobs'] + list(args)
+        )
+
+    result = check()
+    assert result.exit_code == CRITICAL
+    assert result.output.startswith(
+        'MASH JOBS CRITICAL - 4 jobs, 1 failing'
+    )
+    assert 'tests=6;;;0' in result.output
+
+    # The failed job is the oldest ec2 job
+    fake_server.state.jobs[job_ids[0]]['created'] -= 10
+    result = check('--last', '2', '--cloud', 'ec2')
+    assert result.exit_code == OK
+    assert 'jobs=2;;;0' in result.output
+
+    result = check('--job-id', job_ids[0], '--verbose')
+    assert result.exit_code == CRITICAL
+    assert result.output.splitlines()[1] == \
+        'failing {0} (ec2): failed in obs'.format(job_ids[0])
+
+    result = check('--match', 'no-such-image')
+    assert result.exit_code == UNKNOWN
+    assert 'No jobs selected' in result.output
+
+    fake_server.stop()
+    result = check()
+    assert result.exit_code == UNKNOWN
+    assert result.output.startswith(
+        'MASH JOBS UNKNOWN - MashConnectionException'
+    )
+
+
+def test_check_jobs_login_failure(tmp_path):
+    config_dir = str(tmp_path) + '/'
+    (tmp_path / 'default_tokens.json').write_text(json.dumps({
+        'access_token': jwt.encode(
+            {'exp': int(time.time()) - 60},
+            'test-token-signing-secret-of-32-bytes'
+        )
+    }))
+
+    # No config file and no refresh token for the expired access token
+    runner = CliRunner()
+    result = runner.invoke(main, ['-C', config_dir, 'check', 'jobs'])
+
+    assert result.exit_code == UNKNOWN
+    assert result.stdout.splitlines() == [
+        'MASH JOBS UNKNOWN - Unable to authenticate, please login '
+        '(mash auth login).'
+    ]
+    assert 'Config file' in result.stderr
+    assert 'No refresh token' in result.stderr
@@ -22,6 +22,8 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from mash_client.cli import main
+from mash_client.controller import add_job, login_with_pass
+from mash_client.fake_server import FakeMashServer
 
 from click.testing import CliRunner
 
@@ -40,3 +42,63 @@ def test_print_license():
     result = runner.invoke(main, ['--license'])
     assert result.exit_code == 0
     assert result.output == 'GPLv3+\n'
+
+
+def test_profiles_fan_out(tmp_path, job_doc):
+    """Confirm commands run against each profile with --profiles."""
+    config_dir = str(tmp_path) + '/'
+
+    with FakeMashServer() as staging, FakeMashServer() as production:
+        for profile, server in (('staging', staging), ('prod', production)):
+            host, port = server.server_address[:2]
+            (tmp_path / (profile + '.yaml')).write_text(
+                'host: http://{0}\nport: {1}\n'.format(host, port)
+            )
+
+        (tmp_path / 'broken.yaml').write_text('host: http://127.0.0.1\n')
+
+        for server in (staging, production):
+            config_data = {
+                'url': server.url,
+                'verify': False,
+                'config_dir': config_dir,
+                'profile': 'staging' if server is staging else 'prod'
+            }
+            login_with_pass(config_data, 'user1@fake.com', 'secret')
+            add_job(config_data, job_doc, 'ec2')
+
+        runner = CliRunner()
+        result = runner.invoke(
+            main,
+            [
+                '-C', config_dir, '--profiles', 'staging,prod', '--no-color',
+                'job', 'list'
+            ]
+        )
+        assert result.exit_code == 0
+
+        for profile, server in (('staging', staging), ('prod', production)):
+            job_id = list(server.state.jobs)[0]
+            assert '[{0}]         "job_id": "{1}",'.format(
+                profile, job_id
+            ) in result.output
+
+        result = runner.invoke(
+            main,
+            ['-C', config_dir, '--all-profiles', '--no-color', 'job', 'list']
+        )
+        assert result.exit_code == 1
+        assert '[broken] MashClientException: No tokens available' in \
+            result.output
+        assert '[prod] [' in result.output
+        assert 'Failed profiles: broken (1)' in result.output
+
+
+def test_profiles_with_profile():
+    runner = CliRunner()
+    result = runner.invoke(
+        main,
+        ['--profile', 'a', '--profiles', 'a,b', 'job', 'list']
+    )
+    assert result.exit_code == 1
+    assert 'cannot be used with --profiles' in result.output
@@ -21,11 +21,17 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import time
+
+from click.testing import CliRunner
 from unittest.mock import Mock, patch
-from pytest import raises
+from pytest import mark, raises
 
+from mash_client.cli import main
 from mash_client.cli_utils import RequestHandler
 from mash_client.cli_utils import CodeReceivedException
+from mash_client.cli_utils import get_request_timeout, sleep_before_deadline
+from mash_client.mash_client_exceptions import MashDeadlineException
 
 
 @patch('mash_client.cli_utils.BaseHTTPRequestHandler.end_headers')
@@ -57,3 +63,40 @@ def test_request_handler(mock_send_header, mock_send_response, mock_end_hdrs):
     assert e.value.code is None
     mock_send_response.assert_called_once_with(200)
     mock_send_header.assert_called_once_with('Content-type', 'text/html')
+
+
+def test_get_request_timeout():
+    config_data = {'connect_timeout': 5, 'read_timeout': 30}
+    assert get_request_timeout(config_data) == (5.0, 30.0)
+    assert get_request_timeout({}) == (10.0, 120.0)
+
+    config_data['deadline'] = time.time() + 10
+    connect_timeout, read_timeout = get_request_timeout(config_data)
+    assert connect_timeout == 5.0
+    assert 9 < read_timeout <= 10
+
+    config_data['deadline'] = time.time() - 1
+    with raises(MashDeadlineException):
+        get_request_timeout(config_data)
+
+
+def test_sleep_before_deadline():
+    sleep_before_deadline({}, 0.01)
+    sleep_before_deadline({'deadline': time.time() + 10}, 0.01)
+
+    with raises(MashDeadlineException):
+        sleep_before_deadline({'deadline': time.time() + 10}, 60)
+
+
+@mark.fake_server(latency=0.5)
+def test_deadline(logged_in_config, mash_args):
+    runner = CliRunner()
+    start = time.time()
+    result = runner.invoke(
+        main, mash_args + ['--deadline', '0.2', 'job', 'list']
+    )
+    elapsed = time.time() - start
+
+    assert elapsed < 0.5
+    assert result.exit_code == 1
+    assert 'Timed out waiting for a response' in result.output
@@ -0,0 +1,133 @@
+import click
+import json
+
+from unittest.mock import Mock, patch
+
+from mash_client.cli import main
+from mash_client.cli.account.cloud import make_account_group
+from mash_client.cli.job.cloud import make_job_group
+from mash_client.clouds import clouds
+
+from click.testing import CliRunner
+
+
+def test_cloud_commands():
+    """Test every registered cloud has job and account commands."""
+    runner = CliRunner()
+
+    for cloud in clouds:
+        result = runner.invoke(main, ['job', cloud, '--help'])
+        assert result.exit_code == 0
+        assert 'schema' in result.output
+
+        result = runner.invoke(main, ['account', cloud, '--help'])
+        assert result.exit_code == 0
+
+        for command in ('add', 'info', 'list', 'delete', 'update'):
+            assert command in result.output
+
+    # Cloud options of other commands accept every registered cloud
+    context = click.Context(main)
+    for command in (
+        main.get_command(context, 'job').commands['matrix'],
+        main.get_command(context, 'job').commands['prune'],
+        main.get_command(context, 'bench').commands['submit']
+    ):
+        cloud_option = [
+            param for param in command.params if '--cloud' in param.opts
+        ][0]
+        assert sorted(cloud_option.type.choices) == sorted(clouds)
+
+
+def test_update_credentials_before_prompts():
+    """Test missing credentials are reported before any prompt."""
+    runner = CliRunner()
+    result = runner.invoke(
+        main,
+        [
+            '-C', 'tests/data/', 'account', 'ec2', 'update',
+            '--name', 'acnt1', '--test-regions', '--access-key-id', '123'
+        ]
+    )
+    assert result.exit_code == 1
+    assert 'Both secret_access_key and access_key_id' in result.output
+    assert 'region' not in result.output.lower()
+
+
+@patch.dict(clouds)
+@patch('mash_client.cli_utils.time')
+@patch('mash_client.cli_utils.requests')
+def test_registered_cloud(mock_requests, mock_time, tmpdir):
+    """Test commands generated for a new registry entry."""
+    response = Mock()
+    response.status_code = 201
+    response.json.return_value = {'name': 'acnt1'}
+    mock_requests.post.return_value = response
+    mock_time.time.return_value = 1568150470
+
+    cloud = {
+        'display_name': 'Test',
+        'api_version': 'v1',
+        'credentials': ('secret', 'key'),
+        'account_fields': (
+            {'option': '--bucket', 'required': True, 'help': 'Bucket.'},
+            {'option': '--zone', 'key': 'region', 'help': 'Zone.'},
+            {
+                'option': '--key',
+                'required': True,
+                'credential': True,
+                'help': 'Key.'
+            },
+            {
+                'option': '--secret',
+                'required': True,
+                'credential': True,
+                'help': 'Secret.'
+            }
+        )
+    }
+    clouds['test'] = cloud
+    main.commands['account'].add_command(make_account_group('test', cloud))
+    main.commands['job'].add_command(make_job_group('test', cloud))
+
+    try:
+        runner = CliRunner()
+        result = runner.invoke(
+            main,
+            [
+                '-C', 'tests/data/', 'account', 'test', 'add',
+                '--name', 'acnt1', '--bucket', 'images', '--zone', 'z1',
+                '--key', '123', '--secret', '456'
+            ]
+        )
+        assert result.exit_code == 0
+        assert json.loads(mock_requests.post.call_args[1]['data']) == {
+            'account_name': 'acnt1',
+            'bucket': 'images',
+            'region': 'z1',
+            'credentials': {'key': '123', 'secret': '456'}
+        }
+
+        result = runner.invoke(
+            main,
+            [
+                '-C', 'tests/data/', 'account', 'test', 'update',
+                '--name', 'acnt1', '--key', '123'
+            ]
+        )
+        assert result.exit_code == 1
+        assert 'Both secret and key are required' in result.output
+
+        job_file = tmpdir.join('job.json')
+        job_file.write('{"image": "test"}')
+        response.json.return_value = {'job_id': '12345678-1234-1234'}
+
+        result = runner.invoke(
+            main,
+            ['-C', 'tests/data/', 'job', 'test', 'add', str(job_file)]
+        )
+        assert result.exit_code == 0
+        assert mock_requests.post.call_args[0][0].endswith('/v1/jobs/test/')
+    finally:
+        del main.commands['account'].commands['test']
+        del main.commands['job'].commands['test']
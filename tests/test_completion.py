@@ -0,0 +1,119 @@
+import json
+import time
+
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from mash_client.cli import main
+from mash_client.completion import (
+    fast_complete,
+    get_cache_file,
+    read_cache,
+    refresh_cache
+)
+from mash_client.controller import add_job
+
+
+def write_cache(config_dir, updated=None):
+    cache = {
+        'updated': updated or time.time(),
+        'ttl': 300,
+        'jobs': [
+            ['23fc826b-f6f5-4fbe-947d-52dcd097f0bc', 'running image1'],
+            ['91b218d9-37c7-4638-9959-3259d77e3325', 'finished image2']
+        ],
+        'accounts': {'gce': ['acnt1', 'acnt2'], 'ec2': ['aws1']},
+        'tokens': ['ff4115c4-d30f-4a8f-a48a-8f55252d6a33']
+    }
+    with open(get_cache_file(config_dir, 'default'), 'w') as cache_file:
+        json.dump(cache, cache_file)
+
+
+@patch('mash_client.completion.subprocess')
+def test_fast_complete(mock_subprocess, tmp_path, monkeypatch, capsys):
+    config_dir = str(tmp_path) + '/'
+    write_cache(config_dir)
+    (tmp_path / 'default.yaml').write_text('host: http://127.0.0.1\n')
+    (tmp_path / 'prod.yaml').write_text('host: http://127.0.0.1\n')
+
+    monkeypatch.setenv('_MASH_COMPLETE', 'bash_complete')
+    monkeypatch.setenv('COMP_WORDS', 'mash -C {0} job info --job-id 23'.format(
+        config_dir
+    ))
+    monkeypatch.setenv('COMP_CWORD', '6')
+    assert fast_complete()
+    assert capsys.readouterr().out == \
+        'plain,23fc826b-f6f5-4fbe-947d-52dcd097f0bc\n'
+
+    monkeypatch.setenv('_MASH_COMPLETE', 'zsh_complete')
+    monkeypatch.setenv(
+        'COMP_WORDS',
+        'mash -C {0} account gce delete --name '.format(config_dir)
+    )
+    monkeypatch.setenv('COMP_CWORD', '7')
+    assert fast_complete()
+    assert capsys.readouterr().out == 'plain\nacnt1\n_\nplain\nacnt2\n_\n'
+
+    monkeypatch.setenv('_MASH_COMPLETE', 'fish_complete')
+    monkeypatch.setenv('COMP_WORDS', 'mash -C {0} --profile p'.format(
+        config_dir
+    ))
+    monkeypatch.setenv('COMP_CWORD', 'p')
+    assert fast_complete()
+    assert capsys.readouterr().out == 'plain,prod\n'
+
+    # Fresh cache never starts a refresh
+    assert not mock_subprocess.Popen.called
+
+    monkeypatch.setenv('_MASH_COMPLETE', 'bash_complete')
+    monkeypatch.setenv('COMP_WORDS', 'mash job info --show')
+    monkeypatch.setenv('COMP_CWORD', '3')
+    assert not fast_complete()
+
+
+@patch('mash_client.completion.subprocess')
+def test_read_cache_stale(mock_subprocess, tmp_path):
+    config_dir = str(tmp_path) + '/'
+    write_cache(config_dir, updated=1)
+
+    data = read_cache(config_dir, 'default')
+    assert data['accounts']['ec2'] == ['aws1']
+    assert mock_subprocess.Popen.call_count == 1
+
+    # A running refresh is not started twice
+    read_cache(config_dir, 'default')
+    assert mock_subprocess.Popen.call_count == 1
+
+
+def test_refresh_cache(fake_server, logged_in_config, config_dir, job_doc):
+    job_id = add_job(logged_in_config, job_doc, 'ec2')['job_id']
+    fake_server.state.accounts['gce']['acnt1'] = {'name': 'acnt1'}
+
+    refresh_cache(config_dir, 'default')
+
+    with open(get_cache_file(config_dir, 'default')) as cache_file:
+        data = json.load(cache_file)
+
+    assert data['jobs'] == [[job_id, 'running test_image_oem']]
+    assert data['accounts']['gce'] == ['acnt1']
+    assert len(data['tokens']) == 1
+
+
+def test_click_complete(tmp_path):
+    config_dir = str(tmp_path) + '/'
+    write_cache(config_dir)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        main,
+        prog_name='mash',
+        env={
+            '_MASH_COMPLETE': 'bash_complete',
+            'COMP_WORDS': 'mash -C {0} auth token info --jti '.format(
+                config_dir
+            ),
+            'COMP_CWORD': '7'
+        }
+    )
+    assert result.output == 'plain,ff4115c4-d30f-4a8f-a48a-8f55252d6a33\n'
@@ -0,0 +1,84 @@
+import json
+
+import pytest
+
+from mash_client.cli import main
+from mash_client.cli_utils import JSONFile
+from mash_client.dedupe import add_job_deduplicated, get_document_hash
+from mash_client.mash_client_exceptions import MashClientException
+
+from click.testing import CliRunner
+
+
+def test_get_document_hash(tmp_path, job_doc):
+    job_file = tmp_path / 'job.json'
+    job_file.write_text(json.dumps(job_doc, indent=4))
+    reordered = dict(reversed(list(job_doc.items())))
+
+    assert get_document_hash('ec2', JSONFile(str(job_file))) == \
+        get_document_hash('ec2', reordered)
+    assert get_document_hash('ec2', job_doc) != \
+        get_document_hash('gce', job_doc)
+    assert get_document_hash('ec2', job_doc) != \
+        get_document_hash('ec2', dict(job_doc, image='other'))
+
+
+@pytest.mark.fake_server(service_time=60)
+def test_job_add_skip_duplicates(
+    tmp_path, fake_server, logged_in_config, config_dir, job_doc
+):
+    job_file = tmp_path / 'job.json'
+    job_file.write_text(json.dumps(job_doc))
+    reformatted_file = tmp_path / 'reformatted.json'
+    reformatted_file.write_text(json.dumps(job_doc, indent=2, sort_keys=True))
+
+    def add(path, *args):
+        runner = CliRunner()
+        result = runner.invoke(
+            main,
+            [
+                '-C', config_dir, '--no-color', 'job', 'ec2', 'add',
+                '--skip-duplicates', str(path)
+            ] + list(args)
+        )
+        assert result.exit_code == 0
+        return json.loads(result.output)
+
+    job_id = add(job_file)['job_id']
+
+    result = add(reformatted_file)
+    assert result['job_id'] == job_id
+    assert result['duplicate']
+    assert len(fake_server.state.jobs) == 1
+
+    # Outside of the window the document is submitted again
+    assert add(job_file, '--dedupe-window', '0s')['job_id'] != job_id
+    assert len(fake_server.state.jobs) == 2
+    job_id = add(job_file)['job_id']
+
+    # A failed job is not a duplicate
+    fake_server.state.jobs[job_id]['failed_service'] = 'obs'
+    assert add(job_file)['job_id'] != job_id
+    assert len(fake_server.state.jobs) == 3
+
+
+@pytest.mark.fake_server(service_time=60)
+def test_add_job_deduplicated_errors(fake_server, logged_in_config, job_doc):
+    job_id = add_job_deduplicated(
+        logged_in_config, job_doc, 'ec2', 3600
+    )['job_id']
+
+    # The job cannot be checked, it is not submitted again
+    fake_server.error_rate = 1.0
+    with pytest.raises(MashClientException):
+        add_job_deduplicated(logged_in_config, job_doc, 'ec2', 3600)
+
+    fake_server.error_rate = 0.0
+    assert len(fake_server.state.jobs) == 1
+
+    # A deleted job is submitted again
+    del fake_server.state.jobs[job_id]
+    assert add_job_deduplicated(
+        logged_in_config, job_doc, 'ec2', 3600
+    )['job_id'] != job_id
+    assert len(fake_server.state.jobs) == 1
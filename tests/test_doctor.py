@@ -0,0 +1,60 @@
+import json
+
+from mash_client.cli import main
+from mash_client.doctor import duration_check
+
+from click.testing import CliRunner
+
+
+def test_duration_check():
+    check = duration_check('dns', 0.5, 'Resolving host', 'Use a cache.')
+    assert check == {
+        'check': 'dns',
+        'status': 'warning',
+        'value': 500.0,
+        'message': 'Resolving host took 500.0 ms',
+        'suggestion': 'Use a cache.'
+    }
+    assert duration_check('dns', 0.01, 'Resolving host', 'Use a cache.') == {
+        'check': 'dns',
+        'status': 'ok',
+        'value': 10.0,
+        'message': 'Resolving host took 10.0 ms'
+    }
+
+
+def test_doctor(request, fake_server, config_dir):
+    runner = CliRunner()
+    result = runner.invoke(main, ['-C', config_dir, 'doctor', '--json'])
+    assert result.exit_code == 1
+
+    checks = {check['check']: check for check in json.loads(result.output)}
+    assert checks['auth']['status'] == 'error'
+    assert 'mash auth login' in checks['auth']['suggestion']
+
+    request.getfixturevalue('logged_in_config')
+    result = runner.invoke(main, ['-C', config_dir, 'doctor', '--json'])
+    assert result.exit_code == 0
+
+    checks = json.loads(result.output)
+    assert [check['check'] for check in checks] == [
+        'import', 'config', 'dns', 'connect', 'rtt', 'auth', 'cache',
+        'breaker', 'spool'
+    ]
+    assert all(check['status'] != 'error' for check in checks)
+    assert 'access token expires' in checks[5]['message']
+
+    result = runner.invoke(
+        main,
+        ['-C', config_dir, '--no-color', 'doctor']
+    )
+    assert result.exit_code == 0
+    assert result.output.splitlines()[-1].startswith('Diagnosis:')
+
+    fake_server.stop()
+    result = runner.invoke(main, ['-C', config_dir, 'doctor', '--json'])
+    assert result.exit_code == 1
+
+    checks = {check['check']: check for check in json.loads(result.output)}
+    assert checks['connect']['status'] == 'error'
+    assert checks['rtt']['status'] == 'error'
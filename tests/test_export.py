@@ -0,0 +1,185 @@
+import csv
+import json
+import sqlite3
+
+import pytest
+
+from click.testing import CliRunner
+from unittest.mock import patch
+
+from mash_client.cli import main
+from mash_client.controller import get_job
+from mash_client.export import export_jobs, flatten_job
+from mash_client.mash_client_exceptions import MashClientException
+
+# The jobs of the fake server finish right away
+pytestmark = pytest.mark.fake_server(service_time=0)
+
+
+def test_flatten_job():
+    job = {
+        'job_id': '1',
+        'state': 'finished',
+        'image': 'image1',
+        'data': {
+            'cloud_image_name': 'image1-v20260101',
+            'test_results': json.dumps({
+                'summary': {'duration': 2.5, 'num_tests': 2, 'passed': 1,
+                            'failed': 1},
+                'tests': [
+                    {'nodeid': 'test_a', 'outcome': 'passed',
+                     'test_index': 0, 'duration': 1.0},
+                    {'nodeid': 'test_b', 'outcome': 'failed',
+                     'call': {'duration': 1.25},
+                     'setup': {'duration': 0.25}}
+                ]
+            })
+        }
+    }
+
+    job_row, test_cases = flatten_job(job)
+    assert job_row['job_id'] == '1'
+    assert job_row['num_tests'] == 2
+    assert job_row['failed'] == 1
+    assert job_row['skipped'] is None
+    assert job_row['test_duration'] == 2.5
+    assert job_row['data'] == '{"cloud_image_name": "image1-v20260101"}'
+    assert test_cases == [
+        {'job_id': '1', 'test_index': 0, 'nodeid': 'test_a',
+         'outcome': 'passed', 'duration': 1.0},
+        {'job_id': '1', 'test_index': 1, 'nodeid': 'test_b',
+         'outcome': 'failed', 'duration': 1.5}
+    ]
+
+    job_row, test_cases = flatten_job({'job_id': '2', 'state': 'running'})
+    assert job_row['state'] == 'running'
+    assert job_row['data'] is None
+    assert test_cases == []
+
+
+def invoke_export(fake_server, mash_args, job_doc, args, jobs=5):
+    for _ in range(jobs):
+        fake_server.state.add_job('ec2', job_doc)
+
+    runner = CliRunner()
+    return runner.invoke(main, mash_args + ['job', 'export'] + args)
+
+
+def test_export_csv(
+    tmp_path, fake_server, logged_in_config, mash_args, job_doc
+):
+    output = tmp_path / 'jobs.csv'
+    result = invoke_export(
+        fake_server, mash_args, job_doc,
+        ['--output', str(output), '--per-page', '2']
+    )
+
+    assert result.exit_code == 0
+    assert 'Exported 5 jobs and 0 test cases.' in result.output
+
+    with open(output) as jobs_file:
+        rows = list(csv.DictReader(jobs_file))
+
+    assert len(rows) == 5
+    assert rows[0]['state'] == 'finished'
+    assert rows[0]['image'] == 'test_image_oem'
+
+    with open(tmp_path / 'jobs_test_cases.csv') as test_cases_file:
+        assert test_cases_file.read().startswith('job_id,test_index,')
+
+
+def test_export_ndjson_with_data(
+    tmp_path, fake_server, logged_in_config, mash_args, job_doc
+):
+    output = tmp_path / 'jobs.ndjson'
+    result = invoke_export(
+        fake_server, mash_args, job_doc,
+        ['--format', 'ndjson', '--output', str(output), '--with-data',
+         '--jobs', '2']
+    )
+
+    assert result.exit_code == 0
+    assert 'Exported 5 jobs and 10 test cases.' in result.output
+
+    with open(output) as jobs_file:
+        jobs = [json.loads(line) for line in jobs_file]
+
+    assert len(jobs) == 5
+    assert jobs[0]['num_tests'] == 2
+
+    with open(tmp_path / 'jobs_test_cases.ndjson') as test_cases_file:
+        test_cases = [json.loads(line) for line in test_cases_file]
+
+    assert {case['job_id'] for case in test_cases} == {
+        job['job_id'] for job in jobs
+    }
+    assert test_cases[0]['outcome'] == 'passed'
+
+
+def test_export_with_data_error(
+    tmp_path, fake_server, logged_in_config, job_doc
+):
+    output = tmp_path / 'jobs.ndjson'
+    job_ids = [
+        fake_server.state.add_job('ec2', job_doc)['job_id']
+        for _ in range(3)
+    ]
+
+    def get_job_or_fail(config_data, job_id):
+        if job_id == job_ids[1]:
+            raise MashClientException('Job does not exist.')
+
+        return get_job(config_data, job_id)
+
+    with patch('mash_client.export.get_job', get_job_or_fail):
+        # The export continues without the data of the failed job
+        assert export_jobs(
+            logged_in_config, str(output), 'ndjson', with_data=True
+        ) == (3, 4, 1)
+
+    with open(output) as jobs_file:
+        jobs = {job['job_id']: job for job in map(json.loads, jobs_file)}
+
+    assert jobs[job_ids[1]]['export_error'] == 'Job does not exist.'
+    assert jobs[job_ids[1]]['num_tests'] is None
+    assert jobs[job_ids[0]]['export_error'] is None
+    assert jobs[job_ids[0]]['num_tests'] == 2
+
+
+def test_export_sqlite(
+    tmp_path, fake_server, logged_in_config, mash_args, job_doc
+):
+    output = tmp_path / 'jobs.db'
+
+    for jobs in (3, 0):
+        # Exporting again replaces the tables
+        result = invoke_export(
+            fake_server, mash_args, job_doc,
+            ['--format', 'sqlite', '--output', str(output), '--with-data'],
+            jobs=jobs
+        )
+        assert result.exit_code == 0
+
+    connection = sqlite3.connect(str(output))
+    assert connection.execute('SELECT COUNT(*) FROM jobs').fetchone() == (3,)
+    assert connection.execute(
+        'SELECT outcome, COUNT(*) FROM test_cases GROUP BY outcome'
+    ).fetchall() == [('passed', 6)]
+    connection.close()
+
+
+def test_export_parquet(
+    tmp_path, fake_server, logged_in_config, mash_args, job_doc
+):
+    parquet = pytest.importorskip('pyarrow.parquet')
+    output = tmp_path / 'jobs.parquet'
+    result = invoke_export(
+        fake_server, mash_args, job_doc,
+        ['--format', 'parquet', '--output', str(output), '--with-data']
+    )
+
+    assert result.exit_code == 0
+    assert parquet.read_table(str(output)).num_rows == 5
+    assert parquet.read_table(
+        str(tmp_path / 'jobs_test_cases.parquet')
+    ).num_rows == 10
@@ -0,0 +1,85 @@
+import requests
+
+from pytest import mark, raises
+
+from mash_client.cli_utils import create_session
+from mash_client.controller import add_job
+from mash_client.exporter import (
+    Histogram,
+    JobExporter,
+    MetricsServer,
+    parse_listen
+)
+from mash_client.mash_client_exceptions import MashClientException
+
+
+def test_parse_listen():
+    assert parse_listen(':9433') == ('', 9433)
+    assert parse_listen('127.0.0.1:9000') == ('127.0.0.1', 9000)
+    assert parse_listen('[::1]:9000') == ('::1', 9000)
+
+    with raises(MashClientException):
+        parse_listen('localhost')
+
+
+def test_histogram():
+    histogram = Histogram(('method',), buckets=(0.1, 1.0))
+    histogram.observe(('GET',), 0.05)
+    histogram.observe(('GET',), 0.5)
+    histogram.observe(('GET',), 5)
+
+    assert histogram.samples() == [
+        ('_bucket', [('method', 'GET'), ('le', '0.1')], 1),
+        ('_bucket', [('method', 'GET'), ('le', '1.0')], 2),
+        ('_bucket', [('method', 'GET'), ('le', '+Inf')], 3),
+        ('_sum', [('method', 'GET')], 5.55),
+        ('_count', [('method', 'GET')], 3)
+    ]
+
+
+@mark.fake_server(service_time=60)
+def test_exporter(fake_server, logged_in_config, job_doc):
+    logged_in_config['no_cache'] = True
+    add_job(logged_in_config, job_doc, 'ec2')
+    add_job(logged_in_config, job_doc, 'ec2')
+    job_id = add_job(logged_in_config, job_doc, 'gce')['job_id']
+    fake_server.state.jobs[job_id]['failed_service'] = 'obs'
+
+    logged_in_config['session'] = create_session(logged_in_config)
+    exporter = JobExporter(logged_in_config, interval=60)
+    assert 'mash_up 0.0' in exporter.get_metrics()
+
+    exporter.refresh()
+    request_count = fake_server.state.request_count
+
+    with MetricsServer(exporter, '127.0.0.1') as metrics_server:
+        for scrape in range(3):
+            response = requests.get(metrics_server.url)
+            assert response.status_code == 200
+
+        assert requests.get(
+            metrics_server.url.replace('metrics', 'other')
+        ).status_code == 404
+
+    # Scrapes are served without requests to the MASH server
+    assert fake_server.state.request_count == request_count
+
+    metrics = response.text
+    assert 'mash_up 1.0' in metrics
+    assert 'mash_jobs{state="running",cloud="ec2",service="obs"} 2.0' \
+        in metrics
+    assert 'mash_jobs{state="failed",cloud="gce",service="obs"} 1.0' \
+        in metrics
+    assert 'mash_accounts{cloud="azure"} 0.0' in metrics
+    assert 'mash_api_request_duration_seconds_count{method="GET",' \
+        'code="200"} 6.0' in metrics
+
+    # The server is gone, the previous counts are kept
+    fake_server.stop()
+    logged_in_config['session'].close()
+    exporter.refresh()
+    metrics = exporter.get_metrics()
+    assert 'mash_up 0.0' in metrics
+    assert 'mash_exporter_refresh_errors_total 1.0' in metrics
+    assert 'mash_jobs{state="running",cloud="ec2",service="obs"} 2.0' \
+        in metrics
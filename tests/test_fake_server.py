@@ -0,0 +1,114 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""MASH client fake server unit tests."""
+
+# Copyright (c) 2026 SUSE LLC. All rights reserved.
+#
+# This file is part of mash_client. mash_client provides a command line
+# utility for interfacing with a MASH server.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import logging
+import time
+
+from pytest import mark, raises
+
+from mash_client.cli_utils import JSONFile, handle_request
+from mash_client.controller import add_job, get_job_status, list_user_jobs
+from mash_client.mash_client_exceptions import MashClientException
+
+
+@mark.fake_server(service_time=0.05, per_page=2)
+def test_fake_server_jobs(logged_in_config, job_doc):
+    job_ids = [
+        add_job(logged_in_config, job_doc, 'ec2')['job_id'] for _ in range(3)
+    ]
+
+    status = get_job_status(logged_in_config, job_ids[0])
+    assert status == {'state': 'running', 'current_service': 'obs'}
+
+    assert len(list_user_jobs(logged_in_config)) == 2
+    assert len(list_user_jobs(logged_in_config, page=2)) == 1
+
+    time.sleep(0.4)
+    status = get_job_status(logged_in_config, job_ids[0])
+    assert status == {'state': 'finished'}
+
+
+def test_fake_server_validation(logged_in_config, job_doc):
+    with raises(MashClientException) as error:
+        add_job(logged_in_config, {'image': 'test'}, 'gce')
+
+    assert "'utctime' is a required property" in str(error.value)
+
+    result = add_job(logged_in_config, dict(job_doc, dry_run=True), 'gce')
+    assert result == {'msg': 'Job doc is valid!'}
+
+
+def test_fake_server_error_injection(fake_server, logged_in_config):
+    fake_server.error_rate = 1.0
+    request_count = fake_server.state.request_count
+
+    with raises(MashClientException) as error:
+        handle_request(logged_in_config, '/v1/jobs/ec2/', action='get')
+
+    assert 'Injected server error.' in str(error.value)
+    assert fake_server.state.request_count == request_count + 1
+
+
+@mark.fake_server(compress_min_size=100)
+def test_fake_server_compression(
+    fake_server, logged_in_config, job_doc, capsys
+):
+    logged_in_config['compress_threshold'] = 100
+    logged_in_config['log_level'] = logging.DEBUG
+
+    job = add_job(
+        logged_in_config,
+        dict(job_doc, description='x' * 1000),
+        'ec2'
+    )
+    assert job['job_id'] in fake_server.state.jobs
+    document = fake_server.state.jobs[job['job_id']]['document']
+    assert document['description'] == 'x' * 1000
+
+    result = list_user_jobs(logged_in_config)
+    assert result[0]['job_id'] == job['job_id']
+
+    output = capsys.readouterr().err
+    assert 'POST /v1/jobs/ec2/ 201' in output
+    assert 'uncompressed' in output
+    assert 'GET /v1/jobs/ 200' in output
+    assert 'decoded, gzip)' in output
+
+
+@mark.fake_server(retry_after=0, seed=3)
+def test_fake_server_json_file(
+    tmp_path, fake_server, logged_in_config, job_doc
+):
+    job_file = tmp_path / 'job.json'
+    job_file.write_text(json.dumps(dict(job_doc, description='x' * 1000)))
+
+    fake_server.throttle_rate = 0.5
+    logged_in_config['throttle_retries'] = 20
+
+    # Sent from disk, also when retried after throttling
+    for threshold in (100, None):
+        logged_in_config['compress_threshold'] = threshold
+        job = add_job(logged_in_config, JSONFile(str(job_file)), 'ec2')
+        document = fake_server.state.jobs[job['job_id']]['document']
+        assert document['description'] == 'x' * 1000
@@ -1,12 +1,20 @@
 import json
 
 from unittest.mock import Mock, patch
+from pytest import mark, raises
 
 from mash_client.cli import main
+from mash_client.controller import (
+    add_job,
+    expand_job_matrix,
+    match_job,
+    parse_duration,
+    validate_job_document
+)
+from mash_client.mash_client_exceptions import MashClientException
 
 from click.testing import CliRunner
 
-
 test_results = {
     "summary": {
         "duration": 1.618,
@@ -214,3 +222,197 @@ def test_job_list(mock_requests, mock_time):
     )
     assert result.exit_code == 0
     assert '23fc826b-f6f5-4fbe-947d-52dcd097f0bc' in result.output
+
+
+def test_expand_job_matrix():
+    template = {
+        'cloud_accounts': [{'name': '${account}', 'region': '${region}'}],
+        'image': 'sles-${version}-v${build}',
+        'tests': '${tests}'
+    }
+    matrix = {
+        'account': ['acnt1', 'acnt2'],
+        'region': ['us-east-1', 'eu-west-1'],
+        'version': 15,
+        'build': ['20260101'],
+        'tests': [['test_sles', 'test_motd']]
+    }
+    documents = list(expand_job_matrix(template, matrix))
+
+    assert len(documents) == 4
+    variables, job_data = documents[3]
+    assert variables['account'] == 'acnt2'
+    assert job_data == {
+        'cloud_accounts': [{'name': 'acnt2', 'region': 'eu-west-1'}],
+        'image': 'sles-15-v20260101',
+        'tests': ['test_sles', 'test_motd']
+    }
+
+
+def test_validate_job_document():
+    schema = {
+        'additionalProperties': False,
+        'properties': {'image': {}, 'utctime': {}},
+        'required': ['image', 'utctime']
+    }
+    errors = validate_job_document(
+        {'image': '${image}', 'unknown': 1},
+        schema
+    )
+
+    assert errors == [
+        'Unresolved template variables: image',
+        "'utctime' is a required property",
+        "Additional property 'unknown' is not allowed"
+    ]
+
+
+def test_job_matrix(
+    tmp_path, fake_server, logged_in_config, mash_args, job_doc
+):
+    template = tmp_path / 'template.json'
+    template.write_text(json.dumps(dict(job_doc, cloud_account='${account}')))
+    matrix = tmp_path / 'matrix.yaml'
+    matrix.write_text('cloud: [ec2, gce]\naccount: [acnt1, acnt2, acnt3]\n')
+
+    args = mash_args + [
+        'job', 'matrix', str(template), '--vars', str(matrix)
+    ]
+
+    runner = CliRunner()
+    result = runner.invoke(main, args + ['--dry-run'])
+    assert result.exit_code == 0
+    assert result.output.count('Job doc is valid!') == 6
+    assert not fake_server.state.jobs
+
+    result = runner.invoke(main, args + ['--jobs', '3'])
+    assert result.exit_code == 0
+    assert len(fake_server.state.jobs) == 6
+    clouds = [job['cloud'] for job in fake_server.state.jobs.values()]
+    assert sorted(clouds) == ['ec2'] * 3 + ['gce'] * 3
+
+    matrix.write_text('cloud: [ec2]\nregion: [us-east-1]\n')
+    result = runner.invoke(main, args)
+    assert result.exit_code == 1
+    assert 'Unresolved template variables: account' in result.output
+    assert len(fake_server.state.jobs) == 6
+
+
+@mark.fake_server(service_time=0)
+def test_job_list_all_and_info_show_data(
+    logged_in_config, mash_args, job_doc
+):
+    job_ids = [
+        add_job(logged_in_config, job_doc, 'ec2')['job_id']
+        for _ in range(7)
+    ]
+
+    args = mash_args + ['job']
+    runner = CliRunner()
+    result = runner.invoke(
+        main,
+        args + ['list', '--all', '--per-page', '3']
+    )
+    assert result.exit_code == 0
+    jobs = json.loads(result.output.split('\n', 1)[1])
+    assert sorted(job['job_id'] for job in jobs) == sorted(job_ids)
+
+    result = runner.invoke(
+        main,
+        args + ['info', '--show-data', '--job-id', job_ids[0]]
+    )
+    assert result.exit_code == 0
+    info = json.loads(result.output.split('\n', 1)[1])
+    assert info['job_id'] == job_ids[0]
+    assert info['state'] == 'finished'
+    assert 'test_results' not in info['data']
+
+    result = runner.invoke(
+        main,
+        args + [
+            'info', '--show-data',
+            '--job-id', '23fc826b-f6f5-4fbe-947d-52dcd097f0bc'
+        ]
+    )
+    assert result.exit_code == 1
+    assert 'Job does not exist.' in result.output
+
+
+def test_match_job():
+    job = {
+        'job_id': '23fc826b-f6f5-4fbe-947d-52dcd097f0bc',
+        'state': 'failed',
+        'cloud': 'ec2',
+        'image': 'sles-15-sp5-v20260101',
+        'start_time': '2026-01-01T00:00:00'
+    }
+    now = 1767225600 + 86400 * 31
+
+    assert match_job(job, states=('failed',), clouds=('ec2',))
+    assert not match_job(job, states=('finished',))
+    assert not match_job(job, clouds=('gce',))
+    assert match_job(job, older_than=parse_duration('30d'), now=now)
+    assert not match_job(job, older_than=parse_duration('5w'), now=now)
+    assert not match_job(
+        dict(job, start_time=None),
+        older_than=0,
+        now=now
+    )
+    assert match_job(job, pattern='sles-15-*')
+    assert match_job(job, pattern='23fc826b*')
+    assert not match_job(job, pattern='sles-12-*')
+
+    assert parse_duration('90') == 90 * 86400
+    assert parse_duration('1.5h') == 5400
+    with raises(MashClientException):
+        parse_duration('1y')
+
+
+@mark.fake_server(service_time=0)
+def test_job_prune(fake_server, logged_in_config, mash_args, job_doc):
+    for index in range(6):
+        job = fake_server.state.add_job(
+            'ec2' if index % 2 else 'gce',
+            dict(job_doc, image='image-{0}'.format(index))
+        )
+        # Half of the jobs are 60 days old
+        if index < 3:
+            fake_server.state.jobs[job['job_id']]['created'] -= 86400 * 60
+
+    args = mash_args + ['job', 'prune']
+    runner = CliRunner()
+
+    result = runner.invoke(main, args)
+    assert result.exit_code == 1
+    assert 'At least one of --state' in result.output
+
+    result = runner.invoke(
+        main,
+        args + ['--older-than', '30d', '--cloud', 'gce', '--plan']
+    )
+    assert result.exit_code == 0
+    assert '2 jobs would be deleted.' in result.output
+    assert '"image-0"' in result.output
+    assert '"image-2"' in result.output
+    assert len(fake_server.state.jobs) == 6
+
+    result = runner.invoke(
+        main,
+        args + ['--match', 'image-[45]', '--per-page', '2'],
+        input='n\n'
+    )
+    assert result.exit_code == 1
+    assert len(fake_server.state.jobs) == 6
+
+    result = runner.invoke(
+        main,
+        args + [
+            '--state', 'finished', '--older-than', '30d', '--force',
+            '--jobs', '2', '--rate', '100'
+        ]
+    )
+    assert result.exit_code == 0
+    assert '"deleted": 3' in result.output
+    assert sorted(
+        job['document']['image'] for job in fake_server.state.jobs.values()
+    ) == ['image-3', 'image-4', 'image-5']
@@ -0,0 +1,88 @@
+import json
+
+from pytest import raises
+
+from mash_client.jsonstream import (
+    JSONStream,
+    iter_json_array_lines,
+    iter_json_items,
+    iter_json_object_lines
+)
+from mash_client.mash_client_exceptions import MashClientException
+
+
+def get_chunks(text, size):
+    data = text.encode()
+    return [data[index:index + size] for index in range(0, len(data), size)]
+
+
+def test_iter_json_items():
+    items = [
+        {'id': index, 'name': 'café \\"{0}\\"'.format(index) * index,
+         'values': [1.5, None, True, 12345], 'data': {}}
+        for index in range(20)
+    ]
+    text = json.dumps(items)
+
+    for size in (1, 3, 64, len(text)):
+        assert list(iter_json_items(get_chunks(text, size))) == items
+        assert ''.join(
+            iter_json_array_lines(iter_json_items(get_chunks(text, size)))
+        ) == json.dumps(items, indent=4)
+
+    assert list(iter_json_items([b' [ ] '])) == []
+    assert ''.join(iter_json_array_lines([])) == json.dumps([], indent=4)
+    assert list(iter_json_items([b'[1', b'23', b'4]'])) == [1234]
+
+
+def test_iter_json_object_lines():
+    job = {
+        'job_id': '1',
+        'data': {
+            'test_results': '{"tests": "\\\\"}' * 100,
+            'image': 'test_image',
+            'regions': [{'name': 'us-east-1'}],
+            'empty': {}
+        },
+        'state': 'finished'
+    }
+    text = json.dumps(job)
+    expected = dict(job, data={
+        key: value for key, value in job['data'].items()
+        if key != 'test_results'
+    })
+
+    for size in (1, 5, len(text)):
+        output = ''.join(iter_json_object_lines(
+            JSONStream(get_chunks(text, size)),
+            expand={'data': ('test_results',)}
+        ))
+        assert output == json.dumps(expected, indent=4)
+
+    output = ''.join(iter_json_object_lines(
+        JSONStream([text]),
+        skip=('job_id', 'data', 'state')
+    ))
+    assert output == '{}'
+
+
+def test_json_stream_compacts_buffer():
+    text = json.dumps([{'value': 'x' * 1000} for _ in range(1000)])
+    stream = JSONStream(get_chunks(text, 4096), compact_size=8192)
+    max_buffer = 0
+
+    for item in stream.items():
+        max_buffer = max(max_buffer, len(stream.buffer))
+
+    assert max_buffer < 20000
+
+
+def test_json_stream_invalid():
+    with raises(MashClientException):
+        list(iter_json_items([b'{"a": 1}']))
+
+    with raises(MashClientException):
+        list(iter_json_items([b'[1, 2']))
+
+    with raises(MashClientException):
+        list(iter_json_items([b'[1, tru]']))
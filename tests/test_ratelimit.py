@@ -0,0 +1,78 @@
+import json
+import time
+
+from pytest import mark
+
+from mash_client.controller import get_job_status
+from mash_client.ratelimit import (
+    RateLimiter,
+    get_rate_limiter,
+    parse_retry_after
+)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after('5') == 5.0
+    assert parse_retry_after(None) == 1.0
+    assert parse_retry_after('soon') == 1.0
+    assert parse_retry_after('100000') == 300.0
+    assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
+
+
+def test_rate_limiter_bucket(tmp_path):
+    state_file = str(tmp_path / 'state.json')
+    limiter = RateLimiter(state_file, rate=10, burst=2)
+
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == 0
+    assert 0 < limiter.reserve() <= 0.1
+
+    # The bucket is shared through the state file
+    other = RateLimiter(state_file, rate=10, burst=2)
+    assert other.reserve() > 0
+
+    start = time.time()
+    other.acquire()
+    assert time.time() - start > 0.05
+
+
+def test_rate_limiter_pause(tmp_path):
+    state_file = str(tmp_path / 'state.json')
+    unlimited = RateLimiter(state_file)
+
+    # No state file, nothing to wait for
+    assert unlimited.reserve() == 0
+
+    RateLimiter(state_file, rate=10).pause(5)
+    assert 4 < unlimited.reserve() <= 5
+
+
+def test_get_rate_limiter(tmp_path):
+    limiter = get_rate_limiter({
+        'url': 'https://mash.example.com:8443',
+        'config_dir': str(tmp_path),
+        'rate_limit': '2.5',
+        'rate_burst': 5
+    })
+    assert limiter.rate == 2.5
+    assert limiter.burst == 5
+    assert limiter.state_file == str(
+        tmp_path / 'ratelimit_mash.example.com_8443.json'
+    )
+
+
+@mark.fake_server(retry_after=0.1, seed=1)
+def test_handle_request_throttled(fake_server, logged_in_config):
+    logged_in_config['throttle_retries'] = 20
+    job_id = fake_server.state.add_job('ec2', {'image': 'test'})['job_id']
+    fake_server.throttle_rate = 0.3
+
+    start = time.time()
+    for _ in range(10):
+        assert get_job_status(logged_in_config, job_id)['state'] == 'running'
+
+    # Throttled requests were paused for the Retry-After time
+    limiter = get_rate_limiter(logged_in_config)
+    with open(limiter.state_file) as state_file:
+        assert 'paused_until' in json.load(state_file)
+    assert time.time() - start >= 0.1
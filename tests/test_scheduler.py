@@ -0,0 +1,160 @@
+import json
+
+from pytest import mark, raises
+
+from mash_client.cli import main
+from mash_client.controller import add_job
+from mash_client.mash_client_exceptions import MashClientException
+from mash_client.scheduler import (
+    get_queue_documents,
+    poll_in_flight,
+    submit_queue
+)
+
+from click.testing import CliRunner
+
+
+def write_documents(directory, job_doc, images):
+    for name, image in images.items():
+        document = dict(job_doc)
+
+        if image:
+            document['image'] = image
+
+        (directory / name).write_text(json.dumps(document))
+
+
+def test_get_queue_documents(tmp_path, job_doc):
+    write_documents(
+        tmp_path,
+        job_doc,
+        {'b.json': 'image-1', 'a.json': 'image-3', 'c.json': 'image-2'}
+    )
+    (tmp_path / 'notes.txt').write_text('not a document')
+
+    def names(*args):
+        return [
+            name for name, document in get_queue_documents(
+                str(tmp_path), *args
+            )
+        ]
+
+    assert names() == ['a.json', 'b.json', 'c.json']
+    assert names(None, True) == ['c.json', 'b.json', 'a.json']
+    assert names('image') == ['b.json', 'c.json', 'a.json']
+    assert names('image', True) == ['a.json', 'c.json', 'b.json']
+
+    # Documents without the field come last
+    assert names('cloud_architecture') == ['a.json', 'b.json', 'c.json']
+
+    (tmp_path / 'd.json').write_text(
+        json.dumps(dict(job_doc, image=['list']))
+    )
+    with raises(MashClientException):
+        names('image')
+
+
+@mark.fake_server(service_time=0.05)
+def test_submit_queue(tmp_path, fake_server, logged_in_config, job_doc):
+    queue_dir = tmp_path / 'queue'
+    queue_dir.mkdir()
+    write_documents(
+        queue_dir,
+        job_doc,
+        {'job{0}.json'.format(index): None for index in range(6)}
+    )
+    (queue_dir / 'job2.json').write_text(json.dumps({'image': 'invalid'}))
+
+    def submit(config_data, job_data, cloud):
+        running = [
+            job_id for job_id in list(fake_server.state.jobs)
+            if fake_server.state.get_job(job_id)['state'] == 'running'
+        ]
+        assert len(running) < 2
+        return add_job(config_data, job_data, cloud)
+
+    reports = []
+    results = submit_queue(
+        logged_in_config,
+        get_queue_documents(str(queue_dir)),
+        'ec2',
+        2,
+        0.1,
+        callback=lambda item, in_flight: reports.append(in_flight),
+        submit=submit
+    )
+
+    assert [item['document'] for item in results] == [
+        'job{0}.json'.format(index) for index in range(6)
+    ]
+    assert 'error' in results[2]
+    assert all('job_id' in results[index] for index in (0, 1, 3, 4, 5))
+    assert len(fake_server.state.jobs) == 5
+    assert max(reports) == 2
+
+
+@mark.fake_server(service_time=60)
+def test_poll_in_flight(fake_server, logged_in_config, job_doc):
+    logged_in_config['breaker_threshold'] = 0
+    in_flight = {
+        add_job(logged_in_config, job_doc, 'ec2')['job_id']: name
+        for name in ('a.json', 'b.json', 'c.json')
+    }
+    job_ids = list(in_flight)
+
+    # Jobs stay in flight while their status cannot be requested
+    fake_server.error_rate = 1.0
+    poll_in_flight(logged_in_config, in_flight)
+    assert list(in_flight) == job_ids
+
+    fake_server.error_rate = 0.0
+    del fake_server.state.jobs[job_ids[0]]
+    fake_server.state.jobs[job_ids[1]]['failed_service'] = 'obs'
+    poll_in_flight(logged_in_config, in_flight)
+    assert list(in_flight) == job_ids[2:]
+
+
+def test_poll_in_flight_queued(tmp_path, monkeypatch):
+    def get_job_status(config_data, job_id):
+        return {'job_id': job_id, 'state': states[job_id]}
+
+    states = {'1': 'undefined', '2': 'running', '3': 'finished'}
+    in_flight = {'1': 'a.json', '2': 'b.json', '3': 'c.json'}
+    monkeypatch.setattr(
+        'mash_client.scheduler.get_job_status', get_job_status
+    )
+
+    # Queued jobs are reported as undefined and stay in flight
+    poll_in_flight({}, in_flight)
+    assert list(in_flight) == ['1', '2']
+
+
+@mark.fake_server(service_time=0.05)
+def test_submit_queue_cli(
+    tmp_path, fake_server, logged_in_config, config_dir, job_doc
+):
+    queue_dir = tmp_path / 'queue'
+    queue_dir.mkdir()
+    write_documents(
+        queue_dir,
+        job_doc,
+        {'a.json': 'image-2', 'b.json': 'image-1'}
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(
+        main,
+        [
+            '-C', config_dir, 'job', 'submit-queue', str(queue_dir),
+            '--cloud', 'gce', '--max-in-flight', '1',
+            '--poll-interval', '0.1', '--sort-by', 'image'
+        ]
+    )
+
+    assert result.exit_code == 0
+    lines = [json.loads(line) for line in result.output.splitlines()]
+    assert [line['document'] for line in lines] == ['b.json', 'a.json']
+    assert [line['in_flight'] for line in lines] == [1, 1]
+    assert {
+        job['cloud'] for job in fake_server.state.jobs.values()
+    } == {'gce'}
@@ -0,0 +1,155 @@
+import json
+import os
+
+from click.testing import CliRunner
+
+from mash_client.cli import main
+from mash_client.controller import login_with_pass
+from mash_client.fake_server import FakeMashServer
+from mash_client.spool import (
+    flush_spool,
+    get_spool_dir,
+    list_spool,
+    read_journal,
+    spool_job,
+    write_journal
+)
+
+
+def get_config_data(server, tmp_path):
+    return {
+        'url': server.url,
+        'verify': False,
+        'config_dir': str(tmp_path) + '/',
+        'profile': 'default'
+    }
+
+
+def invoke(server, tmp_path, args):
+    host, port = server.server_address[:2]
+    runner = CliRunner()
+    return runner.invoke(
+        main,
+        [
+            '-C', str(tmp_path) + '/', '--host', 'http://' + host,
+            '--port', str(port), '--no-color'
+        ] + args
+    )
+
+
+def test_spool_job(tmp_path, job_doc):
+    spool_dir = str(tmp_path / 'spool')
+
+    doc_id = spool_job(spool_dir, 'ec2', job_doc)
+    assert spool_job(spool_dir, 'ec2', dict(job_doc)) == doc_id
+    assert spool_job(spool_dir, 'gce', job_doc) != doc_id
+
+    entries = list_spool(spool_dir)
+    assert len(entries) == 2
+    assert entries[0]['id'] == doc_id
+    assert entries[0]['job_data'] == job_doc
+    assert [event['event'] for event in read_journal(spool_dir)] == [
+        'spooled', 'spooled'
+    ]
+
+
+def test_add_spool_and_flush(tmp_path, job_doc):
+    document = tmp_path / 'job.json'
+    document.write_text(json.dumps(job_doc))
+
+    with FakeMashServer() as server:
+        login_with_pass(
+            get_config_data(server, tmp_path),
+            'user1@fake.com',
+            'secret'
+        )
+
+    # Server is stopped, the document is spooled
+    result = invoke(
+        server, tmp_path, ['job', 'ec2', 'add', '--spool', str(document)]
+    )
+    assert result.exit_code == 0
+    assert 'was spooled' in result.output
+
+    result = invoke(server, tmp_path, ['spool', 'list'])
+    assert result.exit_code == 0
+    assert '"cloud": "ec2"' in result.output
+
+    # Without a server the document stays spooled
+    result = invoke(server, tmp_path, ['spool', 'flush', '--retries', '0'])
+    assert result.exit_code == 1
+    assert '"spooled": true' in result.output
+
+    with FakeMashServer() as server:
+        login_with_pass(
+            get_config_data(server, tmp_path),
+            'user1@fake.com',
+            'secret'
+        )
+        result = invoke(server, tmp_path, ['spool', 'flush'])
+        assert len(server.state.jobs) == 1
+
+        # Nothing left to submit
+        result2 = invoke(server, tmp_path, ['spool', 'flush'])
+
+    assert result.exit_code == 0
+    assert '"job_id"' in result.output
+    assert 'No spooled job documents.' in result2.output
+    assert list_spool(get_spool_dir(get_config_data(server, tmp_path))) == []
+
+
+def test_flush_spool(fake_server, logged_in_config, job_doc):
+    spool_dir = get_spool_dir(logged_in_config)
+
+    valid_id = spool_job(spool_dir, 'ec2', job_doc)
+    invalid_id = spool_job(spool_dir, 'ec2', {'image': 'test_image'})
+
+    # A document the journal shows as submitted is not sent again
+    submitted_id = spool_job(spool_dir, 'gce', job_doc)
+    write_journal(spool_dir, 'submitted', submitted_id, job_id='1')
+
+    results = flush_spool(logged_in_config, concurrency=2)
+    assert len(fake_server.state.jobs) == 1
+
+    results = {result['id']: result for result in results}
+    assert 'job_id' in results[valid_id]
+    assert 'error' in results[invalid_id]
+    assert results[submitted_id] == {'id': submitted_id, 'job_id': '1'}
+    assert list_spool(spool_dir) == []
+    assert os.path.exists(
+        os.path.join(spool_dir, 'failed', invalid_id + '.json')
+    )
+
+    # Only events of spooled documents are kept in the journal
+    assert read_journal(spool_dir) == []
+
+
+def test_flush_spool_spooled_again(fake_server, logged_in_config, job_doc):
+    spool_dir = get_spool_dir(logged_in_config)
+
+    doc_id = spool_job(spool_dir, 'ec2', job_doc)
+    first = flush_spool(logged_in_config)
+
+    # The same document spooled after the flush is submitted again
+    assert spool_job(spool_dir, 'ec2', job_doc) == doc_id
+    second = flush_spool(logged_in_config)
+
+    assert len(fake_server.state.jobs) == 2
+    assert first[0]['job_id'] != second[0]['job_id']
+    assert list_spool(spool_dir) == []
+
+
+def test_flush_spool_server_error(fake_server, logged_in_config, job_doc):
+    logged_in_config['breaker_threshold'] = 0
+    spool_dir = get_spool_dir(logged_in_config)
+    doc_id = spool_job(spool_dir, 'ec2', job_doc)
+
+    # Server errors are transient, the document stays spooled
+    fake_server.error_rate = 1.0
+    results = flush_spool(logged_in_config)
+
+    assert results == [
+        {'id': doc_id, 'error': 'Injected server error.', 'spooled': True}
+    ]
+    assert [entry['id'] for entry in list_spool(spool_dir)] == [doc_id]
+    assert not os.path.exists(os.path.join(spool_dir, 'failed'))
@@ -0,0 +1,140 @@
+import json
+import os
+import time
+
+from mash_client.cli import main
+from mash_client.controller import add_job, get_job_status
+from mash_client.timeline import (
+    build_timeline,
+    get_service_stats,
+    load_entry,
+    record_job_state
+)
+
+from click.testing import CliRunner
+from pytest import mark
+
+
+def test_build_timeline():
+    entry = {
+        'start_time': 95,
+        'last_service': 'publish',
+        'events': [
+            [100, 'running', 'obs'],
+            [130, 'running', 'upload'],
+            [150, 'running', 'test'],
+            [200, 'running', 'replicate'],
+            [260, 'finished', None]
+        ]
+    }
+
+    assert build_timeline(entry) == [
+        {'service': 'obs', 'start': 95, 'end': 130},
+        {'service': 'upload', 'start': 130, 'end': 150,
+         'includes': ['create']},
+        {'service': 'test', 'start': 150, 'end': 200},
+        {'service': 'replicate', 'start': 200, 'end': 260,
+         'includes': ['publish']}
+    ]
+
+    entry = {
+        'events': [
+            [100, 'running', 'upload'],
+            [120, 'failed', 'create'],
+        ]
+    }
+
+    assert build_timeline(entry) == [
+        {'service': 'upload', 'start': 100, 'end': 120, 'failed': True,
+         'includes': ['create']}
+    ]
+
+
+def test_record_job_state(tmp_path):
+    config_data = {
+        'url': 'https://mash.example.com',
+        'state_dir': str(tmp_path)
+    }
+    states = [
+        {'state': 'running', 'current_service': 'obs', 'cloud': 'ec2'},
+        {'state': 'running', 'current_service': 'obs', 'cloud': 'ec2'},
+        {'state': 'running', 'current_service': 'upload', 'cloud': 'ec2'},
+        {'state': 'running', 'current_service': 'create', 'cloud': 'ec2'}
+    ]
+
+    for job_id in ('job1', 'job2'):
+        for job in states:
+            record_job_state(config_data, job_id, job)
+            time.sleep(0.01)
+
+    timeline_dir = tmp_path / 'timeline_mash.example.com'
+    recorded = load_entry(str(timeline_dir / 'job1.jsonl'))
+
+    assert [event[2] for event in recorded['events']] == [
+        'obs', 'upload', 'create'
+    ]
+    assert recorded['cloud'] == 'ec2'
+
+    # Unchanged states are not written again
+    with open(str(timeline_dir / 'job1.jsonl')) as timeline_file:
+        assert len(timeline_file.readlines()) == 3
+
+    stats = get_service_stats(config_data)
+    assert list(stats) == ['ec2']
+    assert list(stats['ec2']) == ['obs', 'upload']
+    assert stats['ec2']['upload']['count'] == 2
+    assert get_service_stats(config_data, cloud='gce') == {}
+
+
+def test_prune_timelines(tmp_path):
+    config_data = {
+        'url': 'https://mash.example.com',
+        'state_dir': str(tmp_path)
+    }
+    job = {'state': 'running', 'current_service': 'obs'}
+    record_job_state(config_data, 'job1', job)
+
+    # Timelines of jobs not observed within the retention are removed
+    timeline_dir = tmp_path / 'timeline_mash.example.com'
+    old = time.time() - 31 * 86400
+    os.utime(str(timeline_dir / 'job1.jsonl'), (old, old))
+    os.utime(str(timeline_dir / '.pruned'), (old, old))
+    record_job_state(config_data, 'job2', job)
+
+    assert sorted(os.listdir(str(timeline_dir))) == [
+        '.pruned', 'job2.jsonl'
+    ]
+
+
+@mark.fake_server(service_time=0.2)
+def test_job_timeline(fake_server, logged_in_config, config_dir, job_doc):
+    job_id = add_job(logged_in_config, job_doc, 'gce')['job_id']
+
+    while get_job_status(logged_in_config, job_id)['state'] == 'running':
+        time.sleep(0.05)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        main,
+        ['-C', config_dir, 'job', 'timeline', '--job-id', job_id]
+    )
+    assert result.exit_code == 0
+
+    job_timeline = json.loads(result.output)
+    assert job_timeline['state'] == 'finished'
+    assert job_timeline['cloud'] == 'gce'
+    assert job_timeline['services'][0]['service'] == 'obs'
+    assert all(
+        segment['duration'] is not None
+        for segment in job_timeline['services']
+    )
+
+    result = runner.invoke(
+        main,
+        ['-C', config_dir, 'job', 'timeline', '--stats']
+    )
+    assert result.exit_code == 0
+    assert 'gce' in json.loads(result.output)
+
+    result = runner.invoke(main, ['-C', config_dir, 'job', 'timeline'])
+    assert result.exit_code == 1
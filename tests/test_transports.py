@@ -0,0 +1,90 @@
+import socket
+
+from unittest.mock import patch
+
+import requests
+from pytest import raises
+
+from mash_client.cli_utils import (
+    create_session,
+    get_session,
+    handle_request,
+    handle_stream_request_with_token
+)
+from mash_client.controller import iter_user_jobs
+from mash_client.mash_client_exceptions import MashClientException
+from mash_client.transports import Http2Session
+
+
+def get_unused_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def test_http2_session_request(fake_server):
+    config_data = {
+        'url': fake_server.url,
+        'verify': False,
+        'transport': 'http2'
+    }
+    session = get_session(config_data)
+    assert isinstance(session, Http2Session)
+    assert get_session(config_data) is session
+
+    result = handle_request(config_data, '/v1/jobs/ec2/', action='get')
+    assert 'cloud_account' in result['required']
+
+    with raises(MashClientException) as error:
+        handle_request(config_data, '/v1/jobs/unknown', action='get')
+
+    assert 'Token is invalid.' in str(error.value)
+    session.close()
+
+
+def test_http2_session_connection_error(tmp_path):
+    session = Http2Session(verify=False)
+    url = 'http://127.0.0.1:{port}/'.format(port=get_unused_port())
+
+    with raises(requests.ConnectionError):
+        session.get(url)
+
+    config_data = {
+        'url': url,
+        'verify': False,
+        'session': session,
+        'state_dir': str(tmp_path)
+    }
+    with raises(MashClientException) as error:
+        handle_request(config_data, 'v1/jobs/', action='get')
+
+    assert 'Failed to establish connection' in str(error.value)
+    session.close()
+
+
+@patch('mash_client.cli_utils.transport_warnings', set())
+@patch('mash_client.transports.httpx', None)
+def test_http2_session_fallback(capsys):
+    session = create_session({'verify': True, 'transport': 'http2'})
+    assert isinstance(session, requests.Session)
+    create_session({'verify': True, 'transport': 'http2'})
+
+    # The warning is printed once and kept out of the command output
+    output = capsys.readouterr()
+    assert output.out == ''
+    assert output.err.count('Falling back to the requests transport') == 1
+
+
+def test_http2_session_stream(fake_server, logged_in_config):
+    logged_in_config['transport'] = 'http2'
+    job_id = fake_server.state.add_job('ec2', {'image': 'test'})['job_id']
+
+    jobs = list(iter_user_jobs(logged_in_config))
+    assert [job['job_id'] for job in jobs] == [job_id]
+    assert isinstance(logged_in_config['session'], Http2Session)
+
+    with raises(MashClientException) as error:
+        handle_stream_request_with_token(logged_in_config, '/v1/jobs/1')
+
+    assert 'Job does not exist.' in str(error.value)
+    logged_in_config['session'].close()
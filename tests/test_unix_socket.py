@@ -0,0 +1,71 @@
+import json
+
+from mash_client.cli import main
+from mash_client.cli_utils import create_session, get_config
+from mash_client.controller import add_job, get_job_status, login_with_pass
+from mash_client.fake_server import FakeMashServer
+from mash_client.unix_socket import (
+    get_unix_socket_path,
+    get_unix_socket_url,
+    is_unix_socket_url
+)
+
+from click.testing import CliRunner
+
+
+def test_unix_socket_url():
+    url = get_unix_socket_url('/run/mash/api.sock')
+
+    assert url == 'http+unix://%2Frun%2Fmash%2Fapi.sock'
+    assert is_unix_socket_url(url)
+    assert not is_unix_socket_url('http://localhost')
+    assert get_unix_socket_path(url + '/v1/jobs/') == '/run/mash/api.sock'
+
+
+def test_get_config_unix_socket(tmp_path):
+    (tmp_path / 'default.yaml').write_text(
+        'host: unix:///run/mash/api.sock\nport: 5000\n'
+    )
+    config_data = get_config({
+        'config_dir': str(tmp_path) + '/',
+        'profile': None
+    })
+
+    assert config_data['url'] == 'http+unix://%2Frun%2Fmash%2Fapi.sock'
+
+
+def test_unix_socket_requests(tmp_path, job_doc):
+    config_dir = str(tmp_path) + '/'
+    socket_path = str(tmp_path / 'api.sock')
+
+    with FakeMashServer(unix_socket=socket_path) as server:
+        (tmp_path / 'default.yaml').write_text(
+            'host: unix://{0}\n'.format(socket_path)
+        )
+        config_data = {
+            'url': server.url,
+            'verify': True,
+            'config_dir': config_dir,
+            'profile': 'default'
+        }
+        login_with_pass(config_data, 'user1@fake.com', 'secret')
+
+        # Requests of a session share a connection to the socket
+        config_data['session'] = create_session(config_data)
+        job_id = add_job(config_data, job_doc, 'ec2')['job_id']
+        assert get_job_status(config_data, job_id)['state'] == 'running'
+
+        runner = CliRunner()
+        result = runner.invoke(main, ['-C', config_dir, 'job', 'list'])
+        assert result.exit_code == 0
+        assert json.loads(result.output)[0]['job_id'] == job_id
+
+        result = runner.invoke(main, ['-C', config_dir, 'doctor', '--json'])
+        assert result.exit_code == 0
+
+        checks = {check['check']: check for check in json.loads(result.output)}
+        assert 'dns' not in checks
+        assert checks['connect']['status'] == 'ok'
+        assert checks['auth']['status'] == 'ok'
+
+    assert not (tmp_path / 'api.sock').exists()